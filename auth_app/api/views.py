@@ -1,9 +1,12 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import Throttled
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework.authtoken.models import Token
+from auth_app.hashing import PoolSaturated, hashing_pool
+from core.routers import stick_to_primary
 from profile_app.models import CustomerProfile, BusinessProfile
 from .serializers import RegistrationSerializer
 
@@ -11,7 +14,7 @@ from .serializers import RegistrationSerializer
 class RegistrationView(APIView):
     """
     API endpoint for registering a new user. Creates a Django User, associated profile,
-    and authentication token.
+    and authentication token. Returns 429 while the password hashing pool is saturated.
     """
     def post(self, request):
         """
@@ -37,8 +40,17 @@ class RegistrationView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Create the new Django user
-        user = User.objects.create_user(username=username, email=email, password=password)
+        # Hash in the pool (429 when saturated), then create the new Django user
+        try:
+            encoded = hashing_pool.make_password(password)
+        except PoolSaturated as exc:
+            raise Throttled(wait=exc.retry_after)
+        user = User(
+            username=User.normalize_username(username),
+            email=User.objects.normalize_email(email),
+            password=encoded,
+        )
+        user.save()
 
         # Create corresponding profile based on user_type
         if user_type == "customer":
@@ -48,6 +60,8 @@ class RegistrationView(APIView):
 
         # Generate or retrieve authentication token
         token, _ = Token.objects.get_or_create(user=user)
+        # The new user's first reads must not hit a replica that lacks them
+        stick_to_primary(token.key)
 
         return Response({
             "token": token.key,
@@ -60,7 +74,7 @@ class RegistrationView(APIView):
 class LoginView(APIView):
     """
     API endpoint for user login. Authenticates credentials or provisions guest accounts,
-    then returns an authentication token.
+    then returns an authentication token. Returns 429 while the password hashing pool is saturated.
     """
     def post(self, request):
         """
@@ -76,9 +90,14 @@ class LoginView(APIView):
         if not username or not password:
             return Response({'error': 'Username and password required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        user = authenticate(username=username, password=password)
+        # PooledModelBackend hashes in the pool (429 when saturated)
+        try:
+            user = authenticate(request, username=username, password=password)
+        except PoolSaturated as exc:
+            raise Throttled(wait=exc.retry_after)
         if user is not None:
             token, _ = Token.objects.get_or_create(user=user)
+            stick_to_primary(token.key)
             return Response({
                 'token': token.key,
                 'username': user.username,
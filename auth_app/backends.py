@@ -0,0 +1,41 @@
+"""
+Module auth_app.backends
+
+ModelBackend hashing in the password hashing pool (see auth_app.hashing).
+
+Behaves like ModelBackend: unknown usernames still cost one hash so response
+times do not reveal which usernames exist, inactive users are rejected and
+outdated stored hashes are upgraded. Going through authenticate() keeps
+AUTHENTICATION_BACKENDS and the user_login_failed signal working.
+
+authenticate() raises PoolSaturated when the pool is saturated; callers turn
+it into an HTTP 429.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from auth_app.hashing import hashing_pool
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            hashing_pool.make_password(password)
+            return None
+
+        valid, upgraded = hashing_pool.verify(password, user.password)
+        if not valid or not self.user_can_authenticate(user):
+            return None
+        if upgraded:
+            user.password = upgraded
+            user.save(update_fields=['password'])
+        return user
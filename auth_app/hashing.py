@@ -0,0 +1,174 @@
+"""
+Module auth_app.hashing
+
+Runs password hashing for login and registration in a bounded process pool.
+
+PBKDF2 costs a few hundred milliseconds of CPU per call. Running it in
+separate processes keeps it off the request workers' CPU time (and outside
+the GIL), and the pending-job limit turns a login storm into fast
+PoolSaturated errors (HTTP 429) instead of a growing backlog that starves
+every other endpoint.
+
+The calling thread waits for the result (up to TIMEOUT): the DRF views are
+synchronous, so the pool bounds hashing CPU and sheds excess load, but does
+not free the request thread while a hash is computed.
+
+Configuration (settings.PASSWORD_HASHING_POOL):
+    WORKERS:     Hashing processes; 0 hashes inline in the calling thread.
+    MAX_PENDING: Jobs allowed to run or wait at once; more are rejected.
+    TIMEOUT:     Seconds to wait for a result before giving up.
+    RETRY_AFTER: Seconds clients are told to wait when rejected.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+
+DEFAULTS = {
+    'WORKERS': max(1, (os.cpu_count() or 2) // 2),
+    'MAX_PENDING': 16,
+    'TIMEOUT': 10,
+    'RETRY_AFTER': 1,
+}
+
+
+class PoolSaturated(Exception):
+    """
+    Raised when the pool cannot take (or finish) another job in time.
+    """
+
+    def __init__(self, retry_after):
+        super().__init__(f"Password hashing pool saturated, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, 'PASSWORD_HASHING_POOL', {})}
+
+
+# --- Jobs (run in the worker processes) ---
+
+def _init_worker(settings_module):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    django.setup()
+
+
+def _hash(password):
+    return make_password(password)
+
+
+def _verify(password, encoded):
+    """
+    Check a password and rehash it if the stored hash is outdated.
+
+    Returns:
+        tuple: (valid, new_encoded or None).
+    """
+    if not check_password(password, encoded):
+        return False, None
+    preferred = get_hasher('default')
+    hasher = identify_hasher(encoded)
+    if hasher.algorithm != preferred.algorithm or preferred.must_update(encoded):
+        return True, make_password(password)
+    return True, None
+
+
+class HashingPool:
+    """
+    Lazily started process pool with a limit on pending jobs.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._workers = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def _get_executor(self, workers):
+        with self._lock:
+            if self._executor is None or self._workers != workers:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                # spawn: never fork a process with open connections and threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'core.settings'),),
+                )
+                self._workers = workers
+            return self._executor
+
+    def _acquire(self, config):
+        with self._lock:
+            if self._pending >= config['MAX_PENDING']:
+                raise PoolSaturated(config['RETRY_AFTER'])
+            self._pending += 1
+
+    def _release(self, *args):
+        with self._lock:
+            self._pending -= 1
+
+    def run(self, func, *args):
+        """
+        Run func(*args) in the pool and return its result.
+
+        Raises:
+            PoolSaturated: If MAX_PENDING jobs are already pending, or the
+                result is not ready within TIMEOUT.
+        """
+        config = get_config()
+        self._acquire(config)
+        if not config['WORKERS']:
+            try:
+                return func(*args)
+            finally:
+                self._release()
+
+        try:
+            future = self._get_executor(config['WORKERS']).submit(func, *args)
+        except Exception:
+            self._release()
+            raise
+        # The slot stays taken until the job really finished, even after a timeout
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=config['TIMEOUT'])
+        except TimeoutError:
+            raise PoolSaturated(config['RETRY_AFTER'])
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool on the next call
+            with self._lock:
+                self._executor = None
+            raise
+
+    def make_password(self, password):
+        """
+        Hash a password for storing in User.password.
+        """
+        return self.run(_hash, password)
+
+    def verify(self, password, encoded):
+        """
+        Check a password against a stored hash.
+
+        Returns:
+            tuple: (valid, new_encoded), new_encoded being set when the
+            stored hash should be upgraded.
+        """
+        return self.run(_verify, password, encoded)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hashing_pool = HashingPool()
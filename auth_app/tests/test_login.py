@@ -2,6 +2,8 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_login_failed
+from django.test import override_settings
 
 
 class LoginTests(APITestCase):
@@ -20,3 +22,30 @@ class LoginTests(APITestCase):
     def test_login_bad_credentials(self):
         response = self.client.post(self.url, {"username": "tester", "password": "wrong"})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(PASSWORD_HASHING_POOL={'WORKERS': 0, 'MAX_PENDING': 0, 'RETRY_AFTER': 3})
+    def test_login_saturated_pool(self):
+        # Keine freien Hashing-Slots: sofort 429 mit Retry-After statt Warteschlange
+        payload = {"username": "tester", "password": "pass123"}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '3')
+
+    def test_login_inactive_user(self):
+        self.user.is_active = False
+        self.user.save()
+        payload = {"username": "tester", "password": "pass123"}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_failed_login_sends_signal(self):
+        # Anmeldung läuft über authenticate(): user_login_failed wird ausgelöst
+        received = []
+
+        def handler(sender, credentials, **kwargs):
+            received.append(credentials['username'])
+
+        user_login_failed.connect(handler)
+        self.addCleanup(user_login_failed.disconnect, handler)
+        self.client.post(self.url, {"username": "tester", "password": "wrong"}, format='json')
+        self.assertEqual(received, ['tester'])
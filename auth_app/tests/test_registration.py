@@ -1,6 +1,8 @@
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from django.test import override_settings
 
 
 class RegistrationTests(APITestCase):
@@ -30,3 +32,17 @@ class RegistrationTests(APITestCase):
         }
         response = self.client.post(self.url, payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(PASSWORD_HASHING_POOL={'WORKERS': 0, 'MAX_PENDING': 0})
+    def test_registration_saturated_pool(self):
+        payload = {
+            "username": "user3",
+            "email": "user3@example.com",
+            "password": "secret123",
+            "repeated_password": "secret123",
+            "type": "customer"
+        }
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        # Kein Benutzer angelegt
+        self.assertFalse(User.objects.filter(username='user3').exists())
@@ -0,0 +1,62 @@
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from core.authentication import TokenCache, token_cache
+from profile_app.models import BusinessProfile
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=self.user, username='biz')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('order-count', args=[self.user.id])
+
+    def test_second_request_skips_token_lookup(self):
+        # Erste Anfrage: Token-Lookup + Zählerabfrage, danach nur noch die Zählerabfrage
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_logout_and_rotation_invalidate(self):
+        self.client.get(self.url)
+        self.token.delete()
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivation_invalidates(self):
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_reloads_user(self):
+        self.client.get(self.url)
+        self.user.set_password('neu')
+        self.user.save()
+        # Cache wurde verworfen: der Token wird erneut aufgelöst
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    @override_settings(
+        CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'coderr'},
+            'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'shared'},
+        },
+        TOKEN_AUTH_CACHE={'MAX_ENTRIES': 100, 'TIMEOUT': 60, 'ALIAS': 'shared'},
+    )
+    def test_invalidation_reaches_other_process(self):
+        # Zwei Worker-Prozesse: jeder mit eigenem TokenCache, gemeinsamer Cache
+        worker, other_worker = TokenCache(), TokenCache()
+        worker.set(self.token.key, self.token, self.user)
+        self.assertIsNotNone(worker.get(self.token.key))
+        other_worker.invalidate_user(self.user.pk)
+        self.assertIsNone(worker.get(self.token.key))
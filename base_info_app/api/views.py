@@ -1,10 +1,7 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Avg
-from reviews_app.models import Review
-from profile_app.models import BusinessProfile
-from offers_app.models import Offer
+from base_info_app.stats import get_site_stats
 
 
 class BaseInfoView(APIView):
@@ -15,6 +12,9 @@ class BaseInfoView(APIView):
     - Reviews
     - Business profiles
     - Offers
+
+    Values come from the maintained SiteStats row through a
+    stale-while-revalidate cache (see base_info_app.stats).
     """
     permission_classes = []  # Allow unrestricted access
 
@@ -28,29 +28,14 @@ class BaseInfoView(APIView):
             - business_profile_count: Total number of business profiles.
             - offer_count: Total number of offers.
 
+        Adds an X-Cache header (HIT, STALE or MISS).
         On error, returns HTTP 500 with error detail.
         """
         try:
-            # Total number of reviews
-            review_count = Review.objects.count()
-
-            # Calculate average rating, defaulting to 0.0 if no reviews
-            average_rating = Review.objects.aggregate(avg_rating=Avg('rating'))['avg_rating'] or 0.0
-            average_rating = round(average_rating, 1)
-
-            # Total number of business profiles
-            business_profile_count = BusinessProfile.objects.count()
-
-            # Total number of offers
-            offer_count = Offer.objects.count()
-
-            # Build and return response data
-            return Response({
-                "review_count": review_count,
-                "average_rating": average_rating,
-                "business_profile_count": business_profile_count,
-                "offer_count": offer_count
-            }, status=status.HTTP_200_OK)
+            data, cache_state = get_site_stats()
+            response = Response(data, status=status.HTTP_200_OK)
+            response['X-Cache'] = cache_state
+            return response
 
         except Exception:
             # Catch-all for unexpected errors
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BaseInfoAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'base_info_app'
+
+    def ready(self):
+        # Register signal handlers maintaining the site statistics
+        from base_info_app import signals  # noqa: F401
@@ -0,0 +1,29 @@
+"""
+Management command to recompute the site statistics exactly.
+
+Usage:
+    python manage.py recompute_site_stats
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from base_info_app.models import SiteStats
+from base_info_app.stats import invalidate_site_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute review, rating, business profile and offer statistics from the source tables."
+
+    def handle(self, *args, **options):
+        """
+        Aggregate the source tables, store the result and drop the cached copy.
+        """
+        with transaction.atomic():
+            previous = SiteStats.objects.filter(pk=SiteStats.SINGLETON_ID).first()
+            stats = SiteStats.recompute()
+            invalidate_site_stats()
+
+        if previous is not None and previous.as_dict() != stats.as_dict():
+            self.stdout.write(f"Drift corrected: {previous.as_dict()} -> {stats.as_dict()}")
+        self.stdout.write(self.style.SUCCESS(f"Site stats: {stats.as_dict()}"))
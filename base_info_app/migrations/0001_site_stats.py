@@ -0,0 +1,44 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:42
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def compute_site_stats(apps, schema_editor):
+    SiteStats = apps.get_model('base_info_app', 'SiteStats')
+    Review = apps.get_model('reviews_app', 'Review')
+    BusinessProfile = apps.get_model('profile_app', 'BusinessProfile')
+    Offer = apps.get_model('offers_app', 'Offer')
+    reviews = Review.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+    SiteStats.objects.update_or_create(pk=1, defaults={
+        'review_count': reviews['review_count'],
+        'rating_sum': reviews['rating_sum'] or 0,
+        'business_profile_count': BusinessProfile.objects.count(),
+        'offer_count': Offer.objects.count(),
+    })
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('offers_app', '0005_offer_indexes'),
+        ('profile_app', '0003_profile_updated_at'),
+        ('reviews_app', '0002_review_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.BigIntegerField(default=0)),
+                ('business_profile_count', models.PositiveIntegerField(default=0)),
+                ('offer_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(compute_site_stats, reverse_code=migrations.RunPython.noop),
+    ]
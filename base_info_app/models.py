@@ -1,3 +1,110 @@
+"""
+Module base_info_app.models
+
+Defines the SiteStats model holding the site-wide statistics served by
+BaseInfoView, maintained incrementally instead of aggregated per request.
+"""
+
 from django.db import models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Greatest
+
+
+class SiteStats(models.Model):
+    """
+    Single-row table of site-wide counters.
+
+    Kept in sync by the signal handlers in base_info_app.signals; rebuild
+    exactly with the recompute_site_stats management command.
+
+    Attributes:
+        review_count (int): Total number of reviews.
+        rating_sum (int): Sum of all review ratings (for the average).
+        business_profile_count (int): Total number of business profiles.
+        offer_count (int): Total number of offers.
+        updated_at (datetime): Time of the last change.
+    """
+    SINGLETON_ID = 1
+
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.BigIntegerField(default=0)
+    business_profile_count = models.PositiveIntegerField(default=0)
+    offer_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return (
+            f"Site stats ({self.review_count} reviews, "
+            f"{self.business_profile_count} businesses, {self.offer_count} offers)"
+        )
+
+    @property
+    def average_rating(self):
+        """
+        Average review rating rounded to one decimal place (0.0 without reviews).
+        """
+        if not self.review_count:
+            return 0.0
+        return round(self.rating_sum / self.review_count, 1)
+
+    def as_dict(self):
+        return {
+            "review_count": self.review_count,
+            "average_rating": self.average_rating,
+            "business_profile_count": self.business_profile_count,
+            "offer_count": self.offer_count,
+        }
+
+    @classmethod
+    def load(cls):
+        """
+        Return the stats row, creating it with exact values if missing.
+        """
+        stats = cls.objects.filter(pk=cls.SINGLETON_ID).first()
+        return stats if stats is not None else cls.recompute()
+
+    @classmethod
+    def adjust(cls, **deltas):
+        """
+        Apply counter deltas in a single UPDATE, e.g. adjust(review_count=1, rating_sum=4).
+
+        Creates the row with exact values first if it does not exist yet.
+        """
+        updates = {
+            field: Greatest(F(field) + delta, 0)
+            for field, delta in deltas.items()
+            if delta
+        }
+        if not updates:
+            return
+        if not cls.objects.filter(pk=cls.SINGLETON_ID).update(**updates):
+            # recompute() already includes the row being written
+            cls.recompute()
+
+    @classmethod
+    def compute(cls):
+        """
+        Aggregate the exact statistics from the source tables.
+
+        Returns:
+            dict: Values for every counter field.
+        """
+        from offers_app.models import Offer
+        from profile_app.models import BusinessProfile
+        from reviews_app.models import Review
+
+        reviews = Review.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+        return {
+            'review_count': reviews['review_count'],
+            'rating_sum': reviews['rating_sum'] or 0,
+            'business_profile_count': BusinessProfile.objects.count(),
+            'offer_count': Offer.objects.count(),
+        }
 
-# Create your models here.
+    @classmethod
+    def recompute(cls):
+        """
+        Store the exact statistics and return the row.
+        """
+        stats, _ = cls.objects.update_or_create(pk=cls.SINGLETON_ID, defaults=cls.compute())
+        return stats
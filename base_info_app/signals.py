@@ -0,0 +1,57 @@
+"""
+Module base_info_app.signals
+
+Keeps SiteStats in sync with Review, BusinessProfile and Offer writes that
+go through save() and delete(), and drops the cached statistics afterwards.
+Handlers run inside the transaction of the triggering write.
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from base_info_app.models import SiteStats
+from base_info_app.stats import invalidate_site_stats
+from offers_app.models import Offer
+from profile_app.models import BusinessProfile
+from reviews_app.models import Review
+
+
+@receiver(post_init, sender=Review)
+def remember_review_rating(sender, instance, **kwargs):
+    """
+    Remember the loaded rating to apply only the difference on save.
+    """
+    instance._counted_rating = instance.rating
+
+
+@receiver(post_save, sender=Review)
+def count_saved_review(sender, instance, created, **kwargs):
+    if created:
+        SiteStats.adjust(review_count=1, rating_sum=instance.rating)
+    else:
+        SiteStats.adjust(rating_sum=instance.rating - instance._counted_rating)
+    instance._counted_rating = instance.rating
+    invalidate_site_stats()
+
+
+@receiver(post_delete, sender=Review)
+def uncount_deleted_review(sender, instance, **kwargs):
+    SiteStats.adjust(review_count=-1, rating_sum=-instance._counted_rating)
+    invalidate_site_stats()
+
+
+@receiver(post_save, sender=BusinessProfile)
+@receiver(post_save, sender=Offer)
+def count_created_row(sender, instance, created, **kwargs):
+    if created:
+        field = 'offer_count' if sender is Offer else 'business_profile_count'
+        SiteStats.adjust(**{field: 1})
+        invalidate_site_stats()
+
+
+@receiver(post_delete, sender=BusinessProfile)
+@receiver(post_delete, sender=Offer)
+def uncount_deleted_row(sender, instance, **kwargs):
+    field = 'offer_count' if sender is Offer else 'business_profile_count'
+    SiteStats.adjust(**{field: -1})
+    invalidate_site_stats()
@@ -0,0 +1,101 @@
+"""
+Module base_info_app.stats
+
+Serves the site statistics from Django's cache with stale-while-revalidate.
+
+An entry is fresh for FRESH seconds. Afterwards it is still served, for up
+to STALE more seconds, while one background thread reloads it from the
+SiteStats row. Only a missing or fully expired entry is loaded inline.
+Writes to the counted models drop the entry (see base_info_app.signals).
+Loading the row is a primary-key lookup, never an aggregate.
+
+Configuration (settings.SITE_STATS_CACHE):
+    ALIAS: Name of the Django cache to use (default 'default').
+    FRESH: Seconds an entry is served without revalidation.
+    STALE: Further seconds a stale entry is served while revalidating.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+
+from base_info_app.models import SiteStats
+from core.routers import primary_reads
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ALIAS': 'default',
+    'FRESH': 30,
+    'STALE': 300,
+}
+
+CACHE_KEY = 'sitestats:data'
+REFRESH_LOCK_KEY = 'sitestats:refreshing'
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, 'SITE_STATS_CACHE', {})}
+
+
+def _cache(config):
+    return caches[config['ALIAS']]
+
+
+def _store(config, data):
+    # Data read inside a transaction may still be rolled back
+    if connection.in_atomic_block:
+        return
+    entry = {'data': data, 'fresh_until': time.time() + config['FRESH']}
+    _cache(config).set(CACHE_KEY, entry, config['FRESH'] + config['STALE'])
+
+
+def _refresh(config):
+    try:
+        _store(config, SiteStats.load().as_dict())
+    except Exception:
+        logger.exception("Refreshing the site stats failed")
+    finally:
+        _cache(config).delete(REFRESH_LOCK_KEY)
+        connection.close()
+
+
+def get_site_stats():
+    """
+    Return the site statistics as served by /api/base-info/.
+
+    Returns:
+        tuple: (data dict, cache state 'HIT', 'STALE' or 'MISS').
+    """
+    config = get_config()
+    cache = _cache(config)
+    entry = cache.get(CACHE_KEY)
+    if entry is not None:
+        if entry['fresh_until'] > time.time():
+            return entry['data'], 'HIT'
+        # Only one revalidation at a time across processes sharing the cache
+        if cache.add(REFRESH_LOCK_KEY, 1, config['STALE'] or None):
+            threading.Thread(
+                target=_refresh, args=(config,), name='site-stats-refresh', daemon=True
+            ).start()
+        return entry['data'], 'STALE'
+
+    # The entry is served to everyone: load it from the primary, not a replica
+    with primary_reads():
+        data = SiteStats.load().as_dict()
+    _store(config, data)
+    return data, 'MISS'
+
+
+def invalidate_site_stats():
+    """
+    Drop the cached statistics now and again after the current transaction
+    commits, so the next request reloads the updated row.
+    """
+    config = get_config()
+    _cache(config).delete(CACHE_KEY)
+    transaction.on_commit(lambda: _cache(config).delete(CACHE_KEY))
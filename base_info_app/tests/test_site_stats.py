@@ -0,0 +1,85 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from base_info_app.models import SiteStats
+from offers_app.models import Offer
+from profile_app.models import BusinessProfile
+from reviews_app.models import Review
+
+User = get_user_model()
+
+
+class SiteStatsCounterTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='biz', password='pw')
+        self.profile = BusinessProfile.objects.create(user=self.user, username='biz')
+
+    def assertExact(self):
+        # Gepflegte Zähler müssen der exakten Aggregation entsprechen
+        stats = SiteStats.objects.get(pk=SiteStats.SINGLETON_ID)
+        self.assertEqual(
+            {field: getattr(stats, field) for field in SiteStats.compute()},
+            SiteStats.compute()
+        )
+
+    def test_counters_follow_writes(self):
+        review = Review.objects.create(rating=5)
+        Review.objects.create(rating=2)
+        offer = Offer.objects.create(user=self.user, title='O')
+        self.assertExact()
+
+        review.rating = 3
+        review.save()
+        self.assertExact()
+        self.assertEqual(SiteStats.load().average_rating, 2.5)
+
+        review.delete()
+        offer.delete()
+        self.profile.delete()
+        self.assertExact()
+
+    def test_endpoint_runs_no_aggregates(self):
+        Review.objects.create(rating=4)
+        # Nur das Lesen der Statistik-Zeile per Primärschlüssel
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('base-info'))
+        self.assertEqual(response.data['review_count'], SiteStats.compute()['review_count'])
+
+    def test_recompute_command_fixes_drift(self):
+        Review.objects.create(rating=4)
+        SiteStats.objects.update(review_count=99, offer_count=7)
+        call_command('recompute_site_stats', stdout=StringIO())
+        self.assertExact()
+
+
+class SiteStatsCacheTests(APITransactionTestCase):
+    # Ohne umschließende Transaktion, damit die Statistik gecacht wird
+
+    def setUp(self):
+        caches['default'].clear()
+        SiteStats.recompute()
+        self.url = reverse('base-info')
+
+    def test_hit_without_queries_and_write_invalidates(self):
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+        Review.objects.create(rating=5)
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['review_count'], 1)
+
+    @override_settings(SITE_STATS_CACHE={'FRESH': 0, 'STALE': 60})
+    def test_stale_entry_served_while_revalidating(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'STALE')
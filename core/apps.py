@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        # Register signal handlers invalidating the token authentication cache
+        from core import signals  # noqa: F401
+        # Register the replica routing system check
+        from core import routers  # noqa: F401
+        # Time serializer.data for the request metrics
+        from core.metrics import install_serializer_timing
+        install_serializer_timing()
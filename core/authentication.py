@@ -0,0 +1,166 @@
+"""
+Module core.authentication
+
+Drop-in replacement for DRF's TokenAuthentication that caches the
+token → user resolution, so authenticated requests skip the Token/User
+join.
+
+Resolved tokens are kept either in a bounded, TTL-based in-process LRU or,
+with ALIAS set, only in one of Django's caches shared between processes.
+Entries are invalidated (see core.signals) when a token is deleted or
+replaced (logout, rotation) and when its user is saved or logged out, which
+covers deactivation and password changes.
+
+An invalidation only reaches the current process's LRU, so with several
+worker processes set ALIAS: the LRU is then bypassed and a revoked token is
+rejected by every worker on its next request.
+
+Configuration (settings.TOKEN_AUTH_CACHE):
+    MAX_ENTRIES: Size of the in-process LRU; 0 disables it. Unused with ALIAS.
+    TIMEOUT:     Entry lifetime in seconds; 0 disables caching altogether.
+    ALIAS:       Name of a Django cache to share entries through (default None).
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from core.routers import primary_reads
+
+DEFAULTS = {
+    'MAX_ENTRIES': 10000,
+    'TIMEOUT': 60,
+    'ALIAS': None,
+}
+
+
+class TokenCache:
+    """
+    Cache of resolved tokens: (token, user) pairs by token key, in the
+    shared cache if configured and in the in-process LRU otherwise.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def config(self):
+        return {**DEFAULTS, **getattr(settings, 'TOKEN_AUTH_CACHE', {})}
+
+    @property
+    def shared(self):
+        alias = self.config['ALIAS']
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def shared_key(key):
+        return f'authtoken:{key}'
+
+    def get(self, key):
+        """
+        Return a copy of the cached (token, user) pair, or None.
+
+        Copies keep one request's changes to request.user from leaking into
+        other requests sharing the entry.
+        """
+        if not self.config['TIMEOUT']:
+            return None
+
+        shared = self.shared
+        if shared is not None:
+            pair = shared.get(self.shared_key(key))
+            return self._copy(pair) if pair is not None else None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, pair = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return self._copy(pair)
+                del self._entries[key]
+        return None
+
+    def set(self, key, token, user):
+        config = self.config
+        if not config['TIMEOUT']:
+            return
+        pair = (token, user)
+        shared = self.shared
+        if shared is not None:
+            shared.set(self.shared_key(key), pair, config['TIMEOUT'])
+        else:
+            self._store_local(key, pair, config)
+
+    def invalidate(self, *keys):
+        """
+        Drop the given token keys from the LRU and the shared cache.
+        """
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+        shared = self.shared
+        if shared is not None and keys:
+            shared.delete_many([self.shared_key(key) for key in keys])
+
+    def invalidate_user(self, user_id):
+        """
+        Drop every cached token of a user.
+        """
+        with self._lock:
+            local = [key for key, (_, (token, _)) in self._entries.items()
+                     if token.user_id == user_id]
+        keys = set(local) | set(Token.objects.filter(user_id=user_id).values_list('key', flat=True))
+        self.invalidate(*keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _store_local(self, key, pair, config):
+        if not config['MAX_ENTRIES']:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + config['TIMEOUT'], pair)
+            self._entries.move_to_end(key)
+            while len(self._entries) > config['MAX_ENTRIES']:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _copy(pair):
+        token, user = pair
+        token, user = copy.copy(token), copy.copy(user)
+        token.user = user
+        return token, user
+
+
+token_cache = TokenCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication resolving tokens through token_cache.
+
+    Behaves like TokenAuthentication (same header, same errors); inactive
+    users and unknown tokens are never cached. Lookups always read from the
+    primary database.
+    """
+
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is not None:
+            token, user = cached
+            return user, token
+
+        # From the primary: replicas may not have new tokens or revocations yet
+        with primary_reads():
+            user, token = super().authenticate_credentials(key)
+        token_cache.set(key, token, user)
+        return user, token
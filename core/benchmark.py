@@ -0,0 +1,309 @@
+"""
+Module core.benchmark
+
+Endpoint benchmark suite: calls every API route of core/urls.py through the
+Django test client (token-authenticated, like a real client) and reports
+latency percentiles and SQL query counts per endpoint.
+
+Each entry of ENDPOINTS builds one request per iteration from the fixtures
+picked out of the database (see Fixtures); rows an iteration consumes (an
+offer to delete, a fresh customer to review with) are created by the builder
+before the clock starts. Queries are counted on every database connection.
+
+run_benchmark() itself neither commits nor rolls back; the benchmark_api
+command decides where it runs:
+
+- By default on a seeded scratch test database where every request commits,
+  so on_commit work such as bumping the offer response cache generation
+  happens as in production and the X-Cache counts include hits.
+- With --no-seed on the existing database inside one transaction that is
+  rolled back at the end; on_commit work never runs there, so cacheable
+  endpoints are measured on the cache-miss path only.
+"""
+
+import secrets
+import statistics
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.models import Count
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from core.metrics import RequestMetrics
+from offers_app.models import Offer
+from orders_app.models import Order
+from profile_app.models import BusinessProfile, CustomerProfile
+from reviews_app.models import Review
+
+BENCHMARK_PASSWORD = 'benchmark-password'
+BATCH_BUSINESS_USERS = 50
+BULK_OFFERS = 10
+
+
+class Call:
+    """
+    One request to send: the user it is sent as, method, URL and body.
+    """
+
+    def __init__(self, user, method, url, data=None):
+        self.user = user
+        self.method = method
+        self.url = url
+        self.data = data
+
+
+class Fixtures:
+    """
+    Existing rows the endpoints are called with, plus benchmark-only users.
+
+    Picks the business user with most orders, one of its orders, offers and
+    reviews, and the customer of that order.
+    """
+
+    def __init__(self):
+        busiest = (
+            Order.objects.filter(business_user__in=Offer.objects.values('user'))
+            .values('business_user').annotate(n=Count('id')).order_by('-n').first()
+        )
+        if busiest is None:
+            raise LookupError("No orders on offers found; seed the database first (seed_marketplace).")
+        self.business = User.objects.get(pk=busiest['business_user'])
+        self.order = Order.objects.filter(business_user=self.business).order_by('-created_at').first()
+        self.customer = self.order.customer_user
+        self.offer = Offer.objects.filter(user=self.business).order_by('-updated_at').first()
+        self.detail = self.offer.details.order_by('id').first()
+        self.review = Review.objects.filter(business_user=self.business).order_by('-updated_at').first()
+        if self.review is None:
+            self.review = Review.objects.create(
+                business_user=self.business, reviewer=self.customer, rating=5, description='Benchmark'
+            )
+        self.business_ids = list(
+            BusinessProfile.objects.order_by('user_id').values_list('user_id', flat=True)[:BATCH_BUSINESS_USERS]
+        )
+
+        self.prefix = f'bench{secrets.token_hex(3)}'
+        self.staff = User.objects.create_user(username=f'{self.prefix}_staff', is_staff=True)
+        self.login_user = User.objects.create_user(
+            username=f'{self.prefix}_login', password=BENCHMARK_PASSWORD
+        )
+        CustomerProfile.objects.create(user=self.login_user, username=self.login_user.username)
+
+    def new_customer(self, i):
+        """
+        Create a customer who has not reviewed anyone yet.
+        """
+        user = User.objects.create_user(username=f'{self.prefix}_customer_{i}')
+        CustomerProfile.objects.create(user=user, username=user.username)
+        return user
+
+
+def _offer_payload(i, title='Benchmark offer'):
+    return {
+        'title': f'{title} {i}',
+        'description': 'Synthetic offer created by the benchmark suite.',
+        'details': [
+            {'title': offer_type.title(), 'revisions': revisions, 'delivery_time_in_days': days,
+             'price': price, 'features': ['a', 'b'], 'offer_type': offer_type}
+            for offer_type, revisions, days, price in (
+                ('basic', 1, 7, 50), ('standard', 3, 5, 250), ('premium', -1, 3, 900)
+            )
+        ],
+    }
+
+
+def _offer_to_delete(f, i):
+    offer = Offer.objects.create(user=f.business, title=f'Delete me {i}', description='D')
+    return Call(f.business, 'DELETE', reverse('offer-detail', args=[offer.pk]))
+
+
+def _order_to_delete(f, i):
+    order = Order.objects.create(
+        customer_user=f.customer, business_user=f.business, title='Delete me', revisions=1,
+        delivery_time_in_days=1, price=10, offer_type='basic', status='in_progress',
+    )
+    return Call(f.staff, 'DELETE', reverse('order-detail', args=[order.pk]))
+
+
+def _review_to_delete(f, i):
+    reviewer = f.new_customer(f'del{i}')
+    review = Review.objects.create(business_user=f.business, reviewer=reviewer, rating=3, description='D')
+    return Call(reviewer, 'DELETE', reverse('review-detail', args=[review.pk]))
+
+
+# Benchmark name → (URL name, call factory taking fixtures and iteration).
+ENDPOINTS = {
+    'registration POST': ('registration', lambda f, i: Call(None, 'POST', reverse('registration'), {
+        'username': f'{f.prefix}_reg_{i}', 'email': f'{f.prefix}_reg_{i}@example.com',
+        'password': BENCHMARK_PASSWORD, 'repeated_password': BENCHMARK_PASSWORD, 'type': 'customer',
+    })),
+    'login POST': ('login', lambda f, i: Call(None, 'POST', reverse('login'), {
+        'username': f.login_user.username, 'password': BENCHMARK_PASSWORD,
+    })),
+    'base-info GET': ('base-info', lambda f, i: Call(None, 'GET', reverse('base-info'))),
+    'profile-detail GET': ('profile-detail', lambda f, i: Call(
+        f.customer, 'GET', reverse('profile-detail', args=[f.business.pk]))),
+    'profile-detail PATCH': ('profile-detail', lambda f, i: Call(
+        f.business, 'PATCH', reverse('profile-detail', args=[f.business.pk]), {'location': f'City {i}'})),
+    'business-profiles GET': ('business-profiles', lambda f, i: Call(
+        f.customer, 'GET', reverse('business-profiles'))),
+    'customer-profiles GET': ('customer-profiles', lambda f, i: Call(
+        f.customer, 'GET', reverse('customer-profiles'))),
+    'offer-list-create GET': ('offer-list-create', lambda f, i: Call(
+        None, 'GET', reverse('offer-list-create') + '?page_size=20')),
+    'offer-list-create GET cursor': ('offer-list-create', lambda f, i: Call(
+        None, 'GET', reverse('offer-list-create') + '?pagination=cursor&page_size=20&ordering=min_price')),
+    'offer-list-create GET search': ('offer-list-create', lambda f, i: Call(
+        None, 'GET', reverse('offer-list-create') + '?search=logo&page_size=20')),
+    'offer-list-create GET creator': ('offer-list-create', lambda f, i: Call(
+        None, 'GET', reverse('offer-list-create') + f'?creator_id={f.business.pk}&max_delivery_time=7')),
+    'offer-list-create POST': ('offer-list-create', lambda f, i: Call(
+        f.business, 'POST', reverse('offer-list-create'), _offer_payload(i))),
+    'offer-bulk-create POST': ('offer-bulk-create', lambda f, i: Call(
+        f.business, 'POST', reverse('offer-bulk-create'),
+        [_offer_payload(j, f'Bulk offer {i}') for j in range(BULK_OFFERS)])),
+    'offer-detail GET': ('offer-detail', lambda f, i: Call(
+        f.customer, 'GET', reverse('offer-detail', args=[f.offer.pk]))),
+    'offer-detail PATCH': ('offer-detail', lambda f, i: Call(
+        f.business, 'PATCH', reverse('offer-detail', args=[f.offer.pk]),
+        {'title': f'Updated {i}', 'details': [{'offer_type': 'basic', 'price': 40 + i}]})),
+    'offer-detail DELETE': ('offer-detail', _offer_to_delete),
+    'offerdetail-detail GET': ('offerdetail-detail', lambda f, i: Call(
+        f.customer, 'GET', reverse('offerdetail-detail', args=[f.detail.pk]))),
+    'order-list-create GET': ('order-list-create', lambda f, i: Call(
+        f.business, 'GET', reverse('order-list-create'))),
+    'order-list-create GET filtered': ('order-list-create', lambda f, i: Call(
+        f.business, 'GET', reverse('order-list-create') + '?role=business&status=in_progress')),
+    'order-list-create POST': ('order-list-create', lambda f, i: Call(
+        f.customer, 'POST', reverse('order-list-create'), {'offer_detail_id': f.detail.pk})),
+    'order-detail GET': ('order-detail', lambda f, i: Call(
+        f.customer, 'GET', reverse('order-detail', args=[f.order.pk]))),
+    'order-detail PATCH': ('order-detail', lambda f, i: Call(
+        f.business, 'PATCH', reverse('order-detail', args=[f.order.pk]),
+        {'status': ('in_progress', 'completed')[i % 2]})),
+    'order-detail DELETE': ('order-detail', _order_to_delete),
+    'order-count GET': ('order-count', lambda f, i: Call(
+        f.customer, 'GET', reverse('order-count', args=[f.business.pk]))),
+    'completed-order-count GET': ('completed-order-count', lambda f, i: Call(
+        f.customer, 'GET', reverse('completed-order-count', args=[f.business.pk]))),
+    'order-count-batch GET': ('order-count-batch', lambda f, i: Call(
+        f.customer, 'GET', reverse('order-count-batch') + '?business_user_ids='
+        + ','.join(map(str, f.business_ids)))),
+    'review-list-create GET': ('review-list-create', lambda f, i: Call(
+        f.customer, 'GET', reverse('review-list-create'))),
+    'review-list-create GET business': ('review-list-create', lambda f, i: Call(
+        f.customer, 'GET', reverse('review-list-create') + f'?business_user_id={f.business.pk}&ordering=-rating')),
+    'review-list-create POST': ('review-list-create', lambda f, i: Call(
+        f.new_customer(i), 'POST', reverse('review-list-create'),
+        {'business_user': f.business.pk, 'rating': i % 5 + 1, 'description': 'Benchmark review'})),
+    'review-detail GET': ('review-detail', lambda f, i: Call(
+        f.customer, 'GET', reverse('review-detail', args=[f.review.pk]))),
+    'review-detail PATCH': ('review-detail', lambda f, i: Call(
+        f.review.reviewer, 'PATCH', reverse('review-detail', args=[f.review.pk]), {'rating': i % 5 + 1})),
+    'review-detail DELETE': ('review-detail', _review_to_delete),
+    'review-summary GET': ('review-summary', lambda f, i: Call(
+        f.customer, 'GET', reverse('review-summary', args=[f.business.pk]))),
+    'cache-stats GET': ('cache-stats', lambda f, i: Call(f.staff, 'GET', reverse('cache-stats'))),
+    'metrics GET': ('metrics', lambda f, i: Call(f.staff, 'GET', reverse('metrics'))),
+}
+
+
+def api_url_names(resolver=None, prefix=''):
+    """
+    Return the names of all routes below api/ in the root URLconf.
+    """
+    resolver = resolver or get_resolver()
+    names = set()
+    for pattern in resolver.url_patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            names |= api_url_names(pattern, route)
+        elif isinstance(pattern, URLPattern) and pattern.name and route.startswith('api/'):
+            names.add(pattern.name)
+    return names
+
+
+def uncovered_url_names():
+    """
+    Return the API route names no entry of ENDPOINTS calls.
+    """
+    return api_url_names() - {url_name for url_name, _ in ENDPOINTS.values()}
+
+
+def percentiles(values):
+    """
+    Return the p50, p95 and p99 of a non-empty list of values.
+    """
+    if len(values) == 1:
+        return {'p50': values[0], 'p95': values[0], 'p99': values[0]}
+    cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return {'p50': cuts[49], 'p95': cuts[94], 'p99': cuts[98]}
+
+
+def _auth_headers(user, tokens):
+    if user is None:
+        return {}
+    if user.pk not in tokens:
+        tokens[user.pk] = Token.objects.get_or_create(user=user)[0].key
+    return {'HTTP_AUTHORIZATION': f'Token {tokens[user.pk]}'}
+
+
+def run_benchmark(fixtures, repeat=20, warmup=2, only=None):
+    """
+    Call every endpoint warmup + repeat times and summarize the measured calls.
+
+    Args:
+        fixtures (Fixtures): Rows to call the endpoints with.
+        repeat (int): Measured calls per endpoint.
+        warmup (int): Unmeasured calls per endpoint before those.
+        only (list[str]): Substrings; only matching benchmark names run.
+
+    Returns:
+        list[dict]: Per endpoint: name, route, status code and X-Cache
+        (HIT/MISS) counts, latency percentiles and mean in ms, and
+        min/median/max query count.
+    """
+    client = APIClient()
+    tokens = {}
+    results = []
+    for name, (url_name, build) in ENDPOINTS.items():
+        if only and not any(part in name for part in only):
+            continue
+        timings, query_counts, statuses, cache_results = [], [], Counter(), Counter()
+        for i in range(warmup + repeat):
+            call = build(fixtures, i)
+            send = getattr(client, call.method.lower())
+            headers = _auth_headers(call.user, tokens)
+            metrics = RequestMetrics(keep_queries=0)
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(metrics))
+                start = time.perf_counter()
+                response = send(call.url, call.data, format='json', **headers)
+                elapsed = time.perf_counter() - start
+            if i < warmup:
+                continue
+            timings.append(elapsed * 1000)
+            query_counts.append(metrics.query_count)
+            statuses[str(response.status_code)] += 1
+            if response.has_header('X-Cache'):
+                cache_results[response['X-Cache']] += 1
+
+        results.append({
+            'name': name,
+            'url_name': url_name,
+            'statuses': dict(statuses),
+            'cache': dict(cache_results),
+            **{f'{key}_ms': round(value, 3) for key, value in percentiles(timings).items()},
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'queries': {
+                'min': min(query_counts),
+                'median': statistics.median(query_counts),
+                'max': max(query_counts),
+            },
+        })
+    return results
@@ -0,0 +1,207 @@
+"""
+Module core.cache
+
+Versioned response cache for public read endpoints.
+
+Responses are stored in one of Django's configured caches under a key made
+of a namespace, the namespace's current generation and the normalized
+request URL. Writes never delete entries; they bump the generation, which
+makes every older entry unreachable at once (they then expire by TTL).
+
+Configuration (settings.RESPONSE_CACHE):
+    ALIAS:   Name of the Django cache to use (default 'default').
+    TIMEOUT: Entry lifetime in seconds; 0 disables response caching.
+"""
+
+import hashlib
+import threading
+import time
+from functools import partial
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.routers import primary_reads
+
+DEFAULT_TIMEOUT = 60
+
+
+class ResponseCache:
+    """
+    Response cache for a single namespace (e.g. all offer read endpoints).
+
+    Keeps in-process hit/miss counters so TTLs can be tuned per namespace.
+    """
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def config(self):
+        return getattr(settings, 'RESPONSE_CACHE', {})
+
+    @property
+    def cache(self):
+        return caches[self.config.get('ALIAS', 'default')]
+
+    @property
+    def timeout(self):
+        return self.config.get('TIMEOUT', DEFAULT_TIMEOUT)
+
+    @property
+    def generation_key(self):
+        return f'respcache:{self.namespace}:generation'
+
+    def generation(self):
+        """
+        Return the current generation, initializing it if missing.
+
+        New generations start at a timestamp so a generation lost through
+        eviction can never collide with one used before.
+        """
+        generation = self.cache.get(self.generation_key)
+        if generation is None:
+            self.cache.add(self.generation_key, time.time_ns(), timeout=None)
+            generation = self.cache.get(self.generation_key)
+        return generation
+
+    def bump(self):
+        """
+        Invalidate every cached response of this namespace.
+        """
+        try:
+            self.cache.incr(self.generation_key)
+        except ValueError:
+            self.cache.set(self.generation_key, time.time_ns(), timeout=None)
+
+    def bump_on_commit(self):
+        """
+        Invalidate now and again once the current transaction commits, so a
+        response computed from pre-commit data cannot outlive the write.
+        """
+        self.bump()
+        transaction.on_commit(self.bump)
+
+    def key_for(self, request, generation):
+        """
+        Build the cache key for a request: host, path and sorted query params.
+        """
+        params = sorted(
+            (name, value)
+            for name in request.query_params
+            for value in request.query_params.getlist(name)
+        )
+        url = f'{request.get_host()}{request.path}?{urlencode(params)}'
+        digest = hashlib.sha1(url.encode()).hexdigest()
+        return f'respcache:{self.namespace}:{generation}:{digest}'
+
+    def get_or_build(self, request, build):
+        """
+        Return the cached response for a request, or build and store it.
+
+        Only 200 responses are stored, and only when built outside a
+        transaction, since data read inside one may still be rolled back.
+        Misses are built from the primary database (see core.routers).
+        Adds an X-Cache header (HIT/MISS).
+
+        Args:
+            request (Request): The incoming DRF request.
+            build (callable): Produces the Response on a cache miss.
+        """
+        if not self.timeout:
+            return build()
+
+        key = self.key_for(request, self.generation())
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count(hit=True)
+            response = Response(cached, status=status.HTTP_200_OK)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        self._count(hit=False)
+        # Entries are served to every client: never build them from a lagging replica
+        with primary_reads():
+            response = build()
+        if (response.status_code == status.HTTP_200_OK and
+                not transaction.get_connection().in_atomic_block):
+            self.cache.set(key, response.data, self.timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        """
+        Return hit/miss counters of this process for the namespace.
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / total, 3) if total else 0.0,
+            'timeout': self.timeout,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+_response_caches = {}
+_registry_lock = threading.Lock()
+
+
+def get_response_cache(namespace):
+    """
+    Return the ResponseCache for a namespace, creating it on first use.
+    """
+    with _registry_lock:
+        if namespace not in _response_caches:
+            _response_caches[namespace] = ResponseCache(namespace)
+        return _response_caches[namespace]
+
+
+def response_cache_stats():
+    """
+    Return the counters of all namespaces keyed by namespace.
+    """
+    with _registry_lock:
+        namespaces = list(_response_caches.items())
+    return {name: response_cache.stats() for name, response_cache in namespaces}
+
+
+class ResponseCacheMixin:
+    """
+    View mixin serving list() and retrieve() through a ResponseCache.
+
+    Authentication and permission checks still run on every request; only
+    the query and serialization work is skipped on a hit. Responses must not
+    depend on the requesting user.
+    """
+    response_cache_namespace = None
+
+    def get_response_cache(self):
+        return get_response_cache(self.response_cache_namespace)
+
+    def list(self, request, *args, **kwargs):
+        build = partial(super().list, request, *args, **kwargs)
+        return self.get_response_cache().get_or_build(request, build)
+
+    def retrieve(self, request, *args, **kwargs):
+        build = partial(super().retrieve, request, *args, **kwargs)
+        return self.get_response_cache().get_or_build(request, build)
@@ -0,0 +1,55 @@
+"""
+Module core.conditional
+
+Conditional GET support (ETag / Last-Modified / 304 Not Modified) for DRF views.
+
+Views describe their current state with a cheap metadata query; when the
+client's If-None-Match / If-Modified-Since validators still match, a 304 is
+returned before the object is loaded or serialized.
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    """
+    Build a strong, quoted ETag from the given state components.
+    """
+    raw = '|'.join(str(part) for part in parts)
+    return quote_etag(hashlib.sha1(raw.encode()).hexdigest())
+
+
+class ConditionalGetMixin:
+    """
+    View mixin adding ETag and Last-Modified handling to GET requests.
+
+    Subclasses implement get_validators() returning (etag, last_modified)
+    for the requested resource, or None when the resource does not exist
+    (the normal handler then produces the error response). Either validator
+    may be None. last_modified is a timezone-aware datetime.
+    """
+
+    def get_validators(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        validators = self.get_validators(request, *args, **kwargs)
+        if validators is None:
+            return super().get(request, *args, **kwargs)
+
+        etag, last_modified = validators
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        response = not_modified or super().get(request, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            if etag:
+                response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+        return response
@@ -0,0 +1,149 @@
+"""
+Management command benchmarking every API endpoint through the test client.
+
+Usage:
+    python manage.py benchmark_api [--businesses N] [--customers N] [--no-seed]
+                                   [--repeat N] [--warmup N] [--only NAME ...]
+                                   [--label L] [--output FILE]
+
+Calls each endpoint of core.benchmark.ENDPOINTS and prints p50/p95/p99
+latency, query counts and response cache hits/misses as JSON, so runs can be
+compared across commits.
+
+By default the command creates a scratch test database (like the test
+runner; on PostgreSQL this needs the CREATEDB privilege), seeds a synthetic
+marketplace into it and destroys it at the end. Everything is committed
+there, so the response cache stores entries and commit-time invalidation
+runs as in production. With --no-seed the existing database is benchmarked
+instead; its rows are never changed because everything runs in one
+transaction that is rolled back, which also means cacheable endpoints are
+measured on the cache-miss path only.
+
+Caches are replaced by process-local ones for the run, so no benchmark data
+reaches a shared cache.
+"""
+
+import json
+import platform
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from core.benchmark import Fixtures, run_benchmark, uncovered_url_names
+from core.seed import seed_marketplace
+
+
+MIN_PERCENTILE_SAMPLES = 100
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Report latency percentiles and query counts of every API endpoint as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--businesses', type=int, default=50)
+        parser.add_argument('--customers', type=int, default=500)
+        parser.add_argument('--offers-per-business', type=int, default=5)
+        parser.add_argument('--orders-per-customer', type=int, default=10)
+        parser.add_argument('--reviews-per-customer', type=int, default=2)
+        parser.add_argument('--no-seed', action='store_true',
+                            help="Benchmark the existing database (rolled back) instead of a seeded scratch one.")
+        parser.add_argument('--repeat', type=int, default=100, help="Measured calls per endpoint.")
+        parser.add_argument('--warmup', type=int, default=2, help="Unmeasured calls per endpoint first.")
+        parser.add_argument('--only', nargs='+', default=None,
+                            help="Only run endpoints whose benchmark name contains one of these.")
+        parser.add_argument('--label', default='', help="Free text stored with the results (e.g. a commit).")
+        parser.add_argument('--output', default=None, help="Write the JSON to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError("--repeat must be at least 1.")
+        for url_name in sorted(uncovered_url_names()):
+            self.stderr.write(self.style.WARNING(f"No benchmark calls the route '{url_name}'."))
+
+        report = {
+            'label': options['label'],
+            'database': connection.vendor,
+            'django': django.get_version(),
+            'python': platform.python_version(),
+            'repeat': options['repeat'],
+            'warmup': options['warmup'],
+            'seeded': None,
+        }
+        if options['repeat'] < MIN_PERCENTILE_SAMPLES:
+            self.stderr.write(self.style.WARNING(
+                f"p95/p99 from {options['repeat']} samples are interpolated; "
+                f"use --repeat {MIN_PERCENTILE_SAMPLES} or more for stable tail latencies."
+            ))
+
+        # The test client's host; the slow-request log would only add noise here;
+        # local caches keep benchmark responses out of shared ones; no replicas
+        # since they would not see the scratch database
+        overrides = {
+            'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, 'testserver'],
+            'METRICS': {**getattr(settings, 'METRICS', {}), 'SLOW_REQUEST_MS': None},
+            'CACHES': {
+                alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                        'LOCATION': f'benchmark-{alias}'}
+                for alias in settings.CACHES
+            },
+            'REPLICA_ROUTING': {**getattr(settings, 'REPLICA_ROUTING', {}), 'REPLICAS': []},
+        }
+        with override_settings(**overrides):
+            if options['no_seed']:
+                report['endpoints'] = self.run_rolled_back(options)
+            else:
+                report['seeded'], report['endpoints'] = self.run_on_scratch_database(options)
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(output + '\n')
+            self.stderr.write(f"Wrote {len(report['endpoints'])} results to {options['output']}")
+        else:
+            self.stdout.write(output)
+
+    def run_on_scratch_database(self, options):
+        """
+        Seed a fresh test database and benchmark it with everything committed.
+        """
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            seeded = seed_marketplace(
+                businesses=options['businesses'],
+                customers=options['customers'],
+                offers_per_business=options['offers_per_business'],
+                orders_per_customer=options['orders_per_customer'],
+                reviews_per_customer=options['reviews_per_customer'],
+                seed=0,
+            )
+            return seeded, self.run(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def run_rolled_back(self, options):
+        """
+        Benchmark the existing data and roll back every write.
+        """
+        try:
+            with transaction.atomic():
+                endpoints = self.run(options)
+                raise Rollback
+        except Rollback:
+            return endpoints
+
+    def run(self, options):
+        try:
+            fixtures = Fixtures()
+        except LookupError as exc:
+            raise CommandError(str(exc))
+        return run_benchmark(
+            fixtures, repeat=options['repeat'], warmup=options['warmup'], only=options['only']
+        )
@@ -0,0 +1,180 @@
+"""
+Management command comparing query plans and timings of the hot filter paths
+with and without their composite indexes, on a seeded dataset.
+
+Usage:
+    python manage.py benchmark_indexes [--businesses N] [--customers N] [--repeat N] [--no-seed] [--json]
+
+Everything (seed data and dropped indexes) is rolled back at the end, so the
+command can be run against a development database.
+"""
+
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count
+
+from core.seed import seed_marketplace
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import Order
+from reviews_app.models import Review
+
+
+def _busiest(field, model):
+    """
+    Return the value of `field` occurring in most rows of `model`.
+    """
+    row = model.objects.values(field).annotate(n=Count('pk')).order_by('-n').first()
+    return row[field] if row else None
+
+
+# Index name → (model, description, query factory). The queries mirror the
+# filters and orderings the API views issue.
+HOT_QUERIES = {
+    'offer_updated_idx': (
+        Offer, "GET /api/offers/ first page (ordering -updated_at, id)",
+        lambda: Offer.objects.order_by('-updated_at', '-id')[:21],
+    ),
+    'offer_user_updated_idx': (
+        Offer, "GET /api/offers/?creator_id=…",
+        lambda: Offer.objects.filter(user_id=_busiest('user_id', Offer)).order_by('-updated_at')[:21],
+    ),
+    'offerdetail_offer_type_idx': (
+        OfferDetail, "PATCH /api/offers/{id}/ detail lookup by offer_type",
+        lambda: OfferDetail.objects.filter(
+            offer_id=Offer.objects.values_list('id', flat=True).last(), offer_type='premium'
+        ),
+    ),
+    'order_customer_created_idx': (
+        Order, "GET /api/orders/?role=customer",
+        lambda: Order.objects.filter(
+            customer_user_id=_busiest('customer_user_id', Order)
+        ).order_by('-created_at', '-id')[:21],
+    ),
+    'order_business_created_idx': (
+        Order, "GET /api/orders/?role=business",
+        lambda: Order.objects.filter(
+            business_user_id=_busiest('business_user_id', Order)
+        ).order_by('-created_at', '-id')[:21],
+    ),
+    'order_business_status_idx': (
+        Order, "GET /api/orders/?role=business&status=in_progress",
+        lambda: Order.objects.filter(
+            business_user_id=_busiest('business_user_id', Order), status='in_progress'
+        ).order_by('-created_at')[:21],
+    ),
+    'review_updated_idx': (
+        Review, "GET /api/reviews/ first page (ordering -updated_at, id)",
+        lambda: Review.objects.order_by('-updated_at', '-id')[:21],
+    ),
+    'review_rating_idx': (
+        Review, "GET /api/reviews/?ordering=-rating",
+        lambda: Review.objects.order_by('-rating', '-id')[:21],
+    ),
+    'review_business_updated_idx': (
+        Review, "GET /api/reviews/?business_user_id=…",
+        lambda: Review.objects.filter(
+            business_user_id=_busiest('business_user_id', Review)
+        ).order_by('-updated_at', '-id')[:21],
+    ),
+    'review_business_rating_idx': (
+        Review, "GET /api/reviews/?business_user_id=…&ordering=-rating",
+        lambda: Review.objects.filter(
+            business_user_id=_busiest('business_user_id', Review)
+        ).order_by('-rating', '-id')[:21],
+    ),
+    'review_reviewer_updated_idx': (
+        Review, "GET /api/reviews/?reviewer_id=…",
+        lambda: Review.objects.filter(
+            reviewer_id=_busiest('reviewer_id', Review)
+        ).order_by('-updated_at', '-id')[:21],
+    ),
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Show query plans and timings of the hot filter paths with and without their indexes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--businesses', type=int, default=200)
+        parser.add_argument('--customers', type=int, default=2000)
+        parser.add_argument('--orders-per-customer', type=int, default=20)
+        parser.add_argument('--repeat', type=int, default=20,
+                            help="Executions per query and variant; the median is reported.")
+        parser.add_argument('--no-seed', action='store_true',
+                            help="Benchmark the existing data instead of seeding.")
+        parser.add_argument('--json', action='store_true', help="Print the results as JSON.")
+
+    def handle(self, *args, **options):
+        results = []
+        try:
+            with transaction.atomic():
+                if not options['no_seed']:
+                    seeded = seed_marketplace(
+                        businesses=options['businesses'],
+                        customers=options['customers'],
+                        orders_per_customer=options['orders_per_customer'],
+                        seed=0,
+                    )
+                    self.stderr.write(f"Seeded {seeded}")
+                self._analyze()
+                for name, (model, description, build) in HOT_QUERIES.items():
+                    results.append(self._compare(name, model, description, build, options['repeat']))
+                raise Rollback
+        except Rollback:
+            pass
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        for result in results:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{result['index']}: {result['query']}"))
+            for variant in ('without_index', 'with_index'):
+                data = result[variant]
+                self.stdout.write(f"  {variant} ({data['median_ms']:.3f} ms)")
+                for line in data['plan'].splitlines():
+                    self.stdout.write(f"    {line}")
+
+    def _analyze(self):
+        # Planner statistics for the freshly inserted rows
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def _compare(self, name, model, description, build, repeat):
+        """
+        Measure one query with its index, then again after dropping it.
+        """
+        index = next(index for index in model._meta.indexes if index.name == name)
+        editor = connection.schema_editor()
+        queryset = build()
+
+        with_index = self._measure(queryset, repeat)
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP INDEX {connection.ops.quote_name(name)}')
+        self._analyze()
+        without_index = self._measure(queryset, repeat)
+        with connection.cursor() as cursor:
+            cursor.execute(str(index.create_sql(model, editor)))
+        self._analyze()
+
+        return {
+            'index': name,
+            'query': description,
+            'without_index': without_index,
+            'with_index': with_index,
+        }
+
+    def _measure(self, queryset, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - start) * 1000)
+        return {'plan': queryset.explain(), 'median_ms': statistics.median(timings)}
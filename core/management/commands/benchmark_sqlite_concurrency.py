@@ -0,0 +1,209 @@
+"""
+Management command comparing Django's stock SQLite backend with core.sqlite
+under concurrent writers and readers.
+
+Usage:
+    python manage.py benchmark_sqlite_concurrency [--writers N] [--readers N] [--seconds S]
+                                                  [--orders N] [--json]
+
+For each backend a fresh database file is created in a temporary directory
+with an order table and a per-business counter table. Writer threads then run
+order-creation transactions (read the counter, insert an order, bump the
+counter), while reader threads page through one business's orders and count
+open ones, all for the same wall-clock time. The report shows throughput,
+"database is locked" errors and latency percentiles per backend.
+"""
+
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.utils import OperationalError
+
+from core.benchmark import percentiles
+
+BACKENDS = {
+    'stock': 'django.db.backends.sqlite3',
+    'tuned': 'core.sqlite',
+}
+
+SCHEMA = [
+    'CREATE TABLE bench_order (id INTEGER PRIMARY KEY AUTOINCREMENT, business_id INTEGER NOT NULL, '
+    'status TEXT NOT NULL, payload TEXT NOT NULL)',
+    'CREATE INDEX bench_order_business_idx ON bench_order (business_id, id)',
+    'CREATE TABLE bench_counter (business_id INTEGER PRIMARY KEY, in_progress INTEGER NOT NULL)',
+]
+
+BUSINESSES = 50
+PAYLOAD = 'x' * 200
+
+
+def _register(alias, engine, path):
+    # Fill in Django's defaults for the extra alias like for configured ones
+    settings_dict = connections.configure_settings(
+        {DEFAULT_DB_ALIAS: {'ENGINE': engine, 'NAME': str(path)}}
+    )[DEFAULT_DB_ALIAS]
+    connections.settings[alias] = settings_dict
+
+
+def _unregister(alias):
+    connections[alias].close()
+    del connections[alias]
+    del connections.settings[alias]
+
+
+def _prepare(alias, orders):
+    connection = connections[alias]
+    with transaction.atomic(using=alias), connection.cursor() as cursor:
+        for statement in SCHEMA:
+            cursor.execute(statement)
+        cursor.executemany(
+            'INSERT INTO bench_counter (business_id, in_progress) VALUES (%s, 0)',
+            [(business_id,) for business_id in range(BUSINESSES)],
+        )
+        cursor.executemany(
+            'INSERT INTO bench_order (business_id, status, payload) VALUES (%s, %s, %s)',
+            [(i % BUSINESSES, 'completed', PAYLOAD) for i in range(orders)],
+        )
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode')
+        return cursor.fetchone()[0]
+
+
+def _write(alias, rng):
+    business_id = rng.randrange(BUSINESSES)
+    with transaction.atomic(using=alias), connections[alias].cursor() as cursor:
+        # Read before writing, like the order views do
+        cursor.execute('SELECT in_progress FROM bench_counter WHERE business_id = %s', [business_id])
+        cursor.fetchone()
+        cursor.execute(
+            'INSERT INTO bench_order (business_id, status, payload) VALUES (%s, %s, %s)',
+            [business_id, 'in_progress', PAYLOAD],
+        )
+        cursor.execute(
+            'UPDATE bench_counter SET in_progress = in_progress + 1 WHERE business_id = %s', [business_id]
+        )
+
+
+def _read(alias, rng):
+    with connections[alias].cursor() as cursor:
+        cursor.execute(
+            'SELECT id, status, payload FROM bench_order WHERE business_id = %s ORDER BY id DESC LIMIT 20',
+            [rng.randrange(BUSINESSES)],
+        )
+        cursor.fetchall()
+        cursor.execute("SELECT COUNT(*) FROM bench_order WHERE status = 'in_progress'")
+        cursor.fetchone()
+
+
+def _worker(alias, operation, seed, barrier, seconds, stats):
+    rng = random.Random(seed)
+    timings, errors = [], Counter()
+    try:
+        barrier.wait()
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                operation(alias, rng)
+            except OperationalError as exc:
+                errors[str(exc)] += 1
+                continue
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        connections[alias].close()
+        stats.append((timings, errors))
+
+
+def _summarize(stats, seconds):
+    timings = [value for thread_timings, _ in stats for value in thread_timings]
+    errors = sum((thread_errors for _, thread_errors in stats), Counter())
+    return {
+        'ops_per_s': round(len(timings) / seconds, 1),
+        'errors': dict(errors),
+        **{
+            f'{key}_ms': round(value, 3)
+            for key, value in (percentiles(timings) if timings else {}).items()
+        },
+    }
+
+
+def run_concurrency_benchmark(name, directory, writers, readers, seconds, orders):
+    """
+    Run the workload against a fresh database file on one of BACKENDS.
+    """
+    engine = BACKENDS[name]
+    alias = f'concurrency_{name}'
+    _register(alias, engine, Path(directory) / f'{alias}.sqlite3')
+    try:
+        journal_mode = _prepare(alias, orders)
+        barrier = threading.Barrier(writers + readers)
+        write_stats, read_stats = [], []
+        threads = [
+            threading.Thread(target=_worker, args=(alias, _write, i, barrier, seconds, write_stats))
+            for i in range(writers)
+        ] + [
+            threading.Thread(target=_worker, args=(alias, _read, -i - 1, barrier, seconds, read_stats))
+            for i in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        _unregister(alias)
+    return {
+        'engine': engine,
+        'journal_mode': journal_mode,
+        'writes': _summarize(write_stats, seconds),
+        'reads': _summarize(read_stats, seconds),
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare the stock and the tuned SQLite backend under concurrent reads and writes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=8)
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--seconds', type=float, default=5, help="Run time per backend.")
+        parser.add_argument('--orders', type=int, default=20000, help="Orders inserted up front.")
+        parser.add_argument('--json', action='store_true', help="Print the results as JSON.")
+
+    def handle(self, *args, **options):
+        results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            for name in BACKENDS:
+                results[name] = run_concurrency_benchmark(
+                    name, directory, options['writers'], options['readers'],
+                    options['seconds'], options['orders'],
+                )
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        for name, result in results.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{name} ({result['engine']}, journal_mode={result['journal_mode']})"
+            ))
+            for kind in ('writes', 'reads'):
+                data = result[kind]
+                errors = sum(data['errors'].values())
+                latency = (
+                    f"p50 {data['p50_ms']:.2f} / p95 {data['p95_ms']:.2f} / p99 {data['p99_ms']:.2f} ms"
+                    if 'p50_ms' in data else "no successful operations"
+                )
+                self.stdout.write(f"  {kind}: {data['ops_per_s']}/s, {errors} errors, {latency}")
+
+        ratios = [
+            f"{kind} x{results['tuned'][kind]['ops_per_s'] / results['stock'][kind]['ops_per_s']:.1f}"
+            for kind in ('writes', 'reads') if results['stock'][kind]['ops_per_s']
+        ]
+        if ratios:
+            self.stdout.write(self.style.SUCCESS(f"tuned vs. stock throughput: {', '.join(ratios)}"))
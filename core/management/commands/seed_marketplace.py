@@ -0,0 +1,59 @@
+"""
+Management command inserting a synthetic marketplace for benchmarks.
+
+Usage:
+    python manage.py seed_marketplace [--businesses N] [--customers N] [--offers-per-business N]
+                                      [--orders-per-customer N] [--reviews-per-customer N]
+                                      [--days N] [--seed N] [--prefix P] [--json]
+
+All rows are inserted with bulk inserts in one transaction (see core.seed).
+Seeded users log in with the password core.seed.SEED_PASSWORD.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.seed import SEED_PASSWORD, seed_marketplace
+
+
+class Command(BaseCommand):
+    help = "Insert synthetic business/customer users, offers, orders and reviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--businesses', type=int, default=50)
+        parser.add_argument('--customers', type=int, default=200)
+        parser.add_argument('--offers-per-business', type=int, default=5)
+        parser.add_argument('--orders-per-customer', type=int, default=10)
+        parser.add_argument('--reviews-per-customer', type=int, default=2)
+        parser.add_argument('--days', type=int, default=365,
+                            help="Orders and reviews are spread over this many past days.")
+        parser.add_argument('--seed', type=int, default=None,
+                            help="Random seed for reproducible data.")
+        parser.add_argument('--prefix', default=None,
+                            help="Username prefix (random by default).")
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--json', action='store_true', help="Print the row counts as JSON.")
+
+    def handle(self, *args, **options):
+        counts = seed_marketplace(
+            businesses=options['businesses'],
+            customers=options['customers'],
+            offers_per_business=options['offers_per_business'],
+            orders_per_customer=options['orders_per_customer'],
+            reviews_per_customer=options['reviews_per_customer'],
+            days=options['days'],
+            seed=options['seed'],
+            prefix=options['prefix'],
+            batch_size=options['batch_size'],
+        )
+        if options['json']:
+            self.stdout.write(json.dumps(counts, indent=2))
+            return
+        prefix = counts.pop('prefix')
+        for kind, count in counts.items():
+            self.stdout.write(f"{kind}: {count}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded users are named '{prefix}_business_<n>' / '{prefix}_customer_<n>' "
+            f"with password '{SEED_PASSWORD}'."
+        ))
@@ -0,0 +1,41 @@
+"""
+Management command copying the SQLite primary database into the SQLite read
+replicas, standing in for replication when trying the replica routing locally.
+
+Usage:
+    DATABASE_REPLICA_URLS=sqlite:///replica.sqlite3 python manage.py sync_sqlite_replica
+
+Each replica file is overwritten with a consistent snapshot of the primary
+(SQLite's online backup). Run it again to let the replicas "catch up".
+"""
+
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    help = "Copy the SQLite primary database into the SQLite read replicas."
+
+    def handle(self, *args, **options):
+        primary = connections[DEFAULT_DB_ALIAS]
+        if primary.vendor != 'sqlite':
+            raise CommandError("The default database is not SQLite.")
+        replicas = [alias for alias in settings.REPLICA_ROUTING['REPLICAS'] if connections[alias].vendor == 'sqlite']
+        if not replicas:
+            raise CommandError("No SQLite replicas configured; set DATABASE_REPLICA_URLS.")
+
+        source = sqlite3.connect(primary.settings_dict['NAME'])
+        try:
+            for alias in replicas:
+                connections[alias].close()
+                target = sqlite3.connect(connections[alias].settings_dict['NAME'])
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                self.stdout.write(self.style.SUCCESS(f"{alias} ← {primary.settings_dict['NAME']}"))
+        finally:
+            source.close()
@@ -0,0 +1,296 @@
+"""
+Module core.metrics
+
+Per-endpoint request instrumentation.
+
+RequestMetricsMiddleware measures every request and records, per URL name
+(e.g. 'offer-list-create') and method:
+    - the request latency,
+    - the number of SQL queries and the time spent in them,
+    - the serialization time (serializer.data plus response rendering).
+
+Each is kept as a histogram in a process-wide registry and exposed in the
+Prometheus text format by core.views.MetricsView (GET /api/metrics/). SQL
+time spent while serializing (lazy loads, N+1 queries) counts towards both.
+
+With HEADERS on, responses carry X-Query-Count and a Server-Timing header.
+Requests slower than SLOW_REQUEST_MS are logged to 'core.metrics.slow'
+together with their SQL statements.
+
+Configuration (settings.METRICS):
+    ENABLED:         Record metrics at all (default True).
+    HEADERS:         Add the debug headers (default settings.DEBUG).
+    SLOW_REQUEST_MS: Slow-request log threshold in ms; None disables the log.
+    SLOW_MAX_QUERIES: SQL statements kept per request for the slow log.
+    SLOW_EXCLUDE_VIEWS: URL names never logged as slow (default login and
+                     registration, which are slow by design: password hashing).
+
+Histograms are kept per worker process.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.serializers import BaseSerializer
+
+slow_logger = logging.getLogger('core.metrics.slow')
+
+DEFAULTS = {
+    'ENABLED': True,
+    'HEADERS': None,  # None: follow settings.DEBUG
+    'SLOW_REQUEST_MS': 500,
+    'SLOW_MAX_QUERIES': 200,
+    'SLOW_EXCLUDE_VIEWS': ('login', 'registration'),
+}
+
+PREFIX = 'coderr_'
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+# name → (help text, buckets)
+HISTOGRAMS = {
+    'request_duration_seconds': ("Request latency per URL name.", SECONDS_BUCKETS),
+    'request_queries': ("SQL queries per request.", QUERY_BUCKETS),
+    'request_db_duration_seconds': ("Time spent in SQL queries per request.", SECONDS_BUCKETS),
+    'request_serialization_duration_seconds': (
+        "Time spent in serializer.data and response rendering per request.", SECONDS_BUCKETS
+    ),
+}
+
+UNMATCHED_VIEW = 'unmatched'
+
+_current = ContextVar('request_metrics', default=None)
+
+
+def get_config():
+    config = {**DEFAULTS, **getattr(settings, 'METRICS', {})}
+    if config['HEADERS'] is None:
+        config['HEADERS'] = settings.DEBUG
+    return config
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus sense.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot: +Inf
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        Yield (upper bound label, cumulative count) pairs, ending with +Inf.
+        """
+        total = 0
+        for bound, count in zip((*self.buckets, '+Inf'), self.counts):
+            total += count
+            yield bound, total
+
+
+def _labels(**labels):
+    escaped = (
+        (key, str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'))
+        for key, value in labels.items()
+    )
+    return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+
+class MetricsRegistry:
+    """
+    Process-wide store of the request histograms and counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {name: {} for name in HISTOGRAMS}
+            self._requests = {}
+
+    def record(self, view, method, status_code, observations):
+        """
+        Record one request.
+
+        Args:
+            observations (dict): Histogram name → observed value.
+        """
+        key = (view, method)
+        with self._lock:
+            counter_key = (view, method, status_code)
+            self._requests[counter_key] = self._requests.get(counter_key, 0) + 1
+            for name, value in observations.items():
+                series = self._histograms[name]
+                if key not in series:
+                    series[key] = Histogram(HISTOGRAMS[name][1])
+                series[key].observe(value)
+
+    def render(self):
+        """
+        Return all metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            lines += [
+                f'# HELP {PREFIX}requests_total Requests per URL name, method and status.',
+                f'# TYPE {PREFIX}requests_total counter',
+            ]
+            for (view, method, status_code), count in sorted(self._requests.items()):
+                lines.append(f'{PREFIX}requests_total{_labels(view=view, method=method, status=status_code)} {count}')
+
+            for name, (help_text, _) in HISTOGRAMS.items():
+                metric = PREFIX + name
+                lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} histogram']
+                for (view, method), histogram in sorted(self._histograms[name].items()):
+                    for bound, count in histogram.cumulative():
+                        labels = _labels(view=view, method=method, le=bound)
+                        lines.append(f'{metric}_bucket{labels} {count}')
+                    labels = _labels(view=view, method=method)
+                    # Full precision: a rounded sum breaks rate() on busy series
+                    lines.append(f'{metric}_sum{labels} {float(histogram.sum)!r}')
+                    lines.append(f'{metric}_count{labels} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics_registry = MetricsRegistry()
+
+
+class RequestMetrics:
+    """
+    Measurements of the request currently being handled.
+    """
+
+    def __init__(self, keep_queries):
+        self.keep_queries = keep_queries
+        self.query_count = 0
+        self.db_time = 0.0
+        self.serialization_time = 0.0
+        self.queries = []
+        self._serializing = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        # Database execute wrapper (see Connection.execute_wrapper)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.query_count += 1
+            self.db_time += duration
+            if len(self.queries) < self.keep_queries:
+                self.queries.append((duration, sql))
+
+
+def _timed_data(data_property):
+    def data(self):
+        metrics = _current.get()
+        # Only the outermost serializer is timed; nested .data calls are part of it
+        if metrics is None or metrics._serializing:
+            return data_property.fget(self)
+        metrics._serializing += 1
+        start = time.perf_counter()
+        try:
+            return data_property.fget(self)
+        finally:
+            metrics.serialization_time += time.perf_counter() - start
+            metrics._serializing -= 1
+    data.__wrapped__ = data_property
+    return property(data)
+
+
+def install_serializer_timing():
+    """
+    Time serializer.data for the request metrics; called once from
+    CoreConfig.ready(). Costs one context variable lookup outside requests.
+    """
+    if not hasattr(BaseSerializer.data, 'fget') or hasattr(BaseSerializer.data.fget, '__wrapped__'):
+        return
+    BaseSerializer.data = _timed_data(BaseSerializer.data)
+
+
+class RequestMetricsMiddleware:
+    """
+    Records latency, SQL and serialization metrics per URL name.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = get_config()
+        if not config['ENABLED']:
+            return self.get_response(request)
+
+        slow_ms = config['SLOW_REQUEST_MS']
+        metrics = RequestMetrics(config['SLOW_MAX_QUERIES'] if slow_ms is not None else 0)
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        duration = time.perf_counter() - start
+
+        match = request.resolver_match
+        view = (match.url_name or match.view_name) if match else UNMATCHED_VIEW
+        metrics_registry.record(view, request.method, response.status_code, {
+            'request_duration_seconds': duration,
+            'request_queries': metrics.query_count,
+            'request_db_duration_seconds': metrics.db_time,
+            'request_serialization_duration_seconds': metrics.serialization_time,
+        })
+
+        if config['HEADERS']:
+            response['X-Query-Count'] = str(metrics.query_count)
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={metrics.db_time * 1000:.1f}',
+                f'serialize;dur={metrics.serialization_time * 1000:.1f}',
+                f'total;dur={duration * 1000:.1f}',
+            ])
+
+        if slow_ms is not None and duration * 1000 >= slow_ms and view not in config['SLOW_EXCLUDE_VIEWS']:
+            self.log_slow_request(request, view, response, duration, metrics)
+        return response
+
+    def process_template_response(self, request, response):
+        # Called right before DRF renders the response; time the rendering
+        metrics = _current.get()
+        if metrics is not None:
+            start = time.perf_counter()
+
+            def rendered(response):
+                metrics.serialization_time += time.perf_counter() - start
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    @staticmethod
+    def log_slow_request(request, view, response, duration, metrics):
+        lines = [
+            f"Slow request {request.method} {request.get_full_path()} ({view}) → {response.status_code}: "
+            f"{duration * 1000:.1f} ms, {metrics.query_count} queries in {metrics.db_time * 1000:.1f} ms, "
+            f"serialization {metrics.serialization_time * 1000:.1f} ms"
+        ]
+        lines += [f"  {query_time * 1000:8.2f} ms  {sql}" for query_time, sql in metrics.queries]
+        if metrics.query_count > len(metrics.queries):
+            lines.append(f"  … {metrics.query_count - len(metrics.queries)} more")
+        slow_logger.warning('\n'.join(lines))
+
@@ -0,0 +1,250 @@
+"""
+Module core.pagination
+
+Provides a keyset (cursor) pagination class shared by the list endpoints.
+
+Unlike PageNumberPagination it never issues COUNT(*) or OFFSET queries:
+each page is fetched with a WHERE clause that continues after the last row
+of the previous page, using the full ordering tuple (always ending in the
+primary key) as the key. Cursors are opaque, URL-safe tokens.
+
+A list of querysets may be paginated instead of a single one: each branch
+gets the cursor condition on its own, so every branch can use its own
+index, and the page is taken from their UNION.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Cursor pagination over a composite, unique ordering key.
+
+    Subclasses declare the allowed orderings in `ordering_options`, mapping
+    the value of the `ordering` query parameter to a tuple of model fields
+    ("-" prefix for descending). Each tuple must end with a unique field,
+    usually 'id', so every row has a distinct position.
+
+    NULL values sort last in the forward direction.
+    """
+    cursor_query_param = 'cursor'
+    ordering_param = 'ordering'
+    page_size = 3
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering_options = {
+        '-id': ('-id',),
+        'id': ('id',),
+    }
+    default_ordering = '-id'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return one page of results after (or before) the requested cursor.
+
+        Args:
+            queryset (QuerySet | list[QuerySet]): The rows to paginate, or
+                several querysets of the same model whose UNION is paginated.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        branches = list(queryset) if isinstance(queryset, (list, tuple)) else [queryset]
+        self.model = branches[0].model
+        self.ordering = self.get_ordering(request)
+        values, reverse = self.decode_cursor(request)
+
+        try:
+            branches = [self._page_branch(branch, values, reverse) for branch in branches]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        if len(branches) == 1:
+            queryset = branches[0]
+        else:
+            queryset = self._union(branches, reverse)
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = has_more if reverse else values is not None
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        """
+        Return the page size requested via query parameter, capped at max_page_size.
+        """
+        if self.page_size_query_param:
+            try:
+                size = int(request.query_params[self.page_size_query_param])
+                if size > 0:
+                    return min(size, self.max_page_size)
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, request):
+        """
+        Return the ordering field tuple selected by the ordering query parameter.
+        """
+        key = request.query_params.get(self.ordering_param, self.default_ordering)
+        if key not in self.ordering_options:
+            key = self.default_ordering
+        return self.ordering_options[key]
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    # --- Cursor encoding ---
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({'v': values, 'r': int(reverse)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request):
+        """
+        Decode the cursor query parameter into (values, reverse).
+
+        Returns (None, False) when no cursor was supplied.
+
+        Raises:
+            NotFound: If the cursor is malformed or does not fit the ordering.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values, reverse = payload['v'], bool(payload['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def _link(self, obj, reverse):
+        values = []
+        for field, _ in self._fields():
+            value = getattr(obj, field)
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            values.append(value)
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self.encode_cursor(values, reverse)
+        )
+
+    # --- Query building ---
+
+    def _fields(self):
+        """
+        Yield (field_name, descending) pairs of the current ordering.
+        """
+        for field in self.ordering:
+            yield field.lstrip('-'), field.startswith('-')
+
+    def _nullable(self, field):
+        return self.model._meta.get_field(field).null
+
+    def _order_expressions(self, reverse):
+        expressions = []
+        for field, descending in self._fields():
+            # Walking backwards flips both the direction and the NULL position
+            nulls = {}
+            if self._nullable(field):
+                nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+            expression = F(field)
+            if descending != reverse:
+                expressions.append(expression.desc(**nulls))
+            else:
+                expressions.append(expression.asc(**nulls))
+        return expressions
+
+    def _page_branch(self, queryset, values, reverse):
+        """
+        Order a queryset by the cursor key and continue after the cursor.
+        """
+        queryset = queryset.order_by(*self._order_expressions(reverse))
+        if values is not None:
+            queryset = queryset.filter(self._after_condition(values, reverse))
+        return queryset
+
+    def _union(self, branches, reverse):
+        """
+        Combine the branches with UNION (dropping duplicates) under the same
+        ordering. Backends that allow it limit each branch to one page first.
+        """
+        features = connections[branches[0].db].features
+        if features.supports_slicing_ordering_in_compound:
+            branches = [branch[:self.page_size + 1] for branch in branches]
+        else:
+            branches = [branch.order_by() for branch in branches]
+        first, *rest = branches
+        return first.union(*rest).order_by(*self._order_expressions(reverse))
+
+    def _after_condition(self, values, reverse):
+        """
+        Build the WHERE clause selecting rows positioned after the cursor.
+
+        For key (a, b, id) this is: a after v_a OR (a = v_a AND (b after v_b
+        OR (b = v_b AND id after v_id))), with NULLs of nullable fields placed
+        last (first when walking backwards).
+        """
+        condition = None
+        for (field, descending), value in reversed(list(zip(self._fields(), values))):
+            nullable = self._nullable(field)
+            if value is None:
+                if not nullable:
+                    raise NotFound(self.invalid_cursor_message)
+                after = Q(**{f'{field}__isnull': False}) if reverse else Q(pk__in=[])
+                equal = Q(**{f'{field}__isnull': True})
+            else:
+                lookup = 'lt' if descending != reverse else 'gt'
+                after = Q(**{f'{field}__{lookup}': value})
+                if nullable and not reverse:
+                    after |= Q(**{f'{field}__isnull': True})
+                equal = Q(**{field: value})
+            condition = after if condition is None else after | (equal & condition)
+        return condition
@@ -0,0 +1,227 @@
+"""
+Module core.routers
+
+Read-replica routing for the read-heavy endpoints.
+
+ReplicaRoutingMiddleware marks GET/HEAD requests to the configured views
+(offer, review, base-info and profile reads) as replica reads and picks one
+replica for the whole request. ReplicaRouter then sends that request's reads
+to the replica; all writes, and reads inside a transaction on the primary,
+go to the default database.
+
+Read-your-writes: after a successful write (POST, PATCH, PUT, DELETE), the
+client is "sticky" for STICKY_SECONDS: its reads go to the primary, so it
+sees its own changes even while the replicas lag behind. Clients are
+recognized by their API token; login and registration mark the token they
+issue (stick_to_primary). Token authentication itself always reads from the
+primary, so new and revoked tokens take effect at once.
+
+Data built for a shared cache (response cache, site statistics) is read from
+the primary too (primary_reads), so replica lag never gets cached for
+everyone.
+
+The sticky markers live in the cache CACHE_ALIAS. With several worker
+processes it must be shared between them (e.g. Redis or Memcached); a
+process-local cache is reported by the system check core.W001.
+
+Configuration (settings.REPLICA_ROUTING):
+    REPLICAS:       Database aliases serving replica reads; empty disables routing.
+    VIEWS:          URL names whose reads may use a replica.
+    STICKY_SECONDS: Read-your-writes window after a write; 0 disables it.
+    CACHE_ALIAS:    Django cache holding the sticky markers.
+"""
+
+import hashlib
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+DEFAULTS = {
+    'REPLICAS': [],
+    'VIEWS': [
+        'offer-list-create',
+        'offer-detail',
+        'offerdetail-detail',
+        'review-list-create',
+        'review-detail',
+        'review-summary',
+        'base-info',
+        'profile-detail',
+        'business-profiles',
+        'customer-profiles',
+    ],
+    'STICKY_SECONDS': 5,
+    'CACHE_ALIAS': 'default',
+}
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Cache backends whose entries other worker processes cannot see
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+_current = ContextVar('replica_routing', default=None)
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, 'REPLICA_ROUTING', {})}
+
+
+class ReplicaRouting:
+    """
+    Routing decision of the request currently being handled.
+    """
+
+    def __init__(self):
+        self.read_alias = None
+
+
+def current_read_alias():
+    """
+    Return the replica chosen for the current request, or None.
+    """
+    routing = _current.get()
+    return routing.read_alias if routing is not None else None
+
+
+@contextmanager
+def primary_reads():
+    """
+    Send the current request's reads to the primary within the block.
+    """
+    routing = _current.get()
+    if routing is None or routing.read_alias is None:
+        yield
+        return
+    alias, routing.read_alias = routing.read_alias, None
+    try:
+        yield
+    finally:
+        routing.read_alias = alias
+
+
+def sticky_key(token_key):
+    return f'replica:sticky:{hashlib.sha256(token_key.encode()).hexdigest()}'
+
+
+def request_token_key(request):
+    """
+    Return the API token of the request's Authorization header, or None.
+    """
+    parts = request.META.get('HTTP_AUTHORIZATION', '').split()
+    return parts[-1] if len(parts) == 2 else None
+
+
+def stick_to_primary(token_key):
+    """
+    Send the reads of requests with this API token to the primary for the
+    next STICKY_SECONDS.
+    """
+    config = get_config()
+    if config['REPLICAS'] and config['STICKY_SECONDS']:
+        caches[config['CACHE_ALIAS']].set(sticky_key(token_key), True, config['STICKY_SECONDS'])
+
+
+def is_sticky(request, config):
+    token_key = request_token_key(request)
+    if token_key is None or not config['STICKY_SECONDS']:
+        return False
+    return caches[config['CACHE_ALIAS']].get(sticky_key(token_key)) is not None
+
+
+@checks.register(checks.Tags.database)
+def check_sticky_cache(app_configs, **kwargs):
+    """
+    Warn when the read-your-writes markers cannot be seen by other workers.
+    """
+    config = get_config()
+    if not config['REPLICAS'] or not config['STICKY_SECONDS']:
+        return []
+    backend = settings.CACHES.get(config['CACHE_ALIAS'], {}).get('BACKEND')
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [checks.Warning(
+        f"REPLICA_ROUTING['CACHE_ALIAS'] ({config['CACHE_ALIAS']!r}) uses the process-local {backend}.",
+        hint="Read-your-writes only holds within one worker process; use a shared cache such as "
+             "Redis or Memcached when several processes serve the API.",
+        id='core.W001',
+    )]
+
+
+class ReplicaRouter:
+    """
+    Sends replica reads to the request's replica and everything else to
+    the default database.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = current_read_alias()
+        if alias is None:
+            return None
+        # Reads inside a transaction must see its uncommitted writes
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        # Also for instances that were read from a replica
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_config()['REPLICAS']}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema from the primary
+        if db in get_config()['REPLICAS']:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Chooses the database for the reads of each request and records writes
+    for read-your-writes stickiness.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = get_config()
+        if not config['REPLICAS']:
+            return self.get_response(request)
+
+        token = _current.set(ReplicaRouting())
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            token_key = request_token_key(request)
+            if token_key is not None:
+                stick_to_primary(token_key)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        routing = _current.get()
+        if routing is None or request.method not in SAFE_METHODS:
+            return None
+        config = get_config()
+        if request.resolver_match.url_name not in config['VIEWS']:
+            return None
+        if is_sticky(request, config):
+            return None
+        # One replica per request, so its reads see one consistent state
+        routing.read_alias = random.choice(config['REPLICAS'])
+        return None
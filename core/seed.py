@@ -0,0 +1,178 @@
+"""
+Module core.seed
+
+Generates a synthetic marketplace (users, profiles, offers with three tiers,
+orders and reviews) with bulk inserts, for benchmarks and query plans.
+
+Bulk inserts bypass model signals, so the state those signals maintain is
+written explicitly: offer detail summaries, per-business order counters,
+rating summaries, the site statistics and the offer response cache
+generation. The offer search index is kept current
+by its database triggers.
+"""
+
+import random
+import secrets
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+
+from offers_app.cache import offer_response_cache
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import Order
+from profile_app.models import BusinessProfile, CustomerProfile
+from reviews_app.models import Review
+
+SEED_PASSWORD = 'benchmark'
+
+TIERS = [
+    # offer_type, revisions, price range, delivery range
+    ('basic', 1, (20, 150), (5, 14)),
+    ('standard', 3, (150, 600), (3, 10)),
+    ('premium', -1, (600, 3000), (1, 7)),
+]
+
+# Order status → share of all orders
+STATUS_MIX = {'completed': 0.6, 'in_progress': 0.25, 'cancelled': 0.15}
+
+WORDS = [
+    'logo', 'design', 'website', 'shop', 'seo', 'video', 'editing', 'branding',
+    'landing', 'page', 'app', 'flyer', 'copywriting', 'translation', 'podcast',
+    'illustration', 'photo', 'retouch', 'animation', 'wordpress', 'django',
+]
+
+
+def _text(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def _create_users(rng, prefix, role, count, password, batch_size):
+    users = User.objects.bulk_create(
+        [
+            User(username=f'{prefix}_{role}_{i}', email=f'{prefix}_{role}_{i}@example.com',
+                 password=password)
+            for i in range(count)
+        ],
+        batch_size=batch_size,
+    )
+    profile_model = BusinessProfile if role == 'business' else CustomerProfile
+    profile_model.objects.bulk_create(
+        [
+            profile_model(
+                user=user, username=user.username,
+                first_name=rng.choice(WORDS).title(), location=rng.choice(WORDS).title(),
+            )
+            for user in users
+        ],
+        batch_size=batch_size,
+    )
+    return users
+
+
+def seed_marketplace(businesses=50, customers=200, offers_per_business=5,
+                     orders_per_customer=10, reviews_per_customer=2,
+                     days=365, seed=None, prefix=None, batch_size=1000):
+    """
+    Insert a synthetic marketplace in one transaction.
+
+    Args:
+        businesses (int): Number of business users (each with a BusinessProfile).
+        customers (int): Number of customer users (each with a CustomerProfile).
+        offers_per_business (int): Offers per business user, each with three tiers.
+        orders_per_customer (int): Orders per customer on random offer tiers.
+        reviews_per_customer (int): Reviews per customer for distinct businesses.
+        days (int): Orders and reviews are spread over this many past days.
+        seed (int): Random seed for reproducible data (usernames aside).
+        prefix (str): Username prefix; random by default so runs never collide.
+        batch_size (int): Rows per INSERT statement.
+
+    Returns:
+        dict: Number of created rows per kind and the username prefix.
+            All seeded users share the password SEED_PASSWORD.
+    """
+    rng = random.Random(seed)
+    prefix = prefix or f'seed{secrets.token_hex(3)}'
+    password = make_password(SEED_PASSWORD)
+    now = timezone.now()
+
+    with transaction.atomic():
+        business_users = _create_users(rng, prefix, 'business', businesses, password, batch_size)
+        customer_users = _create_users(rng, prefix, 'customer', customers, password, batch_size)
+
+        offers = Offer.objects.bulk_create(
+            [
+                Offer(user=user, title=_text(rng, 3).title(), description=_text(rng, 20))
+                for user in business_users
+                for _ in range(offers_per_business)
+            ],
+            batch_size=batch_size,
+        )
+        details = []
+        for offer in offers:
+            tiers = []
+            for offer_type, revisions, prices, deliveries in TIERS:
+                tiers.append(OfferDetail(
+                    offer=offer, title=offer_type.title(), revisions=revisions,
+                    delivery_time_in_days=rng.randint(*deliveries),
+                    price=rng.randint(*prices),
+                    features=[_text(rng, 2) for _ in range(3)], offer_type=offer_type,
+                ))
+            for field, value in Offer.summarize_details(tiers).items():
+                setattr(offer, field, value)
+            details.extend(tiers)
+        details = OfferDetail.objects.bulk_create(details, batch_size=batch_size)
+        Offer.objects.bulk_update(
+            offers, ['min_price', 'max_price', 'min_delivery_time'], batch_size=batch_size
+        )
+
+        statuses, weights = zip(*STATUS_MIX.items())
+        orders = []
+        for customer in customer_users:
+            for detail in rng.sample(details, min(orders_per_customer, len(details))):
+                orders.append(Order(
+                    customer_user=customer, business_user_id=detail.offer.user_id,
+                    title=detail.title, revisions=detail.revisions,
+                    delivery_time_in_days=detail.delivery_time_in_days,
+                    price=detail.price, features=detail.features,
+                    offer_type=detail.offer_type,
+                    status=rng.choices(statuses, weights)[0],
+                ))
+        orders = Order.objects.bulk_create(orders, batch_size=batch_size)
+        # created_at is auto_now_add on insert; spread it afterwards
+        for order in orders:
+            order.created_at = now - timedelta(seconds=rng.randint(0, days * 86400))
+        Order.objects.bulk_update(orders, ['created_at'], batch_size=batch_size)
+
+        reviews = []
+        for customer in customer_users:
+            for business in rng.sample(business_users, min(reviews_per_customer, len(business_users))):
+                reviews.append(Review(
+                    business_user=business, reviewer=customer,
+                    rating=rng.choices([1, 2, 3, 4, 5], [1, 1, 2, 4, 6])[0],
+                    description=_text(rng, 12),
+                ))
+        reviews = Review.objects.bulk_create(reviews, batch_size=batch_size)
+        for review in reviews:
+            review.updated_at = now - timedelta(seconds=rng.randint(0, days * 86400))
+        Review.objects.bulk_update(reviews, ['updated_at'], batch_size=batch_size)
+
+        # State normally maintained by signals
+        call_command('reconcile_order_counters', stdout=StringIO())
+        call_command('recompute_site_stats', stdout=StringIO())
+        call_command('rebuild_rating_summaries', stdout=StringIO())
+        offer_response_cache.bump_on_commit()
+
+    return {
+        'prefix': prefix,
+        'business_users': len(business_users),
+        'customer_users': len(customer_users),
+        'offers': len(offers),
+        'offer_details': len(details),
+        'orders': len(orders),
+        'reviews': len(reviews),
+    }
@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from core.database import database_from_env, replicas_from_env
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -37,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'core',
     'auth_app',
     'base_info_app',
     'reviews_app',
@@ -50,6 +54,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.metrics.RequestMetricsMiddleware',
+    'core.routers.ReplicaRoutingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -93,13 +99,42 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# SQLite by default; set DATABASE_URL (and the DATABASE_* options, see
+# core/database.py) for PostgreSQL with persistent or pooled connections.
+# DATABASE_REPLICA_URLS adds read replicas for the read-heavy endpoints.
+
 DATABASES = {
+    'default': database_from_env(os.environ, BASE_DIR / 'db.sqlite3'),
+    **replicas_from_env(os.environ, BASE_DIR / 'db.sqlite3'),
+}
+
+DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+
+# Read-replica routing with read-your-writes stickiness (see core/routers.py)
+REPLICA_ROUTING = {
+    'REPLICAS': [alias for alias in DATABASES if alias != 'default'],
+    'STICKY_SECONDS': 5,
+    'CACHE_ALIAS': 'default',
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Use a shared backend (e.g. Redis or Memcached) when running several workers.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'coderr',
     }
 }
 
+# Versioned response cache for public read endpoints (see core/cache.py)
+RESPONSE_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 60,
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -147,8 +182,50 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 3,
 }
 
+# Password hashing for login/registration (see auth_app/hashing.py)
+PASSWORD_HASHING_POOL = {
+    'WORKERS': 2,
+    'MAX_PENDING': 16,
+    'TIMEOUT': 10,
+    'RETRY_AFTER': 1,
+}
+
+# ModelBackend checking passwords in the hashing pool
+AUTHENTICATION_BACKENDS = ['auth_app.backends.PooledModelBackend']
+
+# Stale-while-revalidate cache of /api/base-info/ (see base_info_app/stats.py)
+SITE_STATS_CACHE = {
+    'ALIAS': 'default',
+    'FRESH': 30,
+    'STALE': 300,
+}
+
+# Token → user resolution cache (see core/authentication.py)
+TOKEN_AUTH_CACHE = {
+    'MAX_ENTRIES': 10000,
+    'TIMEOUT': 60,
+    'ALIAS': None,
+}
+
+# Per-endpoint request metrics and slow-request log (see core/metrics.py)
+METRICS = {
+    'ENABLED': True,
+    'HEADERS': DEBUG,
+    'SLOW_REQUEST_MS': 500,
+    'SLOW_MAX_QUERIES': 200,
+    'SLOW_EXCLUDE_VIEWS': ('login', 'registration'),
+}
+
 # upload root
 MEDIA_ROOT = BASE_DIR / "media"
 
 # browser url
-MEDIA_URL = "/media/"
\ No newline at end of file
+MEDIA_URL = "/media/"
+
+# Downscaled offer image variants (see offers_app/images.py)
+OFFER_IMAGE_VARIANTS = {
+    'WIDTHS': [320, 640, 1280],
+    'FORMATS': ['webp', 'jpeg'],
+    'QUALITY': 80,
+    'ASYNC': True,
+}
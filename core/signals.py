@@ -0,0 +1,48 @@
+"""
+Module core.signals
+
+Invalidates cached token resolutions (core.authentication.token_cache) when
+a token is deleted or replaced, and when its user is saved, deleted or
+logged out. Each invalidation is repeated once the transaction commits, so
+a concurrent request cannot re-cache the state from before the write.
+"""
+
+from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_logged_out
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from core.authentication import token_cache
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token(sender, instance, **kwargs):
+    """
+    Forget a token on logout (deletion) or rotation.
+    """
+    key = instance.key
+    token_cache.invalidate(key)
+    transaction.on_commit(lambda: token_cache.invalidate(key))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_tokens(sender, instance, created=False, **kwargs):
+    """
+    Forget a user's tokens after any change to the user, e.g. deactivation
+    or a password change, so the next request reloads the user.
+    """
+    if created:
+        return
+    user_id = instance.pk
+    token_cache.invalidate_user(user_id)
+    transaction.on_commit(lambda: token_cache.invalidate_user(user_id))
+
+
+@receiver(user_logged_out)
+def invalidate_logged_out_user(sender, request, user, **kwargs):
+    if user is not None:
+        token_cache.invalidate_user(user.pk)
@@ -0,0 +1,6 @@
+"""
+Package core.sqlite
+
+SQLite database backend tuned for small deployments (ENGINE 'core.sqlite');
+see core.sqlite.base.
+"""
@@ -0,0 +1,135 @@
+"""
+Module core.sqlite.base
+
+Django's SQLite backend with performance pragmas and serialized writes.
+
+Every new connection gets WAL journaling (readers no longer block behind a
+writer), synchronous=NORMAL, a memory map, a larger page cache and a busy
+timeout. Writes from all threads of the process go through one lock per
+database file:
+
+    - transactions (atomic blocks) take it at BEGIN and hold it until
+      COMMIT or ROLLBACK; they start with BEGIN IMMEDIATE, so a
+      transaction never fails later when upgrading from a read lock,
+    - writes outside a transaction take it for the single statement.
+
+Threads thus queue for the write lock instead of polling SQLite's busy
+handler and running into "database is locked", while reads go ahead
+concurrently. Other processes on the same file are still coordinated by
+SQLite itself (BEGIN IMMEDIATE plus the busy timeout).
+
+Configuration (DATABASES[alias]['OPTIONS'], all optional):
+    pragmas:          PRAGMA name → value, merged over DEFAULT_PRAGMAS.
+    serialize_writes: Use the in-process write lock (default True).
+    transaction_mode: As for Django's backend; defaults to 'IMMEDIATE'.
+"""
+
+import threading
+
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+from django.db.utils import OperationalError
+
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64000,  # negative: KiB, i.e. 64 MB
+    'busy_timeout': 5000,  # ms; also bounds the wait for the write lock
+    'temp_store': 'MEMORY',
+}
+
+# Statements that never need the write lock outside a transaction
+READ_STATEMENTS = ('SELECT', 'PRAGMA', 'EXPLAIN')
+
+_write_locks = {}
+_write_locks_guard = threading.Lock()
+
+
+def write_lock_for(name):
+    """
+    Return the process-wide write lock of a database file.
+    """
+    with _write_locks_guard:
+        return _write_locks.setdefault(str(name), threading.Lock())
+
+
+class DatabaseWrapper(SQLiteDatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pragmas = dict(DEFAULT_PRAGMAS)
+        self.serialize_writes = True
+        self._holds_write_lock = False
+        self.execute_wrappers.append(self._serialize_autocommit_write)
+
+    @property
+    def write_lock(self):
+        return write_lock_for(self.settings_dict['NAME'])
+
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        self.pragmas = {**DEFAULT_PRAGMAS, **kwargs.pop('pragmas', {})}
+        self.serialize_writes = kwargs.pop('serialize_writes', True)
+        # Take SQLite's write lock at BEGIN rather than at the first write
+        self.transaction_mode = self.transaction_mode or 'IMMEDIATE'
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    # --- Write serialization ---
+
+    def _acquire_write_lock(self):
+        if not self.serialize_writes or self._holds_write_lock:
+            return
+        if not self.write_lock.acquire(timeout=self.pragmas['busy_timeout'] / 1000):
+            raise OperationalError("database is locked (timed out waiting for the write lock)")
+        self._holds_write_lock = True
+
+    def _release_write_lock(self):
+        if self._holds_write_lock:
+            self._holds_write_lock = False
+            self.write_lock.release()
+
+    def _start_transaction_under_autocommit(self):
+        self._acquire_write_lock()
+        try:
+            super()._start_transaction_under_autocommit()
+        except BaseException:
+            self._release_write_lock()
+            raise
+
+    def _commit(self):
+        # A failed COMMIT keeps the lock until the following rollback
+        result = super()._commit()
+        self._release_write_lock()
+        return result
+
+    def _rollback(self):
+        try:
+            return super()._rollback()
+        finally:
+            self._release_write_lock()
+
+    def _close(self):
+        try:
+            return super()._close()
+        finally:
+            self._release_write_lock()
+
+    def _serialize_autocommit_write(self, execute, sql, params, many, context):
+        # Transactions already hold the lock; single reads never need it
+        if (
+            not self.serialize_writes
+            or self._holds_write_lock
+            or not self.get_autocommit()
+            or sql.lstrip()[:7].upper().startswith(READ_STATEMENTS)
+        ):
+            return execute(sql, params, many, context)
+        self._acquire_write_lock()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self._release_write_lock()
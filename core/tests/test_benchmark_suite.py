@@ -0,0 +1,24 @@
+from django.test import TestCase
+
+from core.benchmark import ENDPOINTS, Fixtures, run_benchmark, uncovered_url_names
+from core.seed import seed_marketplace
+
+
+class BenchmarkSuiteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_marketplace(businesses=2, customers=4, offers_per_business=2,
+                         orders_per_customer=3, reviews_per_customer=1, seed=0)
+
+    def test_every_api_route_is_benchmarked(self):
+        self.assertEqual(uncovered_url_names(), set())
+
+    def test_single_pass_succeeds(self):
+        # Ein Durchlauf je Endpoint: alles 2xx, Perzentile und Query-Zahlen vorhanden
+        results = run_benchmark(Fixtures(), repeat=1, warmup=0)
+        self.assertEqual([r['name'] for r in results], list(ENDPOINTS))
+        for result in results:
+            self.assertTrue(all(code.startswith('2') for code in result['statuses']), result)
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+            self.assertIn('median', result['queries'])
+            self.assertIn('cache', result)
@@ -0,0 +1,116 @@
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import resolve, reverse
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.cache import ResponseCache
+from core.database import replicas_from_env
+from core.routers import (
+    ReplicaRouter, ReplicaRoutingMiddleware, check_sticky_cache, current_read_alias, stick_to_primary,
+)
+from offers_app.models import Offer
+
+ROUTING = {'REPLICAS': ['replica_1'], 'STICKY_SECONDS': 5, 'CACHE_ALIAS': 'default'}
+
+
+@override_settings(REPLICA_ROUTING=ROUTING)
+class ReplicaRoutingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+
+    def handle(self, method, path, status=200, view=None, **extra):
+        """
+        Führt eine Anfrage durch die Middleware und liefert die Lese-Datenbank
+        zurück, die der Router während der View gewählt hat.
+        """
+        seen = {}
+
+        def default_view(request):
+            seen['alias'] = self.router.db_for_read(Offer)
+            return HttpResponse(status=status)
+
+        view = view or default_view
+
+        middleware = ReplicaRoutingMiddleware(lambda request: (
+            middleware.process_view(request, None, (), {}) or view(request)
+        ))
+        request = getattr(self.factory, method)(path, **extra)
+        request.resolver_match = resolve(path)
+        middleware(request)
+        return seen.get('alias')
+
+    def test_listed_read_uses_replica(self):
+        self.assertEqual(self.handle('get', reverse('offer-list-create')), 'replica_1')
+        self.assertEqual(self.handle('get', reverse('base-info')), 'replica_1')
+
+    def test_unlisted_view_and_writes_use_primary(self):
+        # Bestellungen sind nicht freigegeben, Schreibzugriffe nie
+        self.assertIsNone(self.handle('get', reverse('order-list-create')))
+        self.assertIsNone(self.handle('post', reverse('offer-list-create'), status=201))
+        self.assertEqual(self.router.db_for_write(Offer), DEFAULT_DB_ALIAS)
+        self.assertIsNone(current_read_alias())
+
+    def test_read_your_writes_window(self):
+        # Gleiche Adresse (Load Balancer/NAT): nur der schreibende Token bleibt am Primary
+        auth = {'HTTP_AUTHORIZATION': 'Token abc', 'REMOTE_ADDR': '10.0.0.1'}
+        other = {'HTTP_AUTHORIZATION': 'Token xyz', 'REMOTE_ADDR': '10.0.0.1'}
+        self.handle('post', reverse('offer-list-create'), status=201, **auth)
+        self.assertIsNone(self.handle('get', reverse('offer-list-create'), **auth))
+        self.assertEqual(self.handle('get', reverse('offer-list-create'), **other), 'replica_1')
+        self.assertEqual(self.handle('get', reverse('offer-list-create')), 'replica_1')
+
+    def test_issued_token_is_sticky(self):
+        # Login/Registrierung markieren den ausgegebenen Token
+        stick_to_primary('neu')
+        self.assertIsNone(self.handle('get', reverse('offer-list-create'), HTTP_AUTHORIZATION='Token neu'))
+
+    def test_response_cache_built_from_primary(self):
+        # Ein verzögertes Replikat darf nicht für alle Clients gecacht werden
+        seen = {}
+
+        def build():
+            seen['alias'] = self.router.db_for_read(Offer)
+            return Response({})
+
+        def view(request):
+            seen['view'] = self.router.db_for_read(Offer)
+            return ResponseCache('replica-test').get_or_build(Request(request), build)
+
+        self.handle('get', reverse('offer-list-create'), view=view)
+        self.assertEqual(seen, {'view': 'replica_1', 'alias': None})
+
+    def test_process_local_sticky_cache_warns(self):
+        self.assertEqual([warning.id for warning in check_sticky_cache(None)], ['core.W001'])
+        caches = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://r'}}
+        with override_settings(CACHES=caches):
+            self.assertEqual(check_sticky_cache(None), [])
+        with override_settings(REPLICA_ROUTING={**ROUTING, 'REPLICAS': []}):
+            self.assertEqual(check_sticky_cache(None), [])
+
+    def test_failed_write_is_not_sticky(self):
+        auth = {'HTTP_AUTHORIZATION': 'Token abc'}
+        self.handle('post', reverse('offer-list-create'), status=400, **auth)
+        self.assertEqual(self.handle('get', reverse('offer-list-create'), **auth), 'replica_1')
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate('replica_1', 'offers_app'))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'offers_app'))
+
+    @override_settings(REPLICA_ROUTING={**ROUTING, 'REPLICAS': []})
+    def test_disabled_without_replicas(self):
+        self.assertIsNone(self.handle('get', reverse('offer-list-create')))
+
+    def test_replicas_from_env(self):
+        replicas = replicas_from_env(
+            {'DATABASE_REPLICA_URLS': 'sqlite:///replica.sqlite3, postgres://u:p@replica/coderr'},
+            'db.sqlite3',
+        )
+        self.assertEqual(list(replicas), ['replica_1', 'replica_2'])
+        self.assertEqual(replicas['replica_1']['NAME'], 'replica.sqlite3')
+        self.assertEqual(replicas['replica_2']['HOST'], 'replica')
+        self.assertEqual(replicas['replica_2']['TEST'], {'MIRROR': 'default'})
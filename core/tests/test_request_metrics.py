@@ -0,0 +1,75 @@
+import logging
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.metrics import MetricsRegistry, metrics_registry
+from offers_app.models import Offer
+from profile_app.models import BusinessProfile
+
+User = get_user_model()
+
+
+class RequestMetricsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.biz = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=cls.biz, username='biz')
+        Offer.objects.create(user=cls.biz, title='A', description='D')
+        cls.admin = User.objects.create_user(username='admin', password='pw', is_staff=True)
+        cls.url = reverse('offer-list-create')
+        cls.metrics_url = reverse('metrics')
+
+    def setUp(self):
+        metrics_registry.reset()
+        self.client.force_authenticate(self.admin)
+
+    @override_settings(METRICS={'HEADERS': True, 'SLOW_REQUEST_MS': None})
+    def test_debug_headers(self):
+        resp = self.client.get(self.url, {'page_size': 1})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertGreater(int(resp['X-Query-Count']), 0)
+        self.assertIn('db;dur=', resp['Server-Timing'])
+        self.assertIn('serialize;dur=', resp['Server-Timing'])
+
+    @override_settings(METRICS={'HEADERS': False, 'SLOW_REQUEST_MS': None})
+    def test_prometheus_histograms_per_url_name(self):
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.assertNotIn('X-Query-Count', self.client.get(self.url))
+
+        resp = self.client.get(self.metrics_url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertTrue(resp['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = resp.content.decode()
+        self.assertIn('# TYPE coderr_request_duration_seconds histogram', body)
+        self.assertIn('coderr_requests_total{view="offer-list-create",method="GET",status="200"} 3', body)
+        self.assertIn('coderr_request_queries_count{view="offer-list-create",method="GET"} 3', body)
+        self.assertIn('coderr_request_duration_seconds_bucket{view="offer-list-create",method="GET",le="+Inf"} 3', body)
+        self.assertIn('coderr_request_serialization_duration_seconds_sum{view="offer-list-create"', body)
+
+    def test_metrics_staff_only(self):
+        self.client.force_authenticate(self.biz)
+        resp = self.client.get(self.metrics_url)
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(METRICS={'SLOW_REQUEST_MS': 0})
+    def test_slow_request_log_lists_queries(self):
+        with self.assertLogs('core.metrics.slow', level=logging.WARNING) as logs:
+            self.client.get(self.url)
+        self.assertIn('(offer-list-create)', logs.output[0])
+        self.assertIn('SELECT', logs.output[0])
+
+    @override_settings(METRICS={'SLOW_REQUEST_MS': 0})
+    def test_auth_endpoints_not_logged_as_slow(self):
+        # Passwort-Hashing ist absichtlich langsam
+        with self.assertNoLogs('core.metrics.slow', level=logging.WARNING):
+            self.client.post(reverse('login'), {'username': 'biz', 'password': 'falsch'}, format='json')
+
+    def test_histogram_sum_keeps_full_precision(self):
+        registry = MetricsRegistry()
+        registry.record('v', 'GET', 200, {'request_queries': 1234567})
+        self.assertIn('coderr_request_queries_sum{view="v",method="GET"} 1234567.0', registry.render())
@@ -0,0 +1,25 @@
+import tempfile
+from unittest import TestCase
+
+from core.database import database_from_env
+from core.management.commands.benchmark_sqlite_concurrency import run_concurrency_benchmark
+
+
+# unittest statt SimpleTestCase: der Benchmark verbindet sich über einen eigenen,
+# temporären Alias, den Djangos Testklassen nicht zulassen
+class SQLiteTuningTests(TestCase):
+    def test_tuning_flag_selects_tuned_backend(self):
+        config = database_from_env({'DATABASE_SQLITE_TUNING': 'on'}, 'db.sqlite3')
+        self.assertEqual(config['ENGINE'], 'core.sqlite')
+        config = database_from_env({}, 'db.sqlite3')
+        self.assertEqual(config['ENGINE'], 'django.db.backends.sqlite3')
+
+    def test_tuned_backend_serializes_concurrent_writes(self):
+        # Parallele Schreiber dürfen nie auf "database is locked" laufen
+        with tempfile.TemporaryDirectory() as directory:
+            result = run_concurrency_benchmark('tuned', directory, writers=4, readers=2,
+                                               seconds=0.5, orders=200)
+        self.assertEqual(result['journal_mode'], 'wal')
+        self.assertEqual(result['writes']['errors'], {})
+        self.assertEqual(result['reads']['errors'], {})
+        self.assertGreater(result['writes']['ops_per_s'], 0)
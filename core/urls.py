@@ -4,6 +4,7 @@ URL configuration for the Core Django project.
 Routes include:
 - Admin site
 - API endpoints from each app (authentication, base info, profiles, offers, reviews, orders)
+- Response cache statistics and request metrics
 - Static media serving in DEBUG mode
 """
 from django.contrib import admin
@@ -11,6 +12,8 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.urls import path, include
 
+from core.views import CacheStatsView, MetricsView
+
 
 # Root URL patterns for the project
 urlpatterns = [
@@ -34,6 +37,12 @@ urlpatterns = [
 
     # Order endpoints: CRUD operations and count endpoints
     path('api/', include('orders_app.api.urls')),
+
+    # Response cache hit/miss counters (staff only)
+    path('api/cache-stats/', CacheStatsView.as_view(), name='cache-stats'),
+
+    # Per-endpoint request metrics in Prometheus format (staff only)
+    path('api/metrics/', MetricsView.as_view(), name='metrics'),
 ]
 
 # Serve media files (user-uploaded content) in development
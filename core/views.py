@@ -0,0 +1,42 @@
+"""
+Module core.views
+
+Project-level API views that do not belong to a single app.
+"""
+
+from django.http import HttpResponse
+from rest_framework import permissions
+from core.authentication import CachedTokenAuthentication
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.cache import response_cache_stats
+from core.metrics import metrics_registry
+
+
+class CacheStatsView(APIView):
+    """
+    GET /api/cache-stats/ → Hit/miss counters of the response caches (staff only).
+
+    Counters are kept per worker process.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(response_cache_stats())
+
+
+class MetricsView(APIView):
+    """
+    GET /api/metrics/ → Request metrics in the Prometheus text format (staff only).
+
+    Metrics are kept per worker process.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(
+            metrics_registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8'
+        )
@@ -1,6 +1,8 @@
 from rest_framework import serializers
+from offers_app.images import variant_srcsets
 from offers_app.models import Offer, OfferDetail
-from profile_app.models import BusinessProfile, CustomerProfile
+from profile_app.resolver import profile_resolver
+from reviews_app.models import BusinessRatingSummary
 
 
 class OfferDetailLinkSerializer(serializers.ModelSerializer):
@@ -60,11 +62,15 @@ class OfferSerializer(serializers.ModelSerializer):
     - min_price: Lowest price among related details.
     - min_delivery_time: Shortest delivery time among related details.
     - user_details: Basic info about the offer creator from their profile.
+    - image_srcset: srcset strings of the downscaled image variants per format.
+    - creator_rating: Maintained rating summary of the offer creator.
     """
     details = OfferDetailLinkSerializer(many=True, read_only=True)
     min_price = serializers.SerializerMethodField()
     min_delivery_time = serializers.SerializerMethodField()
     user_details = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
+    creator_rating = serializers.SerializerMethodField()
 
     class Meta:
         model = Offer
@@ -73,6 +79,7 @@ class OfferSerializer(serializers.ModelSerializer):
             'user',
             'title',
             'image',
+            'image_srcset',
             'description',
             'created_at',
             'updated_at',
@@ -80,11 +87,14 @@ class OfferSerializer(serializers.ModelSerializer):
             'min_price',
             'min_delivery_time',
             'user_details',
+            'creator_rating',
         ]
+        # The creator is always taken from the authenticated request
+        read_only_fields = ['user']
 
     def get_min_price(self, obj):
         """
-        Compute the lowest price among this Offer's details.
+        Return the lowest price among this Offer's details (stored on the Offer).
 
         Args:
             obj (Offer): The Offer instance.
@@ -92,12 +102,11 @@ class OfferSerializer(serializers.ModelSerializer):
         Returns:
             float or None: Minimum price, or None if no details exist.
         """
-        details = obj.details.order_by('price')
-        return int(details.first().price) if details.exists() else None
+        return int(obj.min_price) if obj.min_price is not None else None
 
     def get_min_delivery_time(self, obj):
         """
-        Compute the shortest delivery time among this Offer's details.
+        Return the shortest delivery time among this Offer's details (stored on the Offer).
 
         Args:
             obj (Offer): The Offer instance.
@@ -105,14 +114,36 @@ class OfferSerializer(serializers.ModelSerializer):
         Returns:
             int or None: Minimum delivery_time_in_days, or None if no details exist.
         """
-        details = obj.details.order_by('delivery_time_in_days')
-        return details.first().delivery_time_in_days if details.exists() else None
+        return obj.min_delivery_time
+
+    def get_image_srcset(self, obj):
+        """
+        Return srcset strings for the generated image variants.
+
+        Args:
+            obj (Offer): The Offer instance.
+
+        Returns:
+            dict: Format ("webp", "jpeg") to srcset string; empty until the
+            variants have been generated.
+        """
+        return variant_srcsets(obj.image_variants, self.context.get('request'))
+
+    def get_creator_rating(self, obj):
+        """
+        Return review count, average rating and histogram of the offer creator.
+
+        Reads the select_related rating summary, so no query is issued.
+        """
+        return BusinessRatingSummary.data_for(obj.user)
 
     def get_user_details(self, obj):
         """
         Retrieve brief profile information for the offer creator.
 
-        Checks for a BusinessProfile first, then CustomerProfile.
+        Resolved through the request's ProfileResolver: free when the creator
+        was loaded with the profiles joined, otherwise one query per user and
+        request.
 
         Args:
             obj (Offer): The Offer instance.
@@ -120,10 +151,7 @@ class OfferSerializer(serializers.ModelSerializer):
         Returns:
             dict: Contains 'first_name', 'last_name', 'username', or empty dict if no profile.
         """
-        profile = (
-            BusinessProfile.objects.filter(user=obj.user).first() or
-            CustomerProfile.objects.filter(user=obj.user).first()
-        )
+        profile = profile_resolver(self.context.get('request')).for_user(obj.user)
         if profile:
             return {
                 'first_name': profile.first_name,
@@ -142,6 +170,8 @@ class OfferRetrieveSerializer(serializers.ModelSerializer):
     details = OfferDetailLinkSerializer(many=True, read_only=True)
     min_price = serializers.SerializerMethodField()
     min_delivery_time = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
+    creator_rating = serializers.SerializerMethodField()
 
     class Meta:
         model = Offer
@@ -150,24 +180,36 @@ class OfferRetrieveSerializer(serializers.ModelSerializer):
             'user',
             'title',
             'image',
+            'image_srcset',
             'description',
             'created_at',
             'updated_at',
             'details',
             'min_price',
             'min_delivery_time',
+            'creator_rating',
         ]
 
     def get_min_price(self, obj):
         """
-        Compute the lowest price among this Offer's details.
+        Return the lowest price among this Offer's details (stored on the Offer).
         """
-        details = obj.details.order_by('price')
-        return float(details.first().price) if details.exists() else None
+        return float(obj.min_price) if obj.min_price is not None else None
+
+    def get_creator_rating(self, obj):
+        """
+        Return the maintained rating summary of the offer creator.
+        """
+        return BusinessRatingSummary.data_for(obj.user)
 
     def get_min_delivery_time(self, obj):
         """
-        Compute the shortest delivery time among this Offer's details.
+        Return the shortest delivery time among this Offer's details (stored on the Offer).
+        """
+        return obj.min_delivery_time
+
+    def get_image_srcset(self, obj):
+        """
+        Return srcset strings for the generated image variants.
         """
-        details = obj.details.order_by('delivery_time_in_days')
-        return details.first().delivery_time_in_days if details.exists() else None
+        return variant_srcsets(obj.image_variants, self.context.get('request'))
@@ -1,6 +1,7 @@
 from django.urls import path
 from offers_app.api.views import (
     OfferListCreateView,
+    OfferBulkCreateView,
     OfferRetrieveUpdateDestroyView,
     OfferDetailRetrieveView
 )
@@ -10,6 +11,7 @@ URL patterns for the offers API endpoints.
 
 - /api/offers/ [GET]:   List all offers (supports pagination, filtering, search, ordering)
 - /api/offers/ [POST]:  Create a new offer (requires authentication as a business user)
+- /api/offers/bulk/ [POST]: Create many offers in one request (business user, all or nothing)
 - /api/offers/<int:pk>/ [GET]:    Retrieve a single offer by its ID
 - /api/offers/<int:pk>/ [PATCH]:  Partially update an existing offer (owner only)
 - /api/offers/<int:pk>/ [DELETE]: Delete an existing offer (owner only)
@@ -20,6 +22,9 @@ urlpatterns = [
     # List existing offers or create a new one
     path('offers/', OfferListCreateView.as_view(), name='offer-list-create'),
 
+    # Create many offers with their details in a single request
+    path('offers/bulk/', OfferBulkCreateView.as_view(), name='offer-bulk-create'),
+
     # Retrieve, update, or delete a specific offer by its primary key
     path('offers/<int:pk>/', OfferRetrieveUpdateDestroyView.as_view(), name='offer-detail'),
 
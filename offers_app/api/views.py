@@ -1,14 +1,106 @@
 from rest_framework import generics, permissions, status, filters
-from rest_framework.authentication import TokenAuthentication
+from core.authentication import CachedTokenAuthentication
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
-from django.db import models
-
+from rest_framework.views import APIView
+from django.db import transaction
+
+from base_info_app.models import SiteStats
+from base_info_app.stats import invalidate_site_stats
+from core.cache import ResponseCacheMixin
+from core.conditional import ConditionalGetMixin, make_etag
+from core.pagination import KeysetCursorPagination
+from offers_app.cache import offer_response_cache
 from offers_app.models import Offer, OfferDetail
 from offers_app.api.serializers import OfferSerializer, OfferDetailSerializer
+from offers_app.search import search_offers
 from profile_app.models import BusinessProfile
+from profile_app.resolver import PROFILE_RELATIONS
+
+
+def offer_list_queryset():
+    """
+    Base queryset for serializing offers without per-row queries.
+
+    The detail minimums are stored on Offer itself; this joins the creator's
+    profiles and rating summary (which ProfileResolver.for_user then reads)
+    and prefetches the details so a page of offers costs a constant number
+    of queries.
+    """
+    return (
+        Offer.objects
+        .select_related(*(f'user__{name}' for name in PROFILE_RELATIONS))
+        .prefetch_related('details')
+    )
+
+
+MIN_OFFER_DETAILS = 3
+
+# OfferDetail fields that may be changed through PATCH /api/offers/{id}/
+DETAIL_UPDATE_FIELDS = ['title', 'revisions', 'delivery_time_in_days', 'price', 'features']
+
+
+def validate_offer_payload(data):
+    """
+    Validate an offer payload together with all of its detail entries.
+
+    Args:
+        data (dict): Offer fields plus a 'details' list.
+
+    Returns:
+        tuple: (offer_serializer, details, errors). On success errors is None
+        and details holds unsaved OfferDetail instances; otherwise the first
+        two items are None and errors is a dict for the response body.
+    """
+    details = data.get('details', [])
+
+    # Ensure at least three detail objects
+    if not isinstance(details, list) or len(details) < MIN_OFFER_DETAILS:
+        return None, None, {"details": "An offer must include at least 3 detail items."}
+
+    offer_serializer = OfferSerializer(data=data)
+    detail_serializer = OfferDetailSerializer(data=details, many=True)
+    offer_valid = offer_serializer.is_valid()
+    details_valid = detail_serializer.is_valid()
+    if not (offer_valid and details_valid):
+        errors = dict(offer_serializer.errors)
+        if not details_valid:
+            errors['details'] = detail_serializer.errors
+        return None, None, errors
+
+    details = [OfferDetail(**item) for item in detail_serializer.validated_data]
+    return offer_serializer, details, None
+
+
+def save_offer_with_details(offer_serializer, details, user):
+    """
+    Save a validated offer and bulk insert its details.
+
+    The summary columns are computed from the in-memory details, so the
+    offer is written once. Must be called inside a transaction.
+
+    Returns:
+        tuple: The saved Offer and its saved OfferDetail instances.
+    """
+    offer = offer_serializer.save(user=user, **Offer.summarize_details(details))
+    for detail in details:
+        detail.offer = offer
+    return offer, OfferDetail.objects.bulk_create(details)
+
+
+def offer_response_data(offer, details):
+    """
+    Build the create/update response body for an offer and its details.
+    """
+    return {
+        "id": offer.id,
+        "title": offer.title,
+        "image": offer.image.url if offer.image else None,
+        "description": offer.description,
+        "details": OfferDetailSerializer(details, many=True).data
+    }
 
 
 class OfferPagination(PageNumberPagination):
@@ -18,6 +110,23 @@ class OfferPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
 
 
+class OfferCursorPagination(KeysetCursorPagination):
+    """
+    Opt-in keyset pagination for the offer feed (?pagination=cursor).
+
+    Returns opaque next/previous cursors and no total count, so deep pages
+    cost the same as the first one. Ties are broken by offer ID.
+    """
+    page_size = 3
+    ordering_options = {
+        '-updated_at': ('-updated_at', '-id'),
+        'updated_at': ('updated_at', 'id'),
+        '-min_price': ('-min_price', '-id'),
+        'min_price': ('min_price', 'id'),
+    }
+    default_ordering = '-updated_at'
+
+
 class IsBusinessUser(permissions.BasePermission):
     """
     Permission class to allow only business users to create or modify offers.
@@ -28,21 +137,37 @@ class IsBusinessUser(permissions.BasePermission):
         return BusinessProfile.objects.filter(user=request.user).exists()
 
 
-class OfferListCreateView(generics.ListCreateAPIView):
+class OfferListCreateView(ResponseCacheMixin, generics.ListCreateAPIView):
     """
     GET  /api/offers/ → List all offers, with pagination, filtering, search, and ordering support.
+                        Add ?pagination=cursor for keyset pagination without a total count.
+                        Responses are served from the offer response cache.
     POST /api/offers/ → Create a new offer (requires authentication and business user),
                         with minimum of 3 detail items.
     """
-    queryset = Offer.objects.all().order_by('-updated_at')
+    queryset = offer_list_queryset().order_by('-updated_at')
     serializer_class = OfferSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.AllowAny]
     pagination_class = OfferPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    response_cache_namespace = offer_response_cache.namespace
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['user']
-    search_fields = ['title', 'description']
-    ordering_fields = ['updated_at']
+    ordering_fields = ['updated_at', 'min_price']
+
+    @property
+    def paginator(self):
+        """
+        Use cursor pagination when requested via ?pagination=cursor or when
+        a cursor is supplied; page-number pagination otherwise.
+        """
+        if not hasattr(self, '_paginator'):
+            params = self.request.query_params
+            if params.get('pagination') == 'cursor' or 'cursor' in params:
+                self._paginator = OfferCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_permissions(self):
         """
@@ -63,85 +188,132 @@ class OfferListCreateView(generics.ListCreateAPIView):
         if creator := params.get('creator_id'):
             qs = qs.filter(user_id=creator)
 
-        # Filter by minimum detail price
+        # Filter by minimum detail price (some detail costs at least min_price)
         if minp := params.get('min_price'):
             try:
                 minp_val = float(minp)
             except ValueError:
                 raise ValidationError({"min_price": "Must be a number."})
-            qs = qs.filter(details__price__gte=minp_val)
+            qs = qs.filter(max_price__gte=minp_val)
 
-        # Filter by maximum delivery time
+        # Filter by maximum delivery time (some detail is delivered in time)
         if maxt := params.get('max_delivery_time'):
             try:
                 maxt_val = int(maxt)
             except ValueError:
                 raise ValidationError({"max_delivery_time": "Must be an integer."})
-            qs = qs.filter(details__delivery_time_in_days__lte=maxt_val)
+            qs = qs.filter(min_delivery_time__lte=maxt_val)
 
-        # Search in title or description
+        # Full-text search in title or description, most relevant first
         if search := params.get('search'):
-            qs = qs.filter(
-                models.Q(title__icontains=search) |
-                models.Q(description__icontains=search)
-            )
+            qs = search_offers(qs, search).order_by('-search_rank', '-updated_at')
 
         # Apply ordering if provided
         if order := params.get('ordering'):
             qs = qs.order_by(order)
 
-        return qs.distinct()
+        return qs
 
     def create(self, request, *args, **kwargs):
         """
         Create a new Offer instance along with its OfferDetail items.
 
-        Validates that at least 3 detail entries are provided, assigns current user,
-        and returns the newly created offer with full detail list.
+        Validates the offer and all of its detail entries (at least 3) up front,
+        then writes the offer and its details with one insert each inside a
+        single transaction. The response is built from the saved objects.
         """
-        data = request.data.copy()
-        data['user'] = request.user.id
-        details = data.get('details', [])
+        offer_serializer, details, errors = validate_offer_payload(request.data)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            offer, details = save_offer_with_details(offer_serializer, details, request.user)
+
+        return Response(offer_response_data(offer, details), status=status.HTTP_201_CREATED)
+
+
+class OfferBulkCreateView(APIView):
+    """
+    POST /api/offers/bulk/ → Create many offers with their details in one request
+                             (requires authentication and business user).
+
+    Expects a JSON list of offer payloads in the same format as POST /api/offers/.
+    Either all offers are created or, if any payload is invalid, none are.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated, IsBusinessUser]
+    max_batch_size = 100
 
-        # Ensure at least three detail objects
-        if not isinstance(details, list) or len(details) < 3:
+    def post(self, request):
+        """
+        Validate every payload, then bulk insert all offers and all details.
+
+        Returns the created offers in request order, or a list of per-offer
+        errors (empty dicts for valid entries) with HTTP 400.
+        """
+        payloads = request.data
+        if not isinstance(payloads, list) or not payloads:
             return Response(
-                {"details": "An offer must include at least 3 detail items."},
+                {"detail": "Expected a non-empty list of offers."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(payloads) > self.max_batch_size:
+            return Response(
+                {"detail": f"At most {self.max_batch_size} offers per request."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Serialize and save the Offer
-        serializer = OfferSerializer(data=data)
-        serializer.is_valid(raise_exception=True)
-        offer = serializer.save(user=request.user)
-
-        # Create OfferDetail entries
-        for detail_data in details:
-            OfferDetail.objects.create(offer=offer, **detail_data)
-
-        # Build full response including details
-        full_details = OfferDetail.objects.filter(offer=offer)
-        detail_data = OfferDetailSerializer(full_details, many=True).data
-
-        response_data = {
-            "id": offer.id,
-            "title": offer.title,
-            "image": offer.image.url if offer.image else None,
-            "description": offer.description,
-            "details": detail_data
-        }
+        validated, all_errors = [], []
+        for payload in payloads:
+            if not isinstance(payload, dict):
+                all_errors.append({"detail": "Expected an offer object."})
+                continue
+            offer_serializer, details, errors = validate_offer_payload(payload)
+            all_errors.append(errors or {})
+            validated.append((offer_serializer, details))
+        if any(all_errors):
+            return Response(all_errors, status=status.HTTP_400_BAD_REQUEST)
+
+        offers = []
+        for offer_serializer, details in validated:
+            offers.append(Offer(
+                **offer_serializer.validated_data,
+                user=request.user,
+                **Offer.summarize_details(details)
+            ))
+
+        with transaction.atomic():
+            Offer.objects.bulk_create(offers)
+            all_details = []
+            for offer, (_, details) in zip(offers, validated):
+                for detail in details:
+                    detail.offer = offer
+                all_details.extend(details)
+            OfferDetail.objects.bulk_create(all_details)
+            # bulk_create sends no signals
+            offer_response_cache.bump_on_commit()
+            SiteStats.adjust(offer_count=len(offers))
+            invalidate_site_stats()
+
+        response_data = [
+            offer_response_data(offer, details)
+            for offer, (_, details) in zip(offers, validated)
+        ]
         return Response(response_data, status=status.HTTP_201_CREATED)
 
 
-class OfferRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class OfferRetrieveUpdateDestroyView(ConditionalGetMixin, ResponseCacheMixin,
+                                     generics.RetrieveUpdateDestroyAPIView):
     """
-    GET    /api/offers/{id}/   → Retrieve offer details.
+    GET    /api/offers/{id}/   → Retrieve offer details (served from the offer response cache,
+                                 supports ETag / Last-Modified conditional requests).
     PATCH  /api/offers/{id}/   → Update main fields and optional details (only creator).
     DELETE /api/offers/{id}/   → Delete the offer (only creator).
     """
-    queryset = Offer.objects.all()
-    authentication_classes = [TokenAuthentication]
+    queryset = offer_list_queryset()
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
+    response_cache_namespace = offer_response_cache.namespace
 
     def get_serializer_class(self):
         """
@@ -149,11 +321,33 @@ class OfferRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         """
         return OfferSerializer
 
+    def get_validators(self, request, pk):
+        """
+        Derive ETag and Last-Modified from the offer, its stored detail summary,
+        image variants, the creator's profile version and rating summary with a
+        single metadata query.
+        """
+        row = Offer.objects.filter(pk=pk).values(
+            'updated_at',
+            'min_price',
+            'min_delivery_time',
+            'image_variants',
+            'user__businessprofile__updated_at',
+            'user__customerprofile__updated_at',
+            'user__rating_summary__updated_at',
+        ).first()
+        if row is None:
+            return None
+        last_modified = max(value for key, value in row.items() if key.endswith('updated_at') and value)
+        return make_etag('offer', pk, *row.values()), last_modified
+
     def patch(self, request, *args, **kwargs):
         """
         Partially update the Offer and its related details.
 
-        Only the original creator may apply changes. Validates detail list if provided.
+        Only the original creator may apply changes. Validates the offer fields and
+        the detail list (matched by offer_type) before writing anything, then saves
+        the offer and all changed details in one transaction.
         """
         offer = self.get_object()
 
@@ -164,12 +358,13 @@ class OfferRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        # Update main fields
+        # Validate main fields
         main_serializer = OfferSerializer(offer, data=request.data, partial=True)
         main_serializer.is_valid(raise_exception=True)
-        main_serializer.save()
 
-        # Update related OfferDetail entries if provided
+        # Apply detail changes in memory to the prefetched details
+        details = list(offer.details.all())
+        touched, touched_fields = {}, set()
         details_data = request.data.get('details')
         if details_data is not None:
             if not isinstance(details_data, list):
@@ -177,39 +372,43 @@ class OfferRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
                     {"details": "Expected a list of detail objects."},
                     status=status.HTTP_400_BAD_REQUEST
                 )
+            by_type = {det.offer_type: det for det in details}
             for d in details_data:
                 # Identify detail by offer_type
-                offer_type = d.get('offer_type')
+                offer_type = d.get('offer_type') if isinstance(d, dict) else None
                 if not offer_type:
                     return Response(
                         {"offer_type": "offer_type field required to identify detail."},
                         status=status.HTTP_400_BAD_REQUEST
                     )
-                try:
-                    det = OfferDetail.objects.get(offer=offer, offer_type=offer_type)
-                except OfferDetail.DoesNotExist:
+                det = by_type.get(offer_type)
+                if det is None:
                     return Response(
                         {"details": f"No detail found for offer_type '{offer_type}'."},
                         status=status.HTTP_400_BAD_REQUEST
                     )
+                detail_serializer = OfferDetailSerializer(det, data=d, partial=True)
+                if not detail_serializer.is_valid():
+                    return Response(
+                        {"details": detail_serializer.errors},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
                 # Update fields on the detail object
-                for field in ['title', 'revisions', 'delivery_time_in_days', 'price', 'features']:
-                    if field in d:
-                        setattr(det, field, d[field])
-                det.save()
-
-        # Rebuild response with updated details
-        full_details = OfferDetail.objects.filter(offer=offer)
-        detail_data = OfferDetailSerializer(full_details, many=True).data
-
-        response_data = {
-            "id": offer.id,
-            "title": offer.title,
-            "image": offer.image.url if offer.image else None,
-            "description": offer.description,
-            "details": detail_data
-        }
-        return Response(response_data, status=status.HTTP_200_OK)
+                for field in DETAIL_UPDATE_FIELDS:
+                    if field in detail_serializer.validated_data:
+                        setattr(det, field, detail_serializer.validated_data[field])
+                        touched_fields.add(field)
+                touched[det.pk] = det
+
+        # Persist offer (with refreshed summary) and all touched details at once
+        with transaction.atomic():
+            main_serializer.save(**Offer.summarize_details(details))
+            if touched:
+                OfferDetail.objects.bulk_update(
+                    touched.values(), sorted(touched_fields)
+                )
+
+        return Response(offer_response_data(offer, details), status=status.HTTP_200_OK)
 
     def delete(self, request, *args, **kwargs):
         """
@@ -232,5 +431,5 @@ class OfferDetailRetrieveView(generics.RetrieveAPIView):
     """
     queryset = OfferDetail.objects.all()
     serializer_class = OfferDetailSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
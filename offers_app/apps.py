@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class OffersAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'offers_app'
+
+    def ready(self):
+        # Register signal handlers for the Offer summary columns
+        from offers_app import signals  # noqa: F401
+        from offers_app.search import install_search_index_after_migrate
+
+        # (Re)install the full-text index once the offers table is migrated
+        post_migrate.connect(install_search_index_after_migrate, sender=self)
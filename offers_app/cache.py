@@ -0,0 +1,10 @@
+"""
+Module offers_app.cache
+
+Response cache shared by the public offer read endpoints. Its generation is
+bumped on every Offer, OfferDetail or profile write (see offers_app.signals).
+"""
+
+from core.cache import get_response_cache
+
+offer_response_cache = get_response_cache('offers')
@@ -0,0 +1,227 @@
+"""
+Module offers_app.images
+
+Generates downscaled WebP/JPEG variants of offer images with Pillow.
+
+New or replaced images are queued after the saving transaction commits and
+processed by a local background worker thread, so uploads never wait for
+resizing. The resulting file names are stored in Offer.image_variants:
+
+    {
+        "source": "offer_images/logo.png",
+        "webp": {"320": "offer_images/variants/logo_320w.webp", ...},
+        "jpeg": {"320": "offer_images/variants/logo_320w.jpg", ...},
+    }
+
+Configuration (settings.OFFER_IMAGE_VARIANTS):
+    WIDTHS:  Target widths in pixels (never upscaled).
+    FORMATS: Output formats, any of 'webp' and 'jpeg'.
+    QUALITY: Encoder quality (1-100).
+    ASYNC:   Process in the background worker (False runs inline).
+"""
+
+import logging
+import posixpath
+import queue
+import threading
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from PIL import Image, ImageOps
+
+from offers_app.cache import offer_response_cache
+from offers_app.models import Offer
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'WIDTHS': [320, 640, 1280],
+    'FORMATS': ['webp', 'jpeg'],
+    'QUALITY': 80,
+    'ASYNC': True,
+}
+
+FORMAT_EXTENSIONS = {
+    'webp': 'webp',
+    'jpeg': 'jpg',
+}
+
+VARIANT_DIR = 'offer_images/variants'
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, 'OFFER_IMAGE_VARIANTS', {})}
+
+
+def _target_widths(original_width, widths):
+    """
+    Return the configured widths not larger than the original; an image
+    smaller than every target is kept at its own width.
+    """
+    targets = sorted(width for width in widths if width < original_width)
+    return targets or [original_width]
+
+
+def _encode(image, fmt, quality):
+    buffer = BytesIO()
+    if fmt == 'jpeg' and image.mode != 'RGB':
+        # JPEG has no alpha channel: flatten onto white
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        rgba = image.convert('RGBA')
+        background.paste(rgba, mask=rgba.split()[-1])
+        image = background
+    elif fmt == 'webp' and image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+    image.save(buffer, format=fmt.upper(), quality=quality)
+    return ContentFile(buffer.getvalue())
+
+
+def generate_variants(name, storage=default_storage):
+    """
+    Create all configured variants of a stored image.
+
+    Args:
+        name (str): Storage name of the original image.
+        storage (Storage): Storage holding the original and the variants.
+
+    Returns:
+        dict: Variant map as stored in Offer.image_variants.
+    """
+    config = get_config()
+    stem = posixpath.splitext(posixpath.basename(name))[0]
+
+    with storage.open(name, 'rb') as source:
+        original = ImageOps.exif_transpose(Image.open(source))
+        original.load()
+
+    variants = {'source': name}
+    for width in _target_widths(original.width, config['WIDTHS']):
+        height = max(1, round(original.height * width / original.width))
+        resized = original.resize((width, height), Image.LANCZOS)
+        for fmt in config['FORMATS']:
+            target = f'{VARIANT_DIR}/{stem}_{width}w.{FORMAT_EXTENSIONS[fmt]}'
+            saved = storage.save(target, _encode(resized, fmt, config['QUALITY']))
+            variants.setdefault(fmt, {})[str(width)] = saved
+    return variants
+
+
+def variant_names(variants):
+    """
+    Yield every stored file name of a variant map.
+    """
+    for key, by_width in variants.items():
+        if key != 'source':
+            yield from by_width.values()
+
+
+def process_offer_image(offer_id, force=False):
+    """
+    Generate variants for an offer's current image and store the map.
+
+    Skips offers without an image or whose variants are already up to date
+    (unless force is True). Removes the files of a replaced variant set.
+
+    Returns:
+        bool: True if new variants were stored.
+    """
+    offer = Offer.objects.filter(pk=offer_id).only('id', 'image', 'image_variants').first()
+    if offer is None or not offer.image:
+        return False
+    name = offer.image.name
+    previous = offer.image_variants or {}
+    if previous.get('source') == name and not force:
+        return False
+
+    variants = generate_variants(name)
+    # Only store the map if the image was not replaced in the meantime
+    updated = Offer.objects.filter(pk=offer_id, image=name).update(image_variants=variants)
+    if not updated:
+        stale = set(variant_names(variants))
+    else:
+        stale = set(variant_names(previous)) - set(variant_names(variants))
+        offer_response_cache.bump()
+    for stale_name in stale:
+        default_storage.delete(stale_name)
+    return bool(updated)
+
+
+class ImageWorker:
+    """
+    Single background thread processing queued image jobs in order.
+
+    The thread is started lazily on the first job and runs as a daemon, so
+    it never blocks interpreter shutdown.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args):
+        """
+        Queue func(*args) for execution on the worker thread.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='offer-image-worker', daemon=True
+                )
+                self._thread.start()
+        self._queue.put((func, args))
+
+    def join(self):
+        """
+        Block until every queued job has been processed.
+        """
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            func, args = self._queue.get()
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Offer image job %s%r failed", func.__name__, args)
+            finally:
+                # Do not keep a database connection open between jobs
+                connections.close_all()
+                self._queue.task_done()
+
+
+image_worker = ImageWorker()
+
+
+def enqueue_offer_image(offer_id):
+    """
+    Schedule variant generation for an offer once the current transaction
+    commits (immediately in autocommit mode).
+    """
+    if get_config()['ASYNC']:
+        transaction.on_commit(lambda: image_worker.submit(process_offer_image, offer_id))
+    else:
+        transaction.on_commit(lambda: process_offer_image(offer_id))
+
+
+def variant_srcsets(variants, request=None):
+    """
+    Build srcset strings per format from a stored variant map.
+
+    Returns:
+        dict: e.g. {"webp": "<url> 320w, <url> 640w", "jpeg": "..."}.
+    """
+    srcsets = {}
+    for fmt, by_width in (variants or {}).items():
+        if fmt == 'source':
+            continue
+        entries = []
+        for width, name in sorted(by_width.items(), key=lambda item: int(item[0])):
+            url = default_storage.url(name)
+            if request is not None:
+                url = request.build_absolute_uri(url)
+            entries.append(f'{url} {width}w')
+        srcsets[fmt] = ', '.join(entries)
+    return srcsets
@@ -0,0 +1,42 @@
+"""
+Management command to backfill downscaled variants for existing offer images.
+
+Usage:
+    python manage.py generate_offer_image_variants [--force]
+"""
+
+from django.core.management.base import BaseCommand
+
+from offers_app.images import process_offer_image
+from offers_app.models import Offer
+
+
+class Command(BaseCommand):
+    help = "Generate WebP/JPEG variants for offer images that do not have them yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help="Regenerate variants even if they are up to date.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Process every offer with an image synchronously, one at a time.
+        """
+        offer_ids = (
+            Offer.objects.exclude(image='').exclude(image__isnull=True)
+            .values_list('id', flat=True)
+        )
+        generated = failed = 0
+        for offer_id in offer_ids.iterator():
+            try:
+                if process_offer_image(offer_id, force=options['force']):
+                    generated += 1
+            except (OSError, ValueError) as exc:
+                failed += 1
+                self.stderr.write(f"Offer {offer_id}: {exc}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated variants for {generated} offer(s), {failed} failed."
+        ))
@@ -0,0 +1,33 @@
+"""
+Management command to (re)create and repopulate the offer full-text index.
+
+Usage:
+    python manage.py rebuild_offer_search_index [--database ALIAS]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from offers_app.search import install_search_index
+
+
+class Command(BaseCommand):
+    help = "Create the offer full-text search index if missing and rebuild its contents."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to rebuild the index on.",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        if install_search_index(connection, rebuild=True):
+            self.stdout.write(self.style.SUCCESS(
+                f"Offer search index rebuilt on {connection.vendor}."
+            ))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f"No full-text index for {connection.vendor}; searching falls back to icontains."
+            ))
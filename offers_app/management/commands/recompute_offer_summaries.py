@@ -0,0 +1,57 @@
+"""
+Management command to rebuild the denormalized Offer summary columns.
+
+Usage:
+    python manage.py recompute_offer_summaries [--batch-size N]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min
+
+from offers_app.cache import offer_response_cache
+from offers_app.models import Offer
+
+SUMMARY_FIELDS = ['min_price', 'max_price', 'min_delivery_time']
+
+
+class Command(BaseCommand):
+    help = "Recompute min_price, max_price and min_delivery_time for all offers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Number of offers written per bulk update.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Aggregate the details of every offer in one grouped query and write
+        back only the offers whose stored summary differs.
+        """
+        rows = (
+            Offer.objects
+            .annotate(
+                calc_min_price=Min('details__price'),
+                calc_max_price=Max('details__price'),
+                calc_min_delivery_time=Min('details__delivery_time_in_days'),
+            )
+            .only('id', *SUMMARY_FIELDS)
+        )
+
+        stale = []
+        for offer in rows.iterator(chunk_size=options['batch_size']):
+            changed = False
+            for field in SUMMARY_FIELDS:
+                value = getattr(offer, f'calc_{field}')
+                if getattr(offer, field) != value:
+                    setattr(offer, field, value)
+                    changed = True
+            if changed:
+                stale.append(offer)
+
+        Offer.objects.bulk_update(stale, SUMMARY_FIELDS, batch_size=options['batch_size'])
+        if stale:
+            offer_response_cache.bump()
+        self.stdout.write(self.style.SUCCESS(f"Updated {len(stale)} offer(s)."))
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:16
+
+from django.db import migrations, models
+from django.db.models import Max, Min
+
+
+def backfill_detail_summary(apps, schema_editor):
+    Offer = apps.get_model('offers_app', 'Offer')
+    offers = Offer.objects.annotate(
+        calc_min_price=Min('details__price'),
+        calc_max_price=Max('details__price'),
+        calc_min_delivery_time=Min('details__delivery_time_in_days'),
+    )
+    for offer in offers:
+        offer.min_price = offer.calc_min_price
+        offer.max_price = offer.calc_max_price
+        offer.min_delivery_time = offer.calc_min_delivery_time
+    Offer.objects.bulk_update(
+        offers, ['min_price', 'max_price', 'min_delivery_time'], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0002_alter_offerdetail_price'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='max_price',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_detail_summary, reverse_code=migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Max, Min
 from django.contrib.auth.models import User
 
 
@@ -13,6 +14,10 @@ class Offer(models.Model):
         description: Detailed description of the offer.
         created_at: Timestamp when the offer was created.
         updated_at: Timestamp when the offer was last updated.
+        min_price: Lowest price among the offer's details (maintained).
+        max_price: Highest price among the offer's details (maintained).
+        min_delivery_time: Shortest delivery time among the details (maintained).
+        image_variants: Generated downscaled image files (see offers_app.images).
     """
     user = models.ForeignKey(
         User,
@@ -28,6 +33,18 @@ class Offer(models.Model):
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.IntegerField(null=True, blank=True, db_index=True)
+    max_price = models.IntegerField(null=True, blank=True, db_index=True)
+    min_delivery_time = models.IntegerField(null=True, blank=True, db_index=True)
+    image_variants = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        indexes = [
+            # Offer feed: ordering=-updated_at with ID tie-break (list and cursor pages)
+            models.Index(fields=['updated_at', 'id'], name='offer_updated_idx'),
+            # Offer feed filtered by creator_id
+            models.Index(fields=['user', 'updated_at'], name='offer_user_updated_idx'),
+        ]
 
     def __str__(self):
         """
@@ -35,6 +52,49 @@ class Offer(models.Model):
         """
         return self.title
 
+    def compute_detail_summary(self):
+        """
+        Aggregate the price and delivery summary from the stored details.
+
+        Returns:
+            dict: Values for min_price, max_price and min_delivery_time.
+        """
+        return self.details.aggregate(
+            min_price=Min('price'),
+            max_price=Max('price'),
+            min_delivery_time=Min('delivery_time_in_days'),
+        )
+
+    @staticmethod
+    def summarize_details(details):
+        """
+        Compute the summary columns from OfferDetail instances held in memory.
+
+        Args:
+            details (iterable): OfferDetail instances (saved or not).
+
+        Returns:
+            dict: Values for min_price, max_price and min_delivery_time.
+        """
+        prices = [detail.price for detail in details]
+        delivery_times = [detail.delivery_time_in_days for detail in details]
+        return {
+            'min_price': min(prices, default=None),
+            'max_price': max(prices, default=None),
+            'min_delivery_time': min(delivery_times, default=None),
+        }
+
+    def update_detail_summary(self):
+        """
+        Recompute and persist the summary columns from the offer's details.
+
+        Uses a queryset update so updated_at is left untouched.
+        """
+        summary = self.compute_detail_summary()
+        Offer.objects.filter(pk=self.pk).update(**summary)
+        for field, value in summary.items():
+            setattr(self, field, value)
+
 
 class OfferDetail(models.Model):
     """
@@ -61,6 +121,12 @@ class OfferDetail(models.Model):
     features = models.JSONField(default=list)
     offer_type = models.CharField(max_length=50)
 
+    class Meta:
+        indexes = [
+            # Detail lookup by tier when updating an offer
+            models.Index(fields=['offer', 'offer_type'], name='offerdetail_offer_type_idx'),
+        ]
+
     def __str__(self):
         """
         Return a string combining title and offer_type for readability.
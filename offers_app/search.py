@@ -0,0 +1,215 @@
+"""
+Module offers_app.search
+
+Full-text search over offer titles and descriptions.
+
+- SQLite: an external-content FTS5 table kept current by triggers on the
+  offers table, ranked with bm25().
+- PostgreSQL: a stored, generated tsvector column with a GIN index,
+  ranked with ts_rank().
+- Any other backend (or SQLite without FTS5) falls back to icontains.
+
+The index is installed idempotently after every migrate run, so it also
+survives table rebuilds done by the SQLite schema editor.
+"""
+
+import re
+
+from django.db import DatabaseError, connections, models
+from django.db.models.expressions import RawSQL
+
+from offers_app.models import Offer
+
+OFFER_TABLE = Offer._meta.db_table
+FTS_TABLE = f'{OFFER_TABLE}_fts'
+SEARCH_VECTOR_COLUMN = 'search_vector'
+
+# Title matches weigh more than description matches
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='{OFFER_TABLE}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {OFFER_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {OFFER_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON {OFFER_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+POSTGRES_INSTALL = [
+    f"""
+    ALTER TABLE {OFFER_TABLE} ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS {OFFER_TABLE}_search_gin
+    ON {OFFER_TABLE} USING GIN ({SEARCH_VECTOR_COLUMN})
+    """,
+]
+
+
+# (alias, database name) → whether full-text search works there; set by
+# install_search_index and otherwise checked once on first use
+_available = {}
+
+
+def _availability_key(connection):
+    return connection.alias, str(connection.settings_dict['NAME'])
+
+
+def _sqlite_fts_installed(connection):
+    """
+    Return True if the FTS table and all of its triggers exist.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name IN (%s, %s, %s, %s)",
+            [FTS_TABLE, f'{FTS_TABLE}_ai', f'{FTS_TABLE}_ad', f'{FTS_TABLE}_au'],
+        )
+        return cursor.fetchone()[0] == 4
+
+
+def install_search_index(connection, rebuild=False):
+    """
+    Create the full-text index for the given connection if it is missing.
+
+    On SQLite the FTS table is rebuilt from the offers table whenever it or
+    one of its triggers had to be (re)created, or when rebuild is True.
+
+    Returns:
+        bool: True if a full-text index is available on this connection.
+    """
+    available = _install_search_index(connection, rebuild)
+    _available[_availability_key(connection)] = available
+    return available
+
+
+def _install_search_index(connection, rebuild):
+    if connection.vendor == 'sqlite':
+        was_installed = _sqlite_fts_installed(connection)
+        try:
+            with connection.cursor() as cursor:
+                for statement in SQLITE_INSTALL:
+                    cursor.execute(statement)
+                if rebuild or not was_installed:
+                    cursor.execute(
+                        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+                    )
+        except DatabaseError:
+            # SQLite compiled without FTS5
+            return False
+        return True
+
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            for statement in POSTGRES_INSTALL:
+                cursor.execute(statement)
+        return True
+
+    return False
+
+
+def install_search_index_after_migrate(sender, using, **kwargs):
+    """
+    post_migrate handler installing the search index on the migrated database.
+    """
+    install_search_index(connections[using])
+
+
+def search_available(connection):
+    """
+    Return True if full-text search can be used on the given connection.
+
+    The SQLite check runs once per database; install_search_index (run after
+    every migrate) records its result directly.
+    """
+    if connection.vendor != 'sqlite':
+        return connection.vendor == 'postgresql'
+    key = _availability_key(connection)
+    if key not in _available:
+        _available[key] = _sqlite_fts_installed(connection)
+    return _available[key]
+
+
+def _tokens(term):
+    return _TOKEN_RE.findall(term.lower())
+
+
+def search_offers(queryset, term):
+    """
+    Restrict an Offer queryset to entries matching a search term.
+
+    Every word of the term must match the start of a word in the title or
+    description. The result is annotated with 'search_rank' (higher is more
+    relevant) so callers can order by it.
+
+    Args:
+        queryset (QuerySet): Offer queryset to filter.
+        term (str): Raw search input from the client.
+
+    Returns:
+        QuerySet: Filtered and rank-annotated queryset.
+    """
+    connection = connections[queryset.db]
+    tokens = _tokens(term)
+
+    if not tokens or not search_available(connection):
+        return queryset.filter(
+            models.Q(title__icontains=term) |
+            models.Q(description__icontains=term)
+        ).annotate(search_rank=models.Value(0.0, output_field=models.FloatField()))
+
+    if connection.vendor == 'sqlite':
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        matching_ids = RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+            [match],
+        )
+        # bm25() is lower for better matches, so negate it
+        rank = RawSQL(
+            f"SELECT -bm25({FTS_TABLE}, %s, %s) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND rowid = {OFFER_TABLE}.id",
+            [TITLE_WEIGHT, DESCRIPTION_WEIGHT, match],
+            output_field=models.FloatField(),
+        )
+    else:
+        query = ' & '.join(f'{token}:*' for token in tokens)
+        matching_ids = RawSQL(
+            f"SELECT id FROM {OFFER_TABLE} "
+            f"WHERE {SEARCH_VECTOR_COLUMN} @@ to_tsquery('simple', %s)",
+            [query],
+        )
+        rank = RawSQL(
+            f"ts_rank({OFFER_TABLE}.{SEARCH_VECTOR_COLUMN}, to_tsquery('simple', %s))",
+            [query],
+            output_field=models.FloatField(),
+        )
+
+    return queryset.filter(id__in=matching_ids).annotate(search_rank=rank)
@@ -0,0 +1,64 @@
+"""
+Module offers_app.signals
+
+Keeps the denormalized price/delivery summary on Offer in sync with
+OfferDetail writes that go through save() and delete(), queues image variant
+generation for new offer images, and invalidates the offer response cache
+whenever data shown in offer responses changes (including the creator's
+rating summary).
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from offers_app.cache import offer_response_cache
+from offers_app.images import enqueue_offer_image
+from offers_app.models import Offer, OfferDetail
+from profile_app.models import BusinessProfile, CustomerProfile
+from reviews_app.models import Review
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def sync_offer_detail_summary(sender, instance, **kwargs):
+    """
+    Refresh the parent Offer's summary columns after a detail changed.
+
+    Bulk writes (bulk_create, bulk_update, queryset.update) bypass this
+    handler and must call Offer.update_detail_summary() themselves.
+    """
+    try:
+        offer = instance.offer
+    except Offer.DoesNotExist:
+        # Parent already removed in the same cascade
+        return
+    offer.update_detail_summary()
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+@receiver(post_save, sender=BusinessProfile)
+@receiver(post_delete, sender=BusinessProfile)
+@receiver(post_save, sender=CustomerProfile)
+@receiver(post_delete, sender=CustomerProfile)
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_offer_responses(sender, **kwargs):
+    """
+    Bump the offer response cache generation after any relevant write.
+
+    Bulk writes bypass this handler and must call
+    offer_response_cache.bump_on_commit() themselves.
+    """
+    offer_response_cache.bump_on_commit()
+
+
+@receiver(post_save, sender=Offer)
+def queue_offer_image_variants(sender, instance, **kwargs):
+    """
+    Queue variant generation when an offer's image is new or was replaced.
+    """
+    if instance.image and instance.image_variants.get('source') != instance.image.name:
+        enqueue_offer_image(instance.pk)
@@ -0,0 +1,60 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from offers_app.models import Offer
+from offers_app.models import OfferDetail
+from profile_app.models import BusinessProfile
+
+User = get_user_model()
+
+
+class OfferConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.biz = User.objects.create_user(username='biz', password='pw')
+        cls.profile = BusinessProfile.objects.create(user=cls.biz, username='biz')
+        cls.offer = Offer.objects.create(user=cls.biz, title='O', description='D')
+        cls.detail = OfferDetail.objects.create(offer=cls.offer, title='X', revisions=1, delivery_time_in_days=5, price=50, offer_type='basic')
+        cls.url = reverse('offer-detail', kwargs={'pk': cls.offer.id})
+
+    def setUp(self):
+        self.client.force_authenticate(self.biz)
+
+    def test_etag_and_last_modified_sent(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertTrue(resp['ETag'].startswith('"'))
+        self.assertIn('Last-Modified', resp)
+
+    def test_not_modified_with_single_query(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(1):
+            resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(resp['ETag'], etag)
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(self.url)['Last-Modified']
+        resp = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_on_detail_and_profile_write(self):
+        etag = self.client.get(self.url)['ETag']
+        self.detail.price = 40
+        self.detail.save()
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data['min_price'], 40)
+
+        etag = resp['ETag']
+        self.profile.first_name = 'Neu'
+        self.profile.save()
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_missing_offer_still_404(self):
+        url = reverse('offer-detail', kwargs={'pk': 9999})
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH='"x"')
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
@@ -65,4 +65,32 @@ class OfferDetailTests(APITestCase):
     def test_delete_offer_forbidden(self):
         self.client.force_authenticate(self.other)
         resp = self.client.delete(self.url)
-        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_patch_all_details_query_count(self):
+        self.client.force_authenticate(self.biz)
+        payload = {"details": [
+            {"offer_type": "basic", "price": 55},
+            {"offer_type": "standard", "price": 75, "delivery_time_in_days": 4},
+        ]}
+        # Offer + Details laden, SAVEPOINT, Offer-UPDATE, ein Bulk-UPDATE, RELEASE
+        with self.assertNumQueries(6):
+            resp = self.client.patch(self.url, payload, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        prices = {d['offer_type']: d['price'] for d in resp.data['details']}
+        self.assertEqual(prices, {'basic': 55, 'standard': 75})
+        self.offer.refresh_from_db()
+        self.assertEqual((self.offer.min_price, self.offer.max_price, self.offer.min_delivery_time), (55, 75, 4))
+
+    def test_patch_invalid_detail_changes_nothing(self):
+        self.client.force_authenticate(self.biz)
+        payload = {"title": "Neu", "details": [
+            {"offer_type": "basic", "price": 1},
+            {"offer_type": "unbekannt", "price": 2},
+        ]}
+        resp = self.client.patch(self.url, payload, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.offer.refresh_from_db()
+        self.d1.refresh_from_db()
+        self.assertEqual(self.offer.title, 'O')
+        self.assertEqual(self.d1.price, 50)
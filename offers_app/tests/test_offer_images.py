@@ -0,0 +1,113 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from offers_app.images import ImageWorker, process_offer_image
+from offers_app.models import Offer
+from profile_app.models import BusinessProfile
+
+User = get_user_model()
+
+MEDIA_ROOT = tempfile.mkdtemp()
+VARIANTS = {'WIDTHS': [100, 200, 800], 'FORMATS': ['webp', 'jpeg'], 'QUALITY': 70, 'ASYNC': False}
+
+
+def png_upload(name='bild.png', size=(400, 300)):
+    buffer = BytesIO()
+    Image.new('RGBA', size, (200, 50, 50, 128)).save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, OFFER_IMAGE_VARIANTS=VARIANTS)
+class OfferImageVariantTests(APITestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.biz = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=self.biz, username='biz')
+
+    def test_variants_generated_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            offer = Offer.objects.create(user=self.biz, title='O', description='D', image=png_upload())
+        offer.refresh_from_db()
+        variants = offer.image_variants
+        self.assertEqual(variants['source'], offer.image.name)
+        # Nicht hochskalieren: 800 entfällt
+        self.assertEqual(sorted(variants['webp']), ['100', '200'])
+        with default_storage.open(variants['jpeg']['200']) as f:
+            self.assertEqual(Image.open(f).size, (200, 150))
+
+    def test_srcset_in_offer_payload(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            offer = Offer.objects.create(user=self.biz, title='O', description='D', image=png_upload())
+        self.client.force_authenticate(self.biz)
+        resp = self.client.get(reverse('offer-detail', kwargs={'pk': offer.id}))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        srcset = resp.data['image_srcset']
+        self.assertEqual(set(srcset), {'webp', 'jpeg'})
+        self.assertIn(' 100w, ', srcset['webp'])
+        self.assertTrue(srcset['webp'].startswith('http://testserver/'))
+
+    def test_variants_change_offer_etag(self):
+        # Ein vor der Verarbeitung geholtes Angebot darf kein 304 mit leerem srcset liefern
+        offer = Offer.objects.create(user=self.biz, title='O', description='D', image=png_upload())
+        self.client.force_authenticate(self.biz)
+        url = reverse('offer-detail', kwargs={'pk': offer.id})
+        first = self.client.get(url)
+        self.assertFalse(first.data['image_srcset'])
+        process_offer_image(offer.id)
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIn('webp', resp.data['image_srcset'])
+
+    def test_variants_keep_updated_at_and_feed_order(self):
+        # Abgeleitete Daten ändern weder updated_at noch die Reihenfolge im Feed
+        with_image = Offer.objects.create(user=self.biz, title='A', description='D', image=png_upload())
+        newer = Offer.objects.create(user=self.biz, title='B', description='D')
+        updated_at = Offer.objects.get(pk=with_image.id).updated_at
+        url = reverse('offer-list-create')
+        before = [offer['id'] for offer in self.client.get(url).data['results']]
+        self.assertEqual(before, [newer.id, with_image.id])
+        process_offer_image(with_image.id)
+        with_image.refresh_from_db()
+        self.assertTrue(with_image.image_variants)
+        self.assertEqual(with_image.updated_at, updated_at)
+        self.assertEqual([offer['id'] for offer in self.client.get(url).data['results']], before)
+
+    def test_replaced_image_removes_old_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            offer = Offer.objects.create(user=self.biz, title='O', description='D', image=png_upload())
+        offer.refresh_from_db()
+        old = offer.image_variants['webp']['100']
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.image = png_upload('neu.png')
+            offer.save()
+        offer.refresh_from_db()
+        self.assertIn('neu', offer.image_variants['webp']['100'])
+        self.assertFalse(default_storage.exists(old))
+
+    def test_backfill_command(self):
+        # Bestand ohne Varianten (z.B. vor Einführung der Pipeline)
+        offer = Offer.objects.create(user=self.biz, title='O', description='D', image=png_upload())
+        self.assertEqual(Offer.objects.get(id=offer.id).image_variants, {})
+        call_command('generate_offer_image_variants', stdout=StringIO())
+        self.assertIn('webp', Offer.objects.get(id=offer.id).image_variants)
+
+    def test_worker_runs_jobs_off_thread(self):
+        worker, seen = ImageWorker(), []
+        worker.submit(seen.append, 'job')
+        worker.join()
+        self.assertEqual(seen, ['job'])
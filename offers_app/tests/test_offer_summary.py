@@ -0,0 +1,82 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from offers_app.models import Offer
+from offers_app.models import OfferDetail
+from profile_app.models import BusinessProfile
+
+User = get_user_model()
+
+
+class OfferSummaryTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.biz = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=cls.biz, username='biz')
+        cls.url = reverse('offer-list-create')
+        cls.payload = {
+            "title": "Paket",
+            "description": "Beschreibung",
+            "details": [
+                {"title": "Basic", "revisions": 1, "delivery_time_in_days": 9, "price": 100, "features": [], "offer_type": "basic"},
+                {"title": "Std",   "revisions": 2, "delivery_time_in_days": 6, "price": 200, "features": [], "offer_type": "standard"},
+                {"title": "Prem",  "revisions": 3, "delivery_time_in_days": 3, "price": 400, "features": [], "offer_type": "premium"},
+            ]
+        }
+
+    def test_summary_set_on_create(self):
+        self.client.force_authenticate(self.biz)
+        resp = self.client.post(self.url, self.payload, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        offer = Offer.objects.get(id=resp.data['id'])
+        self.assertEqual(offer.min_price, 100)
+        self.assertEqual(offer.max_price, 400)
+        self.assertEqual(offer.min_delivery_time, 3)
+
+    def test_summary_updated_on_patch(self):
+        self.client.force_authenticate(self.biz)
+        offer_id = self.client.post(self.url, self.payload, format='json').data['id']
+        url = reverse('offer-detail', kwargs={'pk': offer_id})
+        resp = self.client.patch(url, {"details": [
+            {"offer_type": "basic", "price": 50, "delivery_time_in_days": 1},
+        ]}, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        offer = Offer.objects.get(id=offer_id)
+        self.assertEqual(offer.min_price, 50)
+        self.assertEqual(offer.max_price, 400)
+        self.assertEqual(offer.min_delivery_time, 1)
+
+    def test_filters_use_summary(self):
+        self.client.force_authenticate(self.biz)
+        self.client.post(self.url, self.payload, format='json')
+        self.client.force_authenticate(None)
+        # Ein Detail kostet mindestens 300 → Treffer
+        resp = self.client.get(self.url, {'min_price': 300})
+        self.assertEqual(resp.data['count'], 1)
+        resp = self.client.get(self.url, {'min_price': 500})
+        self.assertEqual(resp.data['count'], 0)
+        resp = self.client.get(self.url, {'max_delivery_time': 3})
+        self.assertEqual(resp.data['count'], 1)
+        resp = self.client.get(self.url, {'max_delivery_time': 2})
+        self.assertEqual(resp.data['count'], 0)
+
+    def test_recompute_command(self):
+        offer = Offer.objects.create(user=self.biz, title='O', description='D')
+        OfferDetail.objects.bulk_create([
+            OfferDetail(offer=offer, title='A', revisions=1, delivery_time_in_days=4, price=10, offer_type='basic'),
+            OfferDetail(offer=offer, title='B', revisions=1, delivery_time_in_days=2, price=30, offer_type='standard'),
+        ])
+        # bulk_create umgeht die Signale → Zusammenfassung veraltet
+        offer.refresh_from_db()
+        self.assertIsNone(offer.min_price)
+
+        out = StringIO()
+        call_command('recompute_offer_summaries', stdout=out)
+        offer.refresh_from_db()
+        self.assertEqual((offer.min_price, offer.max_price, offer.min_delivery_time), (10, 30, 2))
+        self.assertIn('Updated 1', out.getvalue())
@@ -0,0 +1,65 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from base_info_app.models import SiteStats
+from offers_app.models import Offer
+from offers_app.models import OfferDetail
+from profile_app.models import BusinessProfile
+
+User = get_user_model()
+
+
+def offer_payload(title, base_price):
+    return {
+        "title": title,
+        "description": "Beschreibung",
+        "details": [
+            {"title": "Basic", "revisions": 1, "delivery_time_in_days": 5, "price": base_price, "features": [], "offer_type": "basic"},
+            {"title": "Std",   "revisions": 2, "delivery_time_in_days": 4, "price": base_price * 2, "features": [], "offer_type": "standard"},
+            {"title": "Prem",  "revisions": 3, "delivery_time_in_days": 3, "price": base_price * 3, "features": [], "offer_type": "premium"},
+        ]
+    }
+
+
+class OffersBulkCreateTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.biz = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=cls.biz, username='biz')
+        cls.cust = User.objects.create_user(username='cust', password='pw')
+        cls.url = reverse('offer-bulk-create')
+
+    def test_bulk_create_success(self):
+        self.client.force_authenticate(self.biz)
+        payload = [offer_payload(f'Offer {i}', 10 * (i + 1)) for i in range(5)]
+        resp = self.client.post(self.url, payload, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([o['title'] for o in resp.data], [p['title'] for p in payload])
+        self.assertEqual(Offer.objects.filter(user=self.biz).count(), 5)
+        self.assertEqual(OfferDetail.objects.count(), 15)
+        offer = Offer.objects.get(id=resp.data[1]['id'])
+        self.assertEqual((offer.min_price, offer.max_price, offer.min_delivery_time), (20, 60, 3))
+        # Seitenstatistik trotz bulk_create aktuell
+        self.assertEqual(SiteStats.load().offer_count, Offer.objects.count())
+
+    def test_bulk_create_all_or_nothing(self):
+        self.client.force_authenticate(self.biz)
+        bad = offer_payload('Kaputt', 10)
+        bad['details'] = bad['details'][:2]
+        resp = self.client.post(self.url, [offer_payload('Gut', 10), bad], format='json')
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(resp.data[0], {})
+        self.assertIn('details', resp.data[1])
+        self.assertFalse(Offer.objects.exists())
+
+    def test_bulk_create_requires_list(self):
+        self.client.force_authenticate(self.biz)
+        resp = self.client.post(self.url, offer_payload('Einzeln', 10), format='json')
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create_forbidden_for_customer(self):
+        self.client.force_authenticate(self.cust)
+        resp = self.client.post(self.url, [offer_payload('X', 10)], format='json')
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
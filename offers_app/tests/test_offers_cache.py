@@ -0,0 +1,79 @@
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+from django.contrib.auth import get_user_model
+
+from offers_app.cache import offer_response_cache
+from offers_app.models import Offer
+from offers_app.models import OfferDetail
+from profile_app.models import BusinessProfile
+
+User = get_user_model()
+
+
+class OffersResponseCacheTests(APITransactionTestCase):
+    # Ohne umschließende Transaktion, damit Antworten gespeichert werden
+
+    def setUp(self):
+        caches['default'].clear()
+        offer_response_cache.reset_stats()
+        self.biz = User.objects.create_user(username='biz', password='pw')
+        self.profile = BusinessProfile.objects.create(user=self.biz, username='biz', first_name='Alt')
+        self.offer = Offer.objects.create(user=self.biz, title='Logo', description='D')
+        OfferDetail.objects.create(offer=self.offer, title='B', revisions=1, delivery_time_in_days=3, price=50, offer_type='basic')
+        self.url = reverse('offer-list-create')
+
+    def test_second_request_is_hit_without_queries(self):
+        first = self.client.get(self.url, {'page_size': 5, 'search': 'logo'})
+        self.assertEqual(first['X-Cache'], 'MISS')
+        # Gleiche Parameter in anderer Reihenfolge → gleicher Schlüssel
+        with self.assertNumQueries(0):
+            second = self.client.get(f'{self.url}?search=logo&page_size=5')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(offer_response_cache.stats()['hits'], 1)
+        self.assertEqual(offer_response_cache.stats()['misses'], 1)
+
+    def test_offer_write_invalidates(self):
+        self.client.get(self.url)
+        Offer.objects.create(user=self.biz, title='Neu', description='D')
+        resp = self.client.get(self.url)
+        self.assertEqual(resp['X-Cache'], 'MISS')
+        self.assertEqual(resp.data['count'], 2)
+
+    def test_detail_write_invalidates(self):
+        self.client.get(self.url)
+        detail = self.offer.details.get()
+        detail.price = 20
+        detail.save()
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.data['results'][0]['min_price'], 20)
+
+    def test_profile_write_invalidates(self):
+        self.client.get(self.url)
+        self.profile.first_name = 'Neu'
+        self.profile.save()
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.data['results'][0]['user_details']['first_name'], 'Neu')
+
+    def test_detail_endpoint_cached_but_still_authenticated(self):
+        url = reverse('offer-detail', kwargs={'pk': self.offer.id})
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.force_authenticate(self.biz)
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+        self.client.force_authenticate(None)
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_stats_endpoint_staff_only(self):
+        url = reverse('cache-stats')
+        self.client.force_authenticate(self.biz)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+        admin = User.objects.create_user(username='admin', password='pw', is_staff=True)
+        self.client.force_authenticate(admin)
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIn('offers', resp.data)
@@ -51,3 +51,25 @@ class OffersCreateTests(APITestCase):
         bad_payload['details'] = []  # weniger als 3
         resp = self.client.post(self.url, bad_payload, format='json')
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_offer_invalid_detail_leaves_nothing_behind(self):
+        self.client.force_authenticate(self.biz)
+        bad_payload = {**self.payload, 'details': [*self.payload['details'][:2], {"title": "Kaputt"}]}
+        resp = self.client.post(self.url, bad_payload, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('details', resp.data)
+        self.assertFalse(Offer.objects.exists())
+        self.assertFalse(OfferDetail.objects.exists())
+
+    def test_create_offer_single_insert_per_table(self):
+        self.client.force_authenticate(self.biz)
+        with self.assertNumQueries(6):
+            # BusinessProfile-Check, SAVEPOINT, Offer-INSERT, Statistik-UPDATE, Detail-INSERT, RELEASE
+            resp = self.client.post(self.url, self.payload, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        offer = Offer.objects.get(id=resp.data['id'])
+        self.assertEqual((offer.min_price, offer.max_price, offer.min_delivery_time), (100, 500, 5))
+        self.assertEqual(
+            [d['id'] for d in resp.data['details']],
+            list(offer.details.order_by('id').values_list('id', flat=True))
+        )
@@ -0,0 +1,69 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from offers_app.models import Offer
+
+User = get_user_model()
+
+
+class OffersCursorPaginationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.biz = User.objects.create_user(username='biz', password='pw')
+        # Gleiche Preise und ein Offer ohne Preis prüfen Tie-Break und NULLs
+        prices = [300, 100, 200, 100, None, 200, 100]
+        cls.offers = []
+        for i, price in enumerate(prices):
+            cls.offers.append(Offer.objects.create(
+                user=cls.biz, title=f'O{i}', description='D', min_price=price
+            ))
+        cls.url = reverse('offer-list-create')
+
+    def _walk(self, params):
+        ids, url, data = [], self.url, {'pagination': 'cursor', 'page_size': 3, **params}
+        while url:
+            resp = self.client.get(url, data)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', resp.data)
+            ids.extend(item['id'] for item in resp.data['results'])
+            last = resp.data
+            url, data = resp.data['next'], None
+        return ids, last
+
+    def test_walk_default_ordering(self):
+        ids, _ = self._walk({})
+        expected = list(Offer.objects.order_by('-updated_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_walk_price_ordering_with_ties_and_nulls(self):
+        ids, _ = self._walk({'ordering': 'min_price'})
+        o = self.offers
+        expected = [o[1].id, o[3].id, o[6].id, o[2].id, o[5].id, o[0].id, o[4].id]
+        self.assertEqual(ids, expected)
+
+    def test_walk_backwards(self):
+        forward, last = self._walk({'ordering': '-min_price'})
+        backward = [item['id'] for item in last['results']]
+        url = last['previous']
+        while url:
+            resp = self.client.get(url)
+            backward = [item['id'] for item in resp.data['results']] + backward
+            url = resp.data['previous']
+        self.assertEqual(backward, forward)
+
+    def test_no_count_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.url, {'pagination': 'cursor'})
+        self.assertFalse(any('COUNT(' in q['sql'].upper() for q in ctx.captured_queries))
+
+    def test_invalid_cursor(self):
+        resp = self.client.get(self.url, {'cursor': 'kaputt'})
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_unchanged(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.data['count'], 7)
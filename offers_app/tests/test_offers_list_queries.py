@@ -0,0 +1,54 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from offers_app.models import Offer
+from offers_app.models import OfferDetail
+from profile_app.models import BusinessProfile, CustomerProfile
+
+User = get_user_model()
+
+
+class OffersListQueryCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Business- und Customer-Ersteller, 100 Offers mit je drei Details
+        biz = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=biz, username='biz', first_name='Bea')
+        cust = User.objects.create_user(username='cust', password='pw')
+        CustomerProfile.objects.create(user=cust, username='cust')
+        for i in range(100):
+            offer = Offer.objects.create(
+                user=biz if i % 2 else cust, title=f'Offer {i}', description='D'
+            )
+            OfferDetail.objects.bulk_create([
+                OfferDetail(offer=offer, title='B', revisions=1, delivery_time_in_days=7 + i, price=100 + i, offer_type='basic'),
+                OfferDetail(offer=offer, title='S', revisions=2, delivery_time_in_days=5 + i, price=200 + i, offer_type='standard'),
+                OfferDetail(offer=offer, title='P', revisions=3, delivery_time_in_days=3 + i, price=300 + i, offer_type='premium'),
+            ])
+            offer.update_detail_summary()
+        cls.url = reverse('offer-list-create')
+
+    def _count_queries(self, page_size):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(self.url, {'page_size': page_size})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.data['results']), page_size)
+        return len(ctx.captured_queries)
+
+    def test_query_count_independent_of_page_size(self):
+        counts = [self._count_queries(size) for size in (1, 10, 100)]
+        self.assertEqual(counts, [counts[0]] * 3)
+        # COUNT, Offers inkl. Profile, Details-Prefetch
+        self.assertLessEqual(counts[0], 3)
+
+    def test_precomputed_values_in_results(self):
+        resp = self.client.get(self.url, {'page_size': 100, 'ordering': 'title'})
+        item = next(r for r in resp.data['results'] if r['title'] == 'Offer 1')
+        self.assertEqual(item['min_price'], 101)
+        self.assertEqual(item['min_delivery_time'], 4)
+        self.assertEqual(len(item['details']), 3)
+        self.assertEqual(item['user_details']['first_name'], 'Bea')
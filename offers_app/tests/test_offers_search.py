@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from offers_app.models import Offer
+from offers_app.search import search_available
+
+User = get_user_model()
+
+
+class OffersSearchTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.biz = User.objects.create_user(username='biz', password='pw')
+        cls.logo = Offer.objects.create(user=cls.biz, title='Logo Design', description='Vektorgrafik')
+        cls.web = Offer.objects.create(user=cls.biz, title='Webseite', description='Mit Logo im Header')
+        cls.seo = Offer.objects.create(user=cls.biz, title='SEO Beratung', description='Analyse')
+        cls.url = reverse('offer-list-create')
+
+    def _ids(self, params):
+        resp = self.client.get(self.url, {'page_size': 10, **params})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in resp.data['results']]
+
+    def test_index_installed(self):
+        if connection.vendor in ('sqlite', 'postgresql'):
+            self.assertTrue(search_available(connection))
+
+    def test_search_ranks_title_matches_first(self):
+        self.assertEqual(self._ids({'search': 'logo'}), [self.logo.id, self.web.id])
+
+    def test_search_prefix_match(self):
+        # Tippen während der Eingabe: Wortanfänge genügen
+        self.assertEqual(self._ids({'search': 'bera'}), [self.seo.id])
+
+    def test_search_all_words_required(self):
+        self.assertEqual(self._ids({'search': 'logo header'}), [self.web.id])
+
+    def test_index_follows_update_and_delete(self):
+        self.seo.title = 'Suchmaschinen Optimierung'
+        self.seo.save()
+        self.assertEqual(self._ids({'search': 'beratung'}), [])
+        self.assertEqual(self._ids({'search': 'optimierung'}), [self.seo.id])
+        self.logo.delete()
+        self.assertEqual(self._ids({'search': 'logo'}), [self.web.id])
+
+    def test_explicit_ordering_overrides_rank(self):
+        ids = self._ids({'search': 'logo', 'ordering': 'title'})
+        self.assertEqual(ids, [self.logo.id, self.web.id])
+        ids = self._ids({'search': 'logo', 'ordering': '-title'})
+        self.assertEqual(ids, [self.web.id, self.logo.id])
+
+    def test_index_check_not_repeated_per_search(self):
+        # Die Prüfung auf FTS-Tabelle und Trigger läuft nicht bei jeder Suche
+        self._ids({'search': 'logo'})
+        with CaptureQueriesContext(connection) as queries:
+            self._ids({'search': 'logo'})
+        self.assertFalse([q for q in queries if 'sqlite_master' in q['sql']])
@@ -2,10 +2,11 @@
 Module orders_app.api.urls
 
 Defines URL routes for order-related API endpoints:
-- /api/orders/                     [GET, POST]         List all orders for the authenticated user or create a new order (customers only)
+- /api/orders/                     [GET, POST]         List the authenticated user's orders (cursor-paginated, filterable) or create a new order (customers only)
 - /api/orders/<int:pk>/            [GET, PATCH, DELETE] Retrieve, update (status), or delete an order by its ID
 - /api/order-count/<int:business_user_id>/           [GET]  Count of in-progress orders for a specific business user
 - /api/completed-order-count/<int:business_user_id>/ [GET]  Count of completed orders for a specific business user
+- /api/order-counts/?business_user_ids=1,2,3         [GET]  In-progress and completed counts for many business users
 """
 
 from django.urls import path
@@ -13,7 +14,8 @@ from orders_app.api.views import (
     OrderListCreateView,
     OrderRetrieveUpdateDestroyView,
     OrderCountView,
-    CompletedOrderCountView
+    CompletedOrderCountView,
+    OrderCountBatchView
 )
 
 urlpatterns = [
@@ -36,4 +38,7 @@ urlpatterns = [
         CompletedOrderCountView.as_view(),
         name='completed-order-count'
     ),
+
+    # Get in-progress and completed counts for many business users at once
+    path('order-counts/', OrderCountBatchView.as_view(), name='order-count-batch'),
 ]
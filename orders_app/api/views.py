@@ -6,11 +6,17 @@ as well as endpoints to count in-progress and completed orders for business user
 """
 
 from rest_framework import generics, permissions, status
-from rest_framework.authentication import TokenAuthentication
+from core.authentication import CachedTokenAuthentication
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from django.db import models
+from datetime import datetime, time, timedelta
+from django.db import models, transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from django.contrib.auth.models import User
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from core.pagination import KeysetCursorPagination
 
 from orders_app.models import Order
 from offers_app.models import OfferDetail
@@ -18,26 +24,118 @@ from profile_app.models import CustomerProfile, BusinessProfile
 from orders_app.api.serializers import OrderSerializer
 
 
+ORDER_STATUSES = ['in_progress', 'completed', 'cancelled']
+ORDER_ROLES = ('customer', 'business')
+
+
+class OrderCursorPagination(KeysetCursorPagination):
+    """
+    Keyset pagination for the order list on (created_at, id).
+
+    Returns opaque next/previous cursors and no total count.
+    """
+    page_size = 20
+    ordering_options = {
+        '-created_at': ('-created_at', '-id'),
+        'created_at': ('created_at', 'id'),
+    }
+    default_ordering = '-created_at'
+
+
+def parse_created_bound(value, upper):
+    """
+    Parse a created_after/created_before value (ISO date or datetime).
+
+    A plain date covers the whole day: as lower bound it starts at midnight,
+    as upper bound it ends before midnight of the following day.
+
+    Returns:
+        tuple: (lookup, aware datetime), e.g. ('created_at__lt', ...).
+
+    Raises:
+        ValueError: If the value is neither a date nor a datetime.
+    """
+    moment = parse_datetime(value)
+    if moment is not None:
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return ('created_at__lte' if upper else 'created_at__gte'), moment
+
+    day = parse_date(value)
+    if day is None:
+        raise ValueError(value)
+    if upper:
+        day += timedelta(days=1)
+    moment = timezone.make_aware(datetime.combine(day, time.min))
+    return ('created_at__lt' if upper else 'created_at__gte'), moment
+
+
 class OrderListCreateView(generics.ListCreateAPIView):
     """
-    GET  /api/orders/ → List all orders in which the current user is involved
+    GET  /api/orders/ → List the orders in which the current user is involved (cursor-paginated)
     POST /api/orders/ → Create a new order (only for users with a CustomerProfile)
+
+    Query parameters for GET:
+        role:           'customer' (orders placed) or 'business' (orders received); both if omitted
+        status:         One or more comma-separated statuses
+        created_after:  ISO date or datetime (inclusive)
+        created_before: ISO date or datetime (inclusive)
+        ordering:       '-created_at' (default) or 'created_at'
+        cursor, page_size: see OrderCursorPagination
     """
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
-    pagination_class = None  # no pagination for orders
-    authentication_classes = [TokenAuthentication]
+    pagination_class = OrderCursorPagination
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
-    def get_queryset(self):
+    def get_role_querysets(self):
         """
-        Return orders where the request.user is either the customer or the business.
-        Orders are sorted by creation time descending.
+        Return one filtered queryset per requested role.
+
+        Each role filters on its own user column, so the pagination combines
+        them with UNION instead of an OR that no single index can serve.
+
+        Raises:
+            ValidationError: For unknown roles or statuses and malformed dates.
         """
+        params = self.request.query_params
+        errors = {}
+
+        role = params.get('role')
+        if role is not None and role not in ORDER_ROLES:
+            errors['role'] = f"Expected one of {list(ORDER_ROLES)}."
+        roles = [role] if role in ORDER_ROLES else list(ORDER_ROLES)
+
+        filters = {}
+        statuses = [part.strip() for part in params.get('status', '').split(',') if part.strip()]
+        if any(order_status not in ORDER_STATUSES for order_status in statuses):
+            errors['status'] = f"Expected one or more of {ORDER_STATUSES}."
+        elif statuses:
+            filters['status__in'] = statuses
+
+        for param, upper in (('created_after', False), ('created_before', True)):
+            if params.get(param):
+                try:
+                    lookup, moment = parse_created_bound(params[param], upper)
+                except ValueError:
+                    errors[param] = "Expected an ISO date or datetime."
+                else:
+                    filters[lookup] = moment
+
+        if errors:
+            raise ValidationError(errors)
+
         user = self.request.user
-        return Order.objects.filter(
-            models.Q(customer_user=user) | models.Q(business_user=user)
-        ).order_by('-created_at')
+        return [
+            Order.objects.filter(**{f'{role}_user': user}, **filters)
+            for role in roles
+        ]
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_role_querysets())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     def create(self, request, *args, **kwargs):
         user = request.user
@@ -67,18 +165,19 @@ class OrderListCreateView(generics.ListCreateAPIView):
         # OfferDetail laden oder 404
         offer_detail = get_object_or_404(OfferDetail, id=od_id)
 
-        # Bestellung anlegen
-        order = Order.objects.create(
-            customer_user          = user,
-            business_user          = offer_detail.offer.user,
-            title                  = offer_detail.title,
-            revisions              = offer_detail.revisions,
-            delivery_time_in_days  = offer_detail.delivery_time_in_days,
-            price                  = offer_detail.price,
-            features               = offer_detail.features,
-            offer_type             = offer_detail.offer_type,
-            status                 = 'in_progress',
-        )
+        # Bestellung und Zähler in einer Transaktion anlegen
+        with transaction.atomic():
+            order = Order.objects.create(
+                customer_user          = user,
+                business_user          = offer_detail.offer.user,
+                title                  = offer_detail.title,
+                revisions              = offer_detail.revisions,
+                delivery_time_in_days  = offer_detail.delivery_time_in_days,
+                price                  = offer_detail.price,
+                features               = offer_detail.features,
+                offer_type             = offer_detail.offer_type,
+                status                 = 'in_progress',
+            )
 
         serializer = self.get_serializer(order)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -92,7 +191,7 @@ class OrderRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def patch(self, request, *args, **kwargs):
@@ -119,7 +218,7 @@ class OrderRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
             )
         
         # Check valide status
-        valid_statuses = ['in_progress', 'completed', 'cancelled']
+        valid_statuses = ORDER_STATUSES
         new_status = data.get('status')
         if new_status not in valid_statuses:
             return Response(
@@ -129,7 +228,12 @@ class OrderRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
         serializer = self.get_serializer(order, data={'status': new_status}, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        with transaction.atomic():
+            # Lock the row and move the counters from its current status, so
+            # concurrent status changes of one order each count exactly once
+            locked = Order.objects.select_for_update().only('business_user', 'status').get(pk=order.pk)
+            order._counted_state = locked._counted_state
+            serializer.save()
 
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -146,32 +250,57 @@ class OrderRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        return super().delete(request, *args, **kwargs)
+        with transaction.atomic():
+            return super().delete(request, *args, **kwargs)
 
 
 # --- Count endpoints for business users ---
 from rest_framework.views import APIView
 
+MAX_BATCH_BUSINESS_USERS = 100
+
+
+def business_order_counts(business_user_ids):
+    """
+    Read in-progress and completed order counts for many business users at once.
+
+    Checks the BusinessProfile and reads the maintained BusinessOrderCounter
+    in a single joined query; business users without orders have no counter
+    row yet and get zero counts.
+
+    Returns:
+        dict: business_user_id → {'order_count': int, 'completed_order_count': int},
+        only for the given IDs that have a BusinessProfile.
+    """
+    rows = BusinessProfile.objects.filter(user_id__in=business_user_ids).values_list(
+        'user_id',
+        'user__order_counter__in_progress_count',
+        'user__order_counter__completed_count',
+    )
+    return {
+        user_id: {
+            'order_count': in_progress_count or 0,
+            'completed_order_count': completed_count or 0,
+        }
+        for user_id, in_progress_count, completed_count in rows
+    }
+
 
 class OrderCountView(APIView):
     """
     GET /api/order-count/{business_user_id}/
     Returns the count of in-progress orders for the specified business user.
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, business_user_id):
-        # Verify that the user exists and has a BusinessProfile
-        business = get_object_or_404(User, id=business_user_id, businessprofile__isnull=False)
-
-        # Count orders with status 'in_progress'
-        count = Order.objects.filter(
-            business_user=business,
-            status='in_progress'
-        ).count()
+        # Existence check and maintained counter in one query (404 without BusinessProfile)
+        counts = business_order_counts([business_user_id])
+        if business_user_id not in counts:
+            raise Http404
 
-        return Response({"order_count": count})
+        return Response({"order_count": counts[business_user_id]['order_count']})
 
 
 class CompletedOrderCountView(APIView):
@@ -179,17 +308,63 @@ class CompletedOrderCountView(APIView):
     GET /api/completed-order-count/{business_user_id}/
     Returns the count of completed orders for the specified business user.
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, business_user_id):
-        # Ensure the business profile exists for this user_id (404 otherwise)
-        get_object_or_404(BusinessProfile, user_id=business_user_id)
+        # Existence check and maintained counter in one query (404 without BusinessProfile)
+        counts = business_order_counts([business_user_id])
+        if business_user_id not in counts:
+            raise Http404
+
+        return Response(
+            {"completed_order_count": counts[business_user_id]['completed_order_count']},
+            status=status.HTTP_200_OK
+        )
+
+
+class OrderCountBatchView(APIView):
+    """
+    GET /api/order-counts/?business_user_ids=1,2,3
+    Returns in-progress and completed order counts for many business users.
+
+    IDs may be comma-separated and/or repeated. IDs without a BusinessProfile
+    are listed under 'not_found' instead of failing the whole batch.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        raw_ids = [
+            part
+            for value in request.query_params.getlist('business_user_ids')
+            for part in value.split(',')
+            if part.strip()
+        ]
+        try:
+            user_ids = list(dict.fromkeys(int(part) for part in raw_ids))
+        except ValueError:
+            return Response(
+                {"business_user_ids": "Must be a comma-separated list of integers."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not user_ids:
+            return Response(
+                {"business_user_ids": "This field is required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(user_ids) > MAX_BATCH_BUSINESS_USERS:
+            return Response(
+                {"business_user_ids": f"At most {MAX_BATCH_BUSINESS_USERS} IDs per request."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        # Count orders with status 'completed'
-        count = Order.objects.filter(
-            business_user_id=business_user_id,
-            status='completed'
-        ).count()
+        counts = business_order_counts(user_ids)
 
-        return Response({"completed_order_count": count}, status=status.HTTP_200_OK)
+        results = [
+            {'business_user_id': user_id, **counts[user_id]}
+            for user_id in user_ids
+            if user_id in counts
+        ]
+        not_found = [user_id for user_id in user_ids if user_id not in counts]
+        return Response({"results": results, "not_found": not_found}, status=status.HTTP_200_OK)
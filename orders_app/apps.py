@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class OrdersAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'orders_app'
+
+    def ready(self):
+        # Register signal handlers maintaining the business order counters
+        from orders_app import signals  # noqa: F401
@@ -0,0 +1,76 @@
+"""
+Management command to rebuild the per-business order counters from the orders table.
+
+Usage:
+    python manage.py reconcile_order_counters [--dry-run]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from orders_app.models import BusinessOrderCounter, Order
+
+COUNTER_FIELDS = list(BusinessOrderCounter.STATUS_FIELDS.values())
+
+
+class Command(BaseCommand):
+    help = "Recount orders per business user and status, report drift and fix the counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Only report drift, do not write the corrected counters.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Compare the stored counters with a grouped recount and rewrite the
+        rows that drifted, all in one transaction.
+        """
+        with transaction.atomic():
+            expected = {}
+            rows = (
+                Order.objects.values('business_user_id', 'status')
+                .annotate(n=Count('id'))
+            )
+            for row in rows:
+                field = BusinessOrderCounter.STATUS_FIELDS.get(row['status'])
+                if field:
+                    counts = expected.setdefault(row['business_user_id'], dict.fromkeys(COUNTER_FIELDS, 0))
+                    counts[field] = row['n']
+
+            stored = {
+                counter.business_user_id: counter
+                for counter in BusinessOrderCounter.objects.select_for_update()
+            }
+            zero = dict.fromkeys(COUNTER_FIELDS, 0)
+            to_create, to_update = [], []
+            for business_user_id in expected.keys() | stored.keys():
+                counts = expected.get(business_user_id, zero)
+                counter = stored.get(business_user_id)
+                current = {f: getattr(counter, f) for f in COUNTER_FIELDS} if counter else zero
+                if current == counts and counter is not None:
+                    continue
+                if counter is None and counts == zero:
+                    continue
+                drift = {
+                    f: counts[f] - current[f] for f in COUNTER_FIELDS if counts[f] != current[f]
+                }
+                self.stdout.write(f"Business user {business_user_id}: drift {drift}")
+                if counter is None:
+                    to_create.append(BusinessOrderCounter(business_user_id=business_user_id, **counts))
+                else:
+                    for field, value in counts.items():
+                        setattr(counter, field, value)
+                    to_update.append(counter)
+
+            drifted = len(to_create) + len(to_update)
+            if options['dry_run']:
+                self.stdout.write(f"{drifted} counter(s) drifted (dry run, nothing written).")
+                return
+
+            BusinessOrderCounter.objects.bulk_create(to_create, batch_size=500)
+            BusinessOrderCounter.objects.bulk_update(to_update, COUNTER_FIELDS, batch_size=500)
+        self.stdout.write(self.style.SUCCESS(f"{drifted} counter(s) drifted and were fixed."))
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_counters(apps, schema_editor):
+    Order = apps.get_model('orders_app', 'Order')
+    BusinessOrderCounter = apps.get_model('orders_app', 'BusinessOrderCounter')
+    fields = {
+        'in_progress': 'in_progress_count',
+        'completed': 'completed_count',
+        'cancelled': 'cancelled_count',
+    }
+    counters = {}
+    rows = Order.objects.values('business_user_id', 'status').annotate(n=Count('id'))
+    for row in rows:
+        field = fields.get(row['status'])
+        if field:
+            counter = counters.setdefault(
+                row['business_user_id'],
+                BusinessOrderCounter(business_user_id=row['business_user_id'])
+            )
+            setattr(counter, field, row['n'])
+    BusinessOrderCounter.objects.bulk_create(counters.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('orders_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderCounter',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='order_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('in_progress_count', models.PositiveIntegerField(default=0)),
+                ('completed_count', models.PositiveIntegerField(default=0)),
+                ('cancelled_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(build_counters, reverse_code=migrations.RunPython.noop),
+    ]
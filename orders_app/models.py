@@ -1,10 +1,13 @@
 """
 Module orders_app.models
 
-Defines the Order model representing a purchase order linking customers and business users.
+Defines the Order model representing a purchase order linking customers and business users,
+and the BusinessOrderCounter model holding maintained per-business order counts.
 """
 
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.contrib.auth.models import User
 
 
@@ -42,8 +45,86 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Order list, one index per role branch: user filter + (created_at, id) keyset
+            models.Index(fields=['customer_user', 'created_at', 'id'], name='order_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at', 'id'], name='order_business_created_idx'),
+            # Seller list filtered by status; counter reconciliation groups by (business_user, status)
+            models.Index(fields=['business_user', 'status', 'created_at'], name='order_business_status_idx'),
+        ]
+
     def __str__(self):
         """
         String representation of the Order, including ID and status.
         """
         return f"Order {self.id} ({self.status})"
+
+
+class BusinessOrderCounter(models.Model):
+    """
+    Maintained per-business order counts by status.
+
+    Kept in sync by the Order signal handlers (orders_app.signals) so the
+    count endpoints read a single row instead of counting orders. Rebuild
+    with the reconcile_order_counters management command.
+
+    Attributes:
+        business_user (User): The business user the counts belong to.
+        in_progress_count (int): Orders with status 'in_progress'.
+        completed_count (int): Orders with status 'completed'.
+        cancelled_count (int): Orders with status 'cancelled'.
+    """
+
+    # Order status → counter field
+    STATUS_FIELDS = {
+        'in_progress': 'in_progress_count',
+        'completed': 'completed_count',
+        'cancelled': 'cancelled_count',
+    }
+
+    business_user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='order_counter'
+    )
+    in_progress_count = models.PositiveIntegerField(default=0)
+    completed_count = models.PositiveIntegerField(default=0)
+    cancelled_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """
+        String representation listing the counts of the business user.
+        """
+        return (
+            f"Counters for {self.business_user_id} "
+            f"({self.in_progress_count}/{self.completed_count}/{self.cancelled_count})"
+        )
+
+    @classmethod
+    def adjust(cls, business_user_id, changes, create=True):
+        """
+        Apply count deltas for one business user in a single UPDATE.
+
+        Counts never drop below zero, so orders written past the signals
+        (e.g. bulk inserts) cannot make a later deletion fail; such drift is
+        reported and fixed by reconcile_order_counters.
+
+        Args:
+            business_user_id (int): The business user whose counters change.
+            changes (dict): Order status → delta, e.g. {'in_progress': -1, 'completed': 1}.
+                Unknown statuses are ignored.
+            create (bool): Create the counter row if it does not exist yet.
+        """
+        updates = {}
+        for order_status, delta in changes.items():
+            field = cls.STATUS_FIELDS.get(order_status)
+            if field and delta:
+                updates[field] = Greatest(F(field) + delta, 0)
+        if not updates:
+            return
+        updated = cls.objects.filter(business_user_id=business_user_id).update(**updates)
+        if not updated and create:
+            cls.objects.get_or_create(business_user_id=business_user_id)
+            cls.objects.filter(business_user_id=business_user_id).update(**updates)
@@ -0,0 +1,55 @@
+"""
+Module orders_app.signals
+
+Keeps BusinessOrderCounter in sync with Order creation, status changes and
+deletion. Handlers run inside the transaction of the triggering write.
+"""
+
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from orders_app.models import BusinessOrderCounter, Order
+
+
+@receiver(post_init, sender=Order)
+def remember_order_state(sender, instance, **kwargs):
+    """
+    Remember the loaded business user and status to detect changes on save.
+    """
+    instance._counted_state = (instance.business_user_id, instance.status)
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, **kwargs):
+    """
+    Count a new order, or move an existing one between status counters.
+    """
+    new_state = (instance.business_user_id, instance.status)
+    old_state = None if created else instance._counted_state
+    if old_state == new_state:
+        return
+
+    deltas = Counter()
+    if old_state is not None:
+        deltas[old_state] -= 1
+    deltas[new_state] += 1
+
+    by_business = {}
+    for (business_user_id, order_status), delta in deltas.items():
+        by_business.setdefault(business_user_id, {})[order_status] = delta
+    for business_user_id, changes in by_business.items():
+        BusinessOrderCounter.adjust(business_user_id, changes)
+
+    instance._counted_state = new_state
+
+
+@receiver(post_delete, sender=Order)
+def uncount_deleted_order(sender, instance, **kwargs):
+    """
+    Remove a deleted order from its business user's counters.
+    """
+    business_user_id, order_status = instance._counted_state
+    # The counter row may already be gone when the business user is deleted
+    BusinessOrderCounter.adjust(business_user_id, {order_status: -1}, create=False)
@@ -0,0 +1,68 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from orders_app.models import Order
+from profile_app.models import BusinessProfile, CustomerProfile
+
+User = get_user_model()
+
+
+class OrderCountBatchTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(username='cust', password='pw')
+        CustomerProfile.objects.create(user=cls.customer, username='cust')
+        cls.biz1 = User.objects.create_user(username='biz1', password='pw')
+        BusinessProfile.objects.create(user=cls.biz1, username='biz1')
+        cls.biz2 = User.objects.create_user(username='biz2', password='pw')
+        BusinessProfile.objects.create(user=cls.biz2, username='biz2')
+        cls.biz3 = User.objects.create_user(username='biz3', password='pw')
+        BusinessProfile.objects.create(user=cls.biz3, username='biz3')
+        # biz1: 2 in Bearbeitung, 1 fertig, 1 storniert; biz2: 1 fertig; biz3: keine
+        for business, order_status in [
+            (cls.biz1, 'in_progress'), (cls.biz1, 'in_progress'),
+            (cls.biz1, 'completed'), (cls.biz1, 'cancelled'),
+            (cls.biz2, 'completed'),
+        ]:
+            Order.objects.create(
+                customer_user=cls.customer, business_user=business,
+                title='T', revisions=1, delivery_time_in_days=1, price=10,
+                offer_type='basic', status=order_status
+            )
+        cls.url = reverse('order-count-batch')
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def test_batch_counts(self):
+        ids = f'{self.biz1.id},{self.biz2.id},{self.biz3.id},{self.customer.id},9999'
+        # Profilprüfung und Zählerstände in einer einzigen Abfrage
+        with self.assertNumQueries(1):
+            resp = self.client.get(self.url, {'business_user_ids': ids})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data['results'], [
+            {'business_user_id': self.biz1.id, 'order_count': 2, 'completed_order_count': 1},
+            {'business_user_id': self.biz2.id, 'order_count': 0, 'completed_order_count': 1},
+            {'business_user_id': self.biz3.id, 'order_count': 0, 'completed_order_count': 0},
+        ])
+        self.assertEqual(resp.data['not_found'], [self.customer.id, 9999])
+
+    def test_batch_matches_single_endpoints(self):
+        resp = self.client.get(self.url, {'business_user_ids': self.biz1.id})
+        single = self.client.get(reverse('order-count', kwargs={'business_user_id': self.biz1.id}))
+        completed = self.client.get(reverse('completed-order-count', kwargs={'business_user_id': self.biz1.id}))
+        self.assertEqual(resp.data['results'][0]['order_count'], single.data['order_count'])
+        self.assertEqual(resp.data['results'][0]['completed_order_count'], completed.data['completed_order_count'])
+
+    def test_batch_invalid_ids(self):
+        resp = self.client.get(self.url, {'business_user_ids': '1,abc'})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_unauthenticated(self):
+        self.client.force_authenticate(None)
+        resp = self.client.get(self.url, {'business_user_ids': self.biz1.id})
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
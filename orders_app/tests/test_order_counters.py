@@ -0,0 +1,98 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.models import Offer, OfferDetail
+from orders_app.api.views import OrderRetrieveUpdateDestroyView
+from orders_app.models import BusinessOrderCounter, Order
+from profile_app.models import BusinessProfile, CustomerProfile
+
+User = get_user_model()
+
+
+class BusinessOrderCounterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=cls.business, username='biz')
+        cls.customer = User.objects.create_user(username='cust', password='pw')
+        CustomerProfile.objects.create(user=cls.customer, username='cust')
+        cls.staff = User.objects.create_user(username='staff', password='pw', is_staff=True)
+        offer = Offer.objects.create(user=cls.business, title='O', description='D')
+        cls.detail = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=1,
+            delivery_time_in_days=5, price=100, offer_type='basic'
+        )
+
+    def counter(self):
+        return BusinessOrderCounter.objects.get(business_user=self.business)
+
+    def create_order(self):
+        self.client.force_authenticate(self.customer)
+        resp = self.client.post(
+            reverse('order-list-create'), {'offer_detail_id': self.detail.id}, format='json'
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        return resp.data['id']
+
+    def test_create_status_change_and_delete(self):
+        order_id = self.create_order()
+        self.assertEqual(self.counter().in_progress_count, 1)
+
+        # Statuswechsel verschiebt den Zähler
+        self.client.force_authenticate(self.business)
+        resp = self.client.patch(
+            reverse('order-detail', args=[order_id]), {'status': 'completed'}, format='json'
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        counter = self.counter()
+        self.assertEqual((counter.in_progress_count, counter.completed_count), (0, 1))
+
+        # Löschen zählt die Bestellung wieder heraus
+        self.client.force_authenticate(self.staff)
+        resp = self.client.delete(reverse('order-detail', args=[order_id]))
+        self.assertEqual(resp.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.counter().completed_count, 0)
+
+    def test_concurrent_status_change_counts_once(self):
+        order_id = self.create_order()
+        # Zweite Anfrage hat die Bestellung vor dem ersten PATCH geladen
+        stale = Order.objects.get(pk=order_id)
+        self.client.force_authenticate(self.business)
+        url = reverse('order-detail', args=[order_id])
+        self.client.patch(url, {'status': 'completed'}, format='json')
+        with mock.patch.object(OrderRetrieveUpdateDestroyView, 'get_object', return_value=stale):
+            resp = self.client.patch(url, {'status': 'completed'}, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        counter = self.counter()
+        self.assertEqual((counter.in_progress_count, counter.completed_count), (0, 1))
+
+    def test_count_endpoints_read_counter(self):
+        self.create_order()
+        self.client.force_authenticate(self.customer)
+        with self.assertNumQueries(1):
+            resp = self.client.get(reverse('order-count', args=[self.business.id]))
+        self.assertEqual(resp.data, {'order_count': 1})
+        resp = self.client.get(reverse('completed-order-count', args=[self.business.id]))
+        self.assertEqual(resp.data, {'completed_order_count': 0})
+
+    def test_reconcile_fixes_drift(self):
+        self.create_order()
+        # Drift erzeugen: Zähler manuell verfälschen
+        BusinessOrderCounter.objects.filter(business_user=self.business).update(
+            in_progress_count=7, cancelled_count=2
+        )
+
+        out = StringIO()
+        call_command('reconcile_order_counters', '--dry-run', stdout=out)
+        self.assertIn('1 counter(s) drifted', out.getvalue())
+        self.assertEqual(self.counter().in_progress_count, 7)
+
+        call_command('reconcile_order_counters', stdout=StringIO())
+        counter = self.counter()
+        self.assertEqual((counter.in_progress_count, counter.cancelled_count), (1, 0))
@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from orders_app.models import Order
+from profile_app.models import BusinessProfile, CustomerProfile
+
+User = get_user_model()
+
+
+class OrderListCursorTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(username='cust', password='pw')
+        CustomerProfile.objects.create(user=cls.customer, username='cust')
+        cls.business = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=cls.business, username='biz')
+        cls.other = User.objects.create_user(username='other', password='pw')
+        BusinessProfile.objects.create(user=cls.other, username='other')
+
+        # biz ist bei 3 Bestellungen Verkäufer und bei 2 Käufer; eine fremde Bestellung
+        now = timezone.now()
+        specs = [
+            (cls.customer, cls.business, 'in_progress', 5),
+            (cls.customer, cls.business, 'completed', 4),
+            (cls.business, cls.other, 'in_progress', 3),
+            (cls.customer, cls.business, 'cancelled', 2),
+            (cls.business, cls.other, 'completed', 1),
+            (cls.customer, cls.other, 'in_progress', 0),
+        ]
+        cls.orders = []
+        for customer, business, order_status, days_ago in specs:
+            order = Order.objects.create(
+                customer_user=customer, business_user=business,
+                title='T', revisions=1, delivery_time_in_days=1, price=10,
+                offer_type='basic', status=order_status
+            )
+            # created_at ist auto_now_add, daher nachträglich setzen
+            Order.objects.filter(pk=order.pk).update(created_at=now - timedelta(days=days_ago))
+            cls.orders.append(order)
+        cls.url = reverse('order-list-create')
+
+    def setUp(self):
+        self.client.force_authenticate(self.business)
+
+    def ids(self, resp):
+        return [item['id'] for item in resp.data['results']]
+
+    def test_walks_both_roles_without_gaps(self):
+        expected = [self.orders[i].id for i in (4, 3, 2, 1, 0)]
+        seen = []
+        resp = self.client.get(self.url, {'page_size': 2})
+        while True:
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', resp.data)
+            seen += self.ids(resp)
+            if not resp.data['next']:
+                break
+            resp = self.client.get(resp.data['next'])
+        self.assertEqual(seen, expected)
+
+        # Rückwärts über den previous-Link
+        resp = self.client.get(resp.data['previous'])
+        self.assertEqual(self.ids(resp), expected[2:4])
+
+    def test_role_status_and_date_filters(self):
+        resp = self.client.get(self.url, {'role': 'customer'})
+        self.assertEqual(self.ids(resp), [self.orders[4].id, self.orders[2].id])
+
+        resp = self.client.get(self.url, {'role': 'business', 'status': 'completed,cancelled'})
+        self.assertEqual(self.ids(resp), [self.orders[3].id, self.orders[1].id])
+
+        after = (timezone.now() - timedelta(days=3, hours=12)).isoformat()
+        before = (timezone.now() - timedelta(days=1, hours=12)).isoformat()
+        resp = self.client.get(self.url, {'created_after': after, 'created_before': before})
+        self.assertEqual(self.ids(resp), [self.orders[3].id, self.orders[2].id])
+
+    def test_invalid_filters(self):
+        resp = self.client.get(self.url, {'role': 'admin', 'status': 'done', 'created_after': 'gestern'})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(resp.data), {'role', 'status', 'created_after'})
+
+        resp = self.client.get(self.url, {'cursor': 'kaputt'})
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
@@ -45,7 +45,7 @@ class OrdersListTests(APITestCase):
         self.client.force_authenticate(self.customer)
         resp = self.client.get(self.url)
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
-        data = resp.data
+        data = resp.data['results']
         self.assertIsInstance(data, list)
         self.assertEqual(data[0]['id'], self.order.id)
 
@@ -53,7 +53,7 @@ class OrdersListTests(APITestCase):
         self.client.force_authenticate(self.business)
         resp = self.client.get(self.url)
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
-        self.assertEqual(resp.data[0]['business_user'], self.business.id)
+        self.assertEqual(resp.data['results'][0]['business_user'], self.business.id)
 
     def test_list_orders_unauthenticated(self):
         resp = self.client.get(self.url)
@@ -7,6 +7,7 @@ controlling how profile data is converted to/from JSON for API requests and resp
 
 from rest_framework import serializers
 from profile_app.models import BusinessProfile, CustomerProfile
+from reviews_app.models import BusinessRatingSummary
 
 
 class ProfileDetailSerializer(serializers.ModelSerializer):
@@ -22,15 +23,22 @@ class ProfileDetailSerializer(serializers.ModelSerializer):
     working_hours = serializers.CharField(allow_blank=True, default='')
     file = serializers.FileField(required=False, allow_null=True)
     type = serializers.CharField(read_only=True)
+    rating_summary = serializers.SerializerMethodField()
 
     class Meta:
         model = BusinessProfile
         fields = [
             'user', 'username', 'first_name', 'last_name', 'file',
             'location', 'tel', 'description', 'working_hours',
-            'type', 'email', 'created_at',
+            'type', 'email', 'created_at', 'rating_summary',
         ]
 
+    def get_rating_summary(self, obj):
+        # Nur Business-Profile werden bewertet
+        if not isinstance(obj, BusinessProfile):
+            return None
+        return BusinessRatingSummary.data_for(obj.user)
+
 class BusinessProfileListSerializer(serializers.ModelSerializer):
     user = serializers.IntegerField(source='user.id', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
@@ -42,14 +50,19 @@ class BusinessProfileListSerializer(serializers.ModelSerializer):
     working_hours = serializers.CharField(allow_blank=True, default='')
     file = serializers.FileField(required=False, allow_null=True)
     type = serializers.CharField(read_only=True)
+    rating_summary = serializers.SerializerMethodField()
 
     class Meta:
         model = BusinessProfile
         fields = [
             'user', 'username', 'first_name', 'last_name', 'file',
             'location', 'tel', 'description', 'working_hours', 'type',
+            'rating_summary',
         ]
 
+    def get_rating_summary(self, obj):
+        return BusinessRatingSummary.data_for(obj.user)
+
 class CustomerProfileListSerializer(serializers.ModelSerializer):
     user = serializers.IntegerField(source='user.id', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
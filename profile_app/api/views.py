@@ -1,8 +1,10 @@
 from rest_framework import permissions, status
-from rest_framework.authentication import TokenAuthentication
+from core.authentication import CachedTokenAuthentication
 from rest_framework.generics import ListAPIView, RetrieveUpdateAPIView
 from rest_framework.response import Response
+from core.conditional import ConditionalGetMixin, make_etag
 from profile_app.models import BusinessProfile, CustomerProfile
+from profile_app.resolver import profile_resolver
 from profile_app.api.serializers import (
     ProfileDetailSerializer,
     BusinessProfileListSerializer,
@@ -10,18 +12,16 @@ from profile_app.api.serializers import (
 )
 
 
-class ProfileDetailView(RetrieveUpdateAPIView):
-    authentication_classes = [TokenAuthentication]
+class ProfileDetailView(ConditionalGetMixin, RetrieveUpdateAPIView):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = ProfileDetailSerializer
     lookup_field = 'user_id'  # wir nehmen user_id als URL-Parameter
 
     def get_object(self):
         user_id = self.kwargs['user_id']
-        # erst BusinessProfile, dann CustomerProfile
-        obj = BusinessProfile.objects.filter(user_id=user_id).first()
-        if not obj:
-            obj = CustomerProfile.objects.filter(user_id=user_id).first()
+        # Business- oder Kundenprofil in einer Abfrage, pro Request nur einmal geladen
+        obj = profile_resolver(self.request).get(user_id)
         if not obj:
             # 404
             self.permission_denied(self.request, message="Profil nicht gefunden.")
@@ -29,6 +29,21 @@ class ProfileDetailView(RetrieveUpdateAPIView):
         self.check_object_permissions(self.request, obj)
         return obj
 
+    def get_validators(self, request, user_id):
+        # ETag/Last-Modified aus Profil-Version, User-Feldern und Bewertungsstand, ohne Serialisierung;
+        # das Profil bleibt im Resolver und wird von get_object wiederverwendet
+        profile = profile_resolver(request).get(user_id)
+        if profile is None:
+            return None
+        user = profile.user
+        summary = getattr(user, 'rating_summary', None)
+        summary_updated_at = summary.updated_at if summary else None
+        last_modified = max(filter(None, (profile.updated_at, summary_updated_at)))
+        etag = make_etag(
+            type(profile).__name__, user_id, profile.updated_at, user.username, user.email, summary_updated_at
+        )
+        return etag, last_modified
+
     def patch(self, request, *args, **kwargs):
         # Owner darf patchen
         obj = self.get_object()
@@ -41,9 +56,9 @@ class BusinessProfileListView(ListAPIView):
     """
     GET /api/profiles/business/
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
-    queryset = BusinessProfile.objects.all()
+    queryset = BusinessProfile.objects.select_related('user__rating_summary')
     serializer_class = BusinessProfileListSerializer
     pagination_class = None
 
@@ -51,7 +66,7 @@ class CustomerProfileListView(ListAPIView):
     """
     GET /api/profiles/customer/
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     queryset = CustomerProfile.objects.all()
     serializer_class = CustomerProfileListSerializer
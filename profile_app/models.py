@@ -14,6 +14,7 @@ class BusinessProfile(models.Model):
     Profile model for business users.
 
     Links one-to-one with Django's User and stores business-specific information.
+    updated_at serves as the profile version for conditional requests.
     """
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     username = models.CharField(max_length=150)
@@ -25,6 +26,7 @@ class BusinessProfile(models.Model):
     working_hours = models.CharField(max_length=255, blank=True, default='')
     file = models.FileField(upload_to='profile_images/', null=True, blank=True)
     type = models.CharField(max_length=50, default='business')
+    updated_at = models.DateTimeField(auto_now=True)
 
 
 class CustomerProfile(models.Model):
@@ -32,6 +34,7 @@ class CustomerProfile(models.Model):
     Profile model for customer users.
 
     Links one-to-one with Django's User and stores customer-specific information.
+    updated_at serves as the profile version for conditional requests.
     """
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     username = models.CharField(max_length=150)
@@ -43,3 +46,4 @@ class CustomerProfile(models.Model):
     working_hours = models.CharField(max_length=255, blank=True, default='')
     file = models.FileField(upload_to='profile_images/', null=True, blank=True)
     type = models.CharField(max_length=50, default='customer')
+    updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,101 @@
+"""
+Module profile_app.resolver
+
+Resolves the profile of a user, whether BusinessProfile or CustomerProfile,
+in a single query.
+
+Users are loaded with both reverse one-to-one profile relations (and the
+rating summary) joined in, so a profile lookup never falls back from one
+table to the other. A ProfileResolver is an identity map for one request:
+each user ID is fetched at most once, many IDs are fetched together with
+get_many(), and users already loaded with their profiles joined are
+registered without a query.
+"""
+
+from django.contrib.auth.models import User
+
+from profile_app.models import BusinessProfile, CustomerProfile
+
+# Relations joined when loading users for profile resolution
+PROFILE_RELATIONS = ('businessprofile', 'customerprofile', 'rating_summary')
+
+
+def profile_of(user):
+    """
+    Return the BusinessProfile or CustomerProfile of a user, or None.
+
+    Reads the reverse one-to-one relations, so no query is issued when the
+    profiles were loaded with select_related.
+    """
+    for related_name in ('businessprofile', 'customerprofile'):
+        try:
+            return getattr(user, related_name)
+        except (BusinessProfile.DoesNotExist, CustomerProfile.DoesNotExist):
+            continue
+    return None
+
+
+def profiles_loaded(user):
+    """
+    Return True if both profile relations of the user are already cached.
+    """
+    return User.businessprofile.is_cached(user) and User.customerprofile.is_cached(user)
+
+
+class ProfileResolver:
+    """
+    Identity map of user ID → profile (or None) for the lifetime of a request.
+    """
+
+    def __init__(self):
+        self._profiles = {}
+
+    def get(self, user_id):
+        """
+        Return the profile of one user, or None if the user has none.
+        """
+        return self.get_many([user_id])[int(user_id)]
+
+    def get_many(self, user_ids):
+        """
+        Resolve many users at once; unknown IDs are fetched in one query.
+
+        Returns:
+            dict: User ID → BusinessProfile, CustomerProfile or None.
+        """
+        user_ids = {int(user_id) for user_id in user_ids}
+        missing = user_ids - self._profiles.keys()
+        if missing:
+            for user in User.objects.filter(pk__in=missing).select_related(*PROFILE_RELATIONS):
+                self._profiles[user.pk] = profile_of(user)
+            for user_id in missing - self._profiles.keys():
+                self._profiles[user_id] = None
+        return {user_id: self._profiles[user_id] for user_id in user_ids}
+
+    def for_user(self, user):
+        """
+        Return the profile of a loaded User instance.
+
+        Uses the user's joined profile relations when present, so querysets
+        selecting them (see offer_list_queryset) add no queries.
+        """
+        if user.pk not in self._profiles and profiles_loaded(user):
+            self._profiles[user.pk] = profile_of(user)
+        return self.get(user.pk)
+
+
+def profile_resolver(request):
+    """
+    Return the ProfileResolver of a request, creating it on first use.
+
+    The resolver is stored on the underlying HttpRequest, so views and
+    serializers handling the same request share it. Without a request a
+    fresh resolver is returned.
+    """
+    if request is None:
+        return ProfileResolver()
+    http_request = getattr(request, '_request', request)
+    resolver = getattr(http_request, '_profile_resolver', None)
+    if resolver is None:
+        resolver = http_request._profile_resolver = ProfileResolver()
+    return resolver
@@ -0,0 +1,30 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from profile_app.models import CustomerProfile
+
+User = get_user_model()
+
+
+class ProfileConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(username='cust', email='c@example.com', password='pw')
+        cls.profile = CustomerProfile.objects.create(user=cls.customer, username='cust')
+        cls.url = reverse('profile-detail', kwargs={'user_id': cls.customer.id})
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def test_not_modified_until_profile_changes(self):
+        etag = self.client.get(self.url)['ETag']
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.profile.location = 'Berlin'
+        self.profile.save()
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data['location'], 'Berlin')
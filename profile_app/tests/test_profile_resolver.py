@@ -0,0 +1,42 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from profile_app.models import BusinessProfile, CustomerProfile
+from profile_app.resolver import ProfileResolver
+
+User = get_user_model()
+
+
+class ProfileResolverTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.biz = User.objects.create_user(username='biz', password='pw')
+        cls.biz_profile = BusinessProfile.objects.create(user=cls.biz, username='biz')
+        cls.cust = User.objects.create_user(username='cust', password='pw')
+        cls.cust_profile = CustomerProfile.objects.create(user=cls.cust, username='cust')
+        cls.plain = User.objects.create_user(username='plain', password='pw')
+
+    def test_get_many_single_query_and_identity_map(self):
+        resolver = ProfileResolver()
+        with self.assertNumQueries(1):
+            profiles = resolver.get_many([self.biz.id, self.cust.id, self.plain.id, 9999])
+        self.assertEqual(profiles[self.biz.id], self.biz_profile)
+        self.assertEqual(profiles[self.cust.id], self.cust_profile)
+        self.assertIsNone(profiles[self.plain.id])
+        self.assertIsNone(profiles[9999])
+
+        # Bereits aufgelöste IDs kosten keine weitere Abfrage und liefern dieselbe Instanz
+        with self.assertNumQueries(0):
+            self.assertIs(resolver.get(str(self.cust.id)), profiles[self.cust.id])
+
+    def test_profile_detail_single_query(self):
+        # Kundenprofil: früher zwei Abfragen (Business-Miss, dann Customer), dazu die ETag-Abfragen
+        self.client.force_authenticate(self.cust)
+        url = reverse('profile-detail', kwargs={'user_id': self.cust.id})
+        with self.assertNumQueries(1):
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data['username'], 'cust')
+        self.assertIn('ETag', resp)
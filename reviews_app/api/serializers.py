@@ -2,13 +2,13 @@
 Module reviews_app.api.serializers
 
 Defines the ReviewSerializer for converting Review model instances
-to and from JSON for the reviews API. Enforces business and customer
-profile constraints and prevents duplicate reviews.
+to and from JSON for the reviews API. Enforces the business profile
+constraint; the customer check and duplicate prevention live in the view
+(see ReviewListCreateView.post).
 """
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from profile_app.models import CustomerProfile, BusinessProfile
 from reviews_app.models import Review
 
 
@@ -23,8 +23,13 @@ class ReviewSerializer(serializers.ModelSerializer):
     """
     # The user who wrote the review; set in view logic, not by client
     reviewer = serializers.PrimaryKeyRelatedField(read_only=True)
-    # The business user receiving the review; must exist as BusinessProfile
-    business_user = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+    # The business user receiving the review; user lookup and BusinessProfile check in one query
+    business_user = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.filter(businessprofile__isnull=False),
+        error_messages={
+            'does_not_exist': "business_user must have an associated BusinessProfile.",
+        },
+    )
     # Integer rating field, constrained to 1–5
     rating = serializers.IntegerField(min_value=1, max_value=5)
     # Optional text feedback
@@ -49,43 +54,6 @@ class ReviewSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
-    def validate_business_user(self, value):
-        """
-        Ensure the provided business_user has an associated BusinessProfile.
-        """
-        if not BusinessProfile.objects.filter(user=value).exists():
-            raise serializers.ValidationError(
-                "business_user must have an associated BusinessProfile."
-            )
-        return value
-
-    def validate(self, data):
-        """
-        Cross-field validation:
-        - Only users with a CustomerProfile may create reviews.
-        - Prevent duplicate reviews by the same reviewer for the same business_user.
-        """
-        user = self.context['request'].user
-
-        # Only customers may write reviews
-        if not CustomerProfile.objects.filter(user=user).exists():
-            raise serializers.ValidationError(
-                "Only customers may write reviews."
-            )
-
-        # On creation, prevent duplicates
-        if self.instance is None:
-            exists = Review.objects.filter(
-                business_user=data['business_user'],
-                reviewer=user
-            ).exists()
-            if exists:
-                raise serializers.ValidationError(
-                    "You have already reviewed this business user."
-                )
-
-        return data
-
     def create(self, validated_data):
         """
         Create a new Review instance, setting the reviewer to the requesting user.
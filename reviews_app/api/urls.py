@@ -2,15 +2,17 @@
 Module reviews_app.api.urls
 
 Defines URL routes for review-related API endpoints:
-- GET  /api/reviews/        List all reviews (supports filtering by business_user_id and reviewer_id, ordering)
+- GET  /api/reviews/        List reviews, cursor-paginated (filtering by business_user_id and reviewer_id,
+                            ordering by updated_at or rating)
 - POST /api/reviews/        Create a new review (customers only, no duplicates)
 - GET    /api/reviews/{id}/ Retrieve a single review by its ID
 - PATCH  /api/reviews/{id}/ Partially update a review (only the original reviewer)
 - DELETE /api/reviews/{id}/ Delete a review (only the original reviewer)
+- GET  /api/reviews/summary/{business_user_id}/ Review count, average rating and histogram of a business user
 """
 
 from django.urls import path
-from reviews_app.api.views import ReviewListCreateView, ReviewDetailView
+from reviews_app.api.views import ReviewListCreateView, ReviewDetailView, BusinessRatingSummaryView
 
 urlpatterns = [
     # List existing reviews or create a new one
@@ -18,4 +20,11 @@ urlpatterns = [
 
     # Retrieve, update, or delete a specific review by its primary key
     path('reviews/<int:pk>/', ReviewDetailView.as_view(), name='review-detail'),
+
+    # Maintained rating aggregates of a business user
+    path(
+        'reviews/summary/<int:business_user_id>/',
+        BusinessRatingSummaryView.as_view(),
+        name='review-summary'
+    ),
 ]
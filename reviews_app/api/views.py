@@ -6,26 +6,50 @@ Provides filtering by business user or reviewer, and ensures only customers can
 and only the original reviewer can modify or delete their review.
 """
 
-from rest_framework import generics, permissions, status, filters
-from rest_framework.authentication import TokenAuthentication
+from rest_framework import generics, permissions, status
+from core.authentication import CachedTokenAuthentication
 from rest_framework.response import Response
-from reviews_app.models import Review
+from rest_framework.views import APIView
+from django.db import IntegrityError, transaction
+from django.http import Http404
+from core.conditional import ConditionalGetMixin, make_etag
+from core.pagination import KeysetCursorPagination
+from reviews_app.models import BusinessRatingSummary, Review
 from reviews_app.api.serializers import ReviewSerializer
-from profile_app.models import CustomerProfile
+from profile_app.models import BusinessProfile, CustomerProfile
 
 
-class ReviewListCreateView(generics.ListCreateAPIView):
+class ReviewCursorPagination(KeysetCursorPagination):
     """
-    GET  /api/reviews/ → List all reviews (supports ordering by updated_at or rating)
+    Keyset pagination for review lists, newest first by default.
+
+    Each ordering ends with the review ID and is backed by a composite index
+    (alone and behind business_user / reviewer), so every page is an index
+    range scan however many reviews a business has.
+    """
+    page_size = 20
+    ordering_options = {
+        '-updated_at': ('-updated_at', '-id'),
+        'updated_at': ('updated_at', 'id'),
+        '-rating': ('-rating', '-id'),
+        'rating': ('rating', 'id'),
+    }
+    default_ordering = '-updated_at'
+
+
+class ReviewListCreateView(ConditionalGetMixin, generics.ListCreateAPIView):
+    """
+    GET  /api/reviews/ → List reviews, cursor-paginated (ordering by updated_at or rating,
+                         and ETag conditional requests)
     POST /api/reviews/ → Create a new review (only for users with a CustomerProfile and not already reviewed)
     """
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [filters.OrderingFilter]
-    ordering_fields = ['updated_at', 'rating']
-    pagination_class = None  # disable pagination for simplicity
+    # Ordering is part of the cursor key, see ReviewCursorPagination
+    filter_backends = []
+    pagination_class = ReviewCursorPagination
 
     def get_queryset(self):
         """
@@ -44,10 +68,34 @@ class ReviewListCreateView(generics.ListCreateAPIView):
 
         return qs
 
+    def get_validators(self, request):
+        """
+        Derive an ETag for the requested page from its rows' keys.
+
+        Runs the page's keyset query for the ordering and ID columns only, so
+        the cost is bounded by the page size however many reviews match. IDs
+        and updated_at (bumped on every save) of the page rows plus the
+        next/previous flags determine the response; the query string covers
+        filters, ordering and cursor. No Last-Modified is sent since
+        deletions do not advance it.
+        """
+        paginator = self.pagination_class()
+        # The post_init signal handlers read business_user and rating
+        rows = paginator.paginate_queryset(
+            self.get_queryset().only('id', 'updated_at', 'rating', 'business_user'), request, view=self
+        )
+        state = [(row.id, row.updated_at) for row in rows]
+        etag = make_etag('reviews', request.get_full_path(), state, paginator.has_next, paginator.has_previous)
+        return etag, None
+
     def post(self, request, *args, **kwargs):
         """
         Ensure only customers can create reviews and prevent duplicate reviews
         for the same business by the same reviewer.
+
+        Duplicates are caught by the unique (business_user, reviewer)
+        constraint rather than a prior existence check, which also covers two
+        concurrent posts.
         """
         # Only users with a CustomerProfile may post reviews
         if not CustomerProfile.objects.filter(user=request.user).exists():
@@ -56,25 +104,24 @@ class ReviewListCreateView(generics.ListCreateAPIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        business_user = request.data.get('business_user')
-        # Prevent duplicate reviews for the same business user
-        if Review.objects.filter(
-            business_user_id=business_user,
-            reviewer=request.user
-        ).exists():
+        try:
+            # Delegate to ListCreateAPIView.post for actual creation
+            return super().post(request, *args, **kwargs)
+        except IntegrityError:
+            # business_user and reviewer are validated, so only the unique constraint can fail
             return Response(
                 {"detail": "You have already reviewed this business."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Delegate to ListCreateAPIView.post for actual creation
-        return super().post(request, *args, **kwargs)
-
     def perform_create(self, serializer):
         """
-        Attach the current user as the 'reviewer' before saving.
+        Attach the current user as the 'reviewer' before saving; the rating
+        summary is updated in the same transaction. A duplicate review rolls
+        back to the savepoint and raises IntegrityError.
         """
-        serializer.save(reviewer=self.request.user)
+        with transaction.atomic():
+            serializer.save(reviewer=self.request.user)
 
 
 class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -85,7 +132,7 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def check_object_permissions(self, request, obj):
@@ -101,3 +148,35 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
                 request,
                 message="Only the original reviewer may modify or delete this review."
             )
+
+    def perform_update(self, serializer):
+        # Review and rating summary change together
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+
+
+class BusinessRatingSummaryView(APIView):
+    """
+    GET /api/reviews/summary/{business_user_id}/
+    Returns review count, average rating and per-star histogram of a business user.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, business_user_id):
+        # Existence check and maintained summary in one query (404 without BusinessProfile)
+        profile = (
+            BusinessProfile.objects.filter(user_id=business_user_id)
+            .select_related('user__rating_summary')
+            .first()
+        )
+        if profile is None:
+            raise Http404
+        return Response({
+            'business_user_id': business_user_id,
+            **BusinessRatingSummary.data_for(profile.user),
+        })
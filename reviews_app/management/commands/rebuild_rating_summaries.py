@@ -0,0 +1,23 @@
+"""
+Management command to rebuild the per-business rating summaries from the reviews table.
+
+Usage:
+    python manage.py rebuild_rating_summaries
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from offers_app.cache import offer_response_cache
+from reviews_app.models import BusinessRatingSummary
+
+
+class Command(BaseCommand):
+    help = "Recompute review count, rating sum and histogram of every business user."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = BusinessRatingSummary.rebuild_all()
+            # Offer responses embed the creator's rating summary
+            offer_response_cache.bump_on_commit()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rating summaries of {count} business user(s)."))
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:46
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_summaries(apps, schema_editor):
+    Review = apps.get_model('reviews_app', 'Review')
+    BusinessRatingSummary = apps.get_model('reviews_app', 'BusinessRatingSummary')
+    summaries = {}
+    rows = (
+        Review.objects.filter(business_user__isnull=False)
+        .values('business_user_id', 'rating')
+        .annotate(n=Count('id'))
+    )
+    for row in rows:
+        summary = summaries.setdefault(
+            row['business_user_id'],
+            BusinessRatingSummary(business_user_id=row['business_user_id'])
+        )
+        summary.review_count += row['n']
+        summary.rating_sum += row['rating'] * row['n']
+        if 1 <= row['rating'] <= 5:
+            field = f"stars_{row['rating']}"
+            setattr(summary, field, getattr(summary, field) + row['n'])
+    BusinessRatingSummary.objects.bulk_create(summaries.values(), batch_size=500)
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('reviews_app', '0002_review_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessRatingSummary',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('stars_1', models.PositiveIntegerField(default=0)),
+                ('stars_2', models.PositiveIntegerField(default=0)),
+                ('stars_3', models.PositiveIntegerField(default=0)),
+                ('stars_4', models.PositiveIntegerField(default=0)),
+                ('stars_5', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(build_summaries, reverse_code=migrations.RunPython.noop),
+    ]
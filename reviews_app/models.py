@@ -2,11 +2,15 @@
 Module reviews_app.models
 
 Defines the Review model, representing feedback left by a customer (reviewer)
-for a business user, including a unique rating and description.
+for a business user, including a unique rating and description, and the
+BusinessRatingSummary model holding maintained per-business rating aggregates.
 """
 
 from django.db import models
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 class Review(models.Model):
@@ -41,6 +45,15 @@ class Review(models.Model):
         unique_together = ('business_user', 'reviewer')
         # Default ordering: most recently updated first
         ordering = ['-updated_at']
+        indexes = [
+            # Review list keysets (ordering + ID tie-break), unfiltered and
+            # filtered by business_user_id / reviewer_id
+            models.Index(fields=['updated_at', 'id'], name='review_updated_idx'),
+            models.Index(fields=['rating', 'id'], name='review_rating_idx'),
+            models.Index(fields=['business_user', 'updated_at', 'id'], name='review_business_updated_idx'),
+            models.Index(fields=['business_user', 'rating', 'id'], name='review_business_rating_idx'),
+            models.Index(fields=['reviewer', 'updated_at', 'id'], name='review_reviewer_updated_idx'),
+        ]
 
     def __str__(self):
         """
@@ -48,3 +61,137 @@ class Review(models.Model):
         indicating who wrote it and who received it.
         """
         return f"Review by {self.reviewer} for {self.business_user}"
+
+
+class BusinessRatingSummary(models.Model):
+    """
+    Maintained rating aggregates of one business user.
+
+    Kept in sync by the Review signal handlers (reviews_app.signals), so
+    summaries never require loading the business user's reviews.
+
+    Attributes:
+        business_user (User): The reviewed business user.
+        review_count (int): Number of reviews.
+        rating_sum (int): Sum of all ratings.
+        stars_1 … stars_5 (int): Number of reviews per rating.
+        updated_at (datetime): Time of the last change.
+    """
+    STARS = (1, 2, 3, 4, 5)
+
+    business_user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='rating_summary'
+    )
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Rating summary for {self.business_user_id} ({self.review_count} reviews)"
+
+    @classmethod
+    def empty_data(cls):
+        """
+        Summary data of a business user without reviews.
+        """
+        return {
+            'review_count': 0,
+            'average_rating': None,
+            'histogram': {str(star): 0 for star in cls.STARS},
+        }
+
+    def as_data(self):
+        """
+        Return the summary as served by the API.
+
+        Returns:
+            dict: review_count, average_rating (one decimal place, None without
+            reviews) and histogram (rating as string → number of reviews).
+        """
+        return {
+            'review_count': self.review_count,
+            'average_rating': (
+                round(self.rating_sum / self.review_count, 1) if self.review_count else None
+            ),
+            'histogram': {str(star): getattr(self, f'stars_{star}') for star in self.STARS},
+        }
+
+    @classmethod
+    def data_for(cls, user):
+        """
+        Return the summary data of a user, reading the (select_related)
+        reverse relation; empty data if the user has no reviews yet.
+        """
+        try:
+            return user.rating_summary.as_data()
+        except cls.DoesNotExist:
+            return cls.empty_data()
+
+    @classmethod
+    def adjust(cls, business_user_id, rating_deltas, create=True):
+        """
+        Apply review deltas for one business user in a single UPDATE.
+
+        Args:
+            business_user_id (int): The reviewed business user.
+            rating_deltas (dict): Rating → change in number of reviews with that
+                rating, e.g. {4: -1, 5: 1} when a review is changed from 4 to 5.
+            create (bool): Create the summary row if it does not exist yet.
+        """
+        deltas = {rating: delta for rating, delta in rating_deltas.items() if delta}
+        if not deltas:
+            return
+        changes = {
+            'review_count': sum(deltas.values()),
+            'rating_sum': sum(rating * delta for rating, delta in deltas.items()),
+        }
+        for rating, delta in deltas.items():
+            if rating in cls.STARS:
+                changes[f'stars_{rating}'] = changes.get(f'stars_{rating}', 0) + delta
+        updates = {
+            field: Greatest(F(field) + delta, 0)
+            for field, delta in changes.items()
+            if delta
+        }
+        updates['updated_at'] = timezone.now()
+
+        updated = cls.objects.filter(business_user_id=business_user_id).update(**updates)
+        if not updated and create:
+            cls.objects.get_or_create(business_user_id=business_user_id)
+            cls.objects.filter(business_user_id=business_user_id).update(**updates)
+
+    @classmethod
+    def rebuild_all(cls):
+        """
+        Replace every summary with exact values from one grouped query over
+        Review; needed after writes that bypass the signals (bulk inserts).
+
+        Returns:
+            int: Number of business users with reviews.
+        """
+        summaries = {}
+        rows = (
+            Review.objects.filter(business_user__isnull=False)
+            .values('business_user_id', 'rating')
+            .annotate(n=Count('id'))
+        )
+        for row in rows:
+            summary = summaries.setdefault(
+                row['business_user_id'], cls(business_user_id=row['business_user_id'])
+            )
+            summary.review_count += row['n']
+            summary.rating_sum += row['rating'] * row['n']
+            if row['rating'] in cls.STARS:
+                field = f"stars_{row['rating']}"
+                setattr(summary, field, getattr(summary, field) + row['n'])
+        cls.objects.all().delete()
+        cls.objects.bulk_create(summaries.values(), batch_size=500)
+        return len(summaries)
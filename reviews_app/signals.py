@@ -0,0 +1,57 @@
+"""
+Module reviews_app.signals
+
+Keeps BusinessRatingSummary in sync with review creation, rating changes
+and deletion. Handlers run inside the transaction of the triggering write.
+"""
+
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from reviews_app.models import BusinessRatingSummary, Review
+
+
+@receiver(post_init, sender=Review)
+def remember_rated_state(sender, instance, **kwargs):
+    """
+    Remember the loaded business user and rating to detect changes on save.
+    """
+    instance._rated_state = (instance.business_user_id, instance.rating)
+
+
+@receiver(post_save, sender=Review)
+def rate_saved_review(sender, instance, created, **kwargs):
+    """
+    Count a new review, or move an existing one between ratings (or businesses).
+    """
+    new_state = (instance.business_user_id, instance.rating)
+    old_state = None if created else instance._rated_state
+    if old_state == new_state:
+        return
+
+    deltas = Counter()
+    if old_state is not None:
+        deltas[old_state] -= 1
+    deltas[new_state] += 1
+
+    by_business = {}
+    for (business_user_id, rating), delta in deltas.items():
+        if business_user_id is not None:
+            by_business.setdefault(business_user_id, {})[rating] = delta
+    for business_user_id, rating_deltas in by_business.items():
+        BusinessRatingSummary.adjust(business_user_id, rating_deltas)
+
+    instance._rated_state = new_state
+
+
+@receiver(post_delete, sender=Review)
+def unrate_deleted_review(sender, instance, **kwargs):
+    """
+    Remove a deleted review from its business user's summary.
+    """
+    business_user_id, rating = instance._rated_state
+    if business_user_id is not None:
+        # The summary row may already be gone when the business user is deleted
+        BusinessRatingSummary.adjust(business_user_id, {rating: -1}, create=False)
@@ -48,8 +48,8 @@ class ReviewsListTests(APITestCase):
         self.client.force_authenticate(self.reviewer1)
         resp = self.client.get(self.url)
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(resp.data, list)
-        ids = [r['id'] for r in resp.data]
+        self.assertIsInstance(resp.data['results'], list)
+        ids = [r['id'] for r in resp.data['results']]
         self.assertIn(self.review1.id, ids)
         self.assertIn(self.review2.id, ids)
 
@@ -57,19 +57,19 @@ class ReviewsListTests(APITestCase):
         self.client.force_authenticate(self.reviewer1)
         resp = self.client.get(self.url, {'business_user_id': self.business.id})
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
-        for r in resp.data:
+        for r in resp.data['results']:
             self.assertEqual(r['business_user'], self.business.id)
 
     def test_filter_by_reviewer(self):
         self.client.force_authenticate(self.reviewer1)
         resp = self.client.get(self.url, {'reviewer_id': self.reviewer1.id})
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
-        for r in resp.data:
+        for r in resp.data['results']:
             self.assertEqual(r['reviewer'], self.reviewer1.id)
 
     def test_ordering(self):
         self.client.force_authenticate(self.reviewer1)
         resp = self.client.get(self.url, {'ordering': '-rating'})
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
-        ratings = [r['rating'] for r in resp.data]
+        ratings = [r['rating'] for r in resp.data['results']]
         self.assertTrue(ratings[0] >= ratings[1])
@@ -0,0 +1,69 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from offers_app.models import Offer
+from profile_app.models import BusinessProfile, CustomerProfile
+from reviews_app.models import BusinessRatingSummary
+
+User = get_user_model()
+
+
+class BusinessRatingSummaryTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=cls.business, username='biz')
+        cls.customers = []
+        for i in range(3):
+            customer = User.objects.create_user(username=f'cust{i}', password='pw')
+            CustomerProfile.objects.create(user=customer, username=f'cust{i}')
+            cls.customers.append(customer)
+        cls.summary_url = reverse('review-summary', args=[cls.business.id])
+
+    def post_review(self, customer, rating):
+        self.client.force_authenticate(customer)
+        resp = self.client.post(reverse('review-list-create'), {
+            'business_user': self.business.id, 'rating': rating, 'description': 'x'
+        }, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        return resp.data['id']
+
+    def test_summary_follows_create_update_delete(self):
+        first = self.post_review(self.customers[0], 5)
+        self.post_review(self.customers[1], 4)
+        second = self.post_review(self.customers[2], 2)
+
+        # Bewertung ändern und eine löschen
+        self.client.force_authenticate(self.customers[0])
+        self.client.patch(reverse('review-detail', args=[first]), {'rating': 3}, format='json')
+        self.client.force_authenticate(self.customers[2])
+        self.client.delete(reverse('review-detail', args=[second]))
+
+        with self.assertNumQueries(1):
+            resp = self.client.get(self.summary_url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data['review_count'], 2)
+        self.assertEqual(resp.data['average_rating'], 3.5)
+        self.assertEqual(resp.data['histogram'], {'1': 0, '2': 0, '3': 1, '4': 1, '5': 0})
+
+    def test_business_without_reviews_and_unknown_user(self):
+        self.client.force_authenticate(self.customers[0])
+        resp = self.client.get(self.summary_url)
+        self.assertEqual(resp.data, {'business_user_id': self.business.id, **BusinessRatingSummary.empty_data()})
+
+        resp = self.client.get(reverse('review-summary', args=[self.customers[0].id]))
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_summary_in_offer_and_profile_payloads(self):
+        self.post_review(self.customers[0], 4)
+        Offer.objects.create(user=self.business, title='O', description='D')
+
+        resp = self.client.get(reverse('offer-list-create'))
+        self.assertEqual(resp.data['results'][0]['creator_rating']['average_rating'], 4.0)
+
+        resp = self.client.get(reverse('profile-detail', args=[self.business.id]))
+        self.assertEqual(resp.data['rating_summary']['review_count'], 1)
+        resp = self.client.get(reverse('profile-detail', args=[self.customers[0].id]))
+        self.assertIsNone(resp.data['rating_summary'])
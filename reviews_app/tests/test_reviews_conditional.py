@@ -0,0 +1,62 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from reviews_app.models import Review
+
+User = get_user_model()
+
+
+class ReviewsConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = User.objects.create_user(username='biz', password='pw')
+        cls.customer = User.objects.create_user(username='cust', password='pw')
+        cls.other = User.objects.create_user(username='other', password='pw')
+        cls.review = Review.objects.create(business_user=cls.business, reviewer=cls.customer, rating=4, description='Gut')
+        cls.url = reverse('review-list-create')
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def test_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_depends_on_filters(self):
+        etag = self.client.get(self.url)['ETag']
+        resp = self.client.get(self.url, {'business_user_id': self.business.id}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_etag_changes_on_create_update_delete(self):
+        etag = self.client.get(self.url)['ETag']
+        new = Review.objects.create(business_user=self.business, reviewer=self.other, rating=2, description='Naja')
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        etag = resp['ETag']
+        new.delete()
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_edit_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.review.description = 'Sehr gut'
+        self.review.save()
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_etag_query_is_bounded_by_page(self):
+        # 304 ohne Aggregat über alle Bewertungen: nur die Keyset-Abfrage der Seite
+        etag = self.client.get(self.url)['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]['sql']
+        self.assertIn('LIMIT 21', sql)
+        self.assertNotIn('COUNT(', sql.upper())
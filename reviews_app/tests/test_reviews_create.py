@@ -2,8 +2,10 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from reviews_app.models import Review
+from reviews_app.models import BusinessRatingSummary, Review
 from profile_app.models import BusinessProfile, CustomerProfile
 
 User = get_user_model()
@@ -73,3 +75,35 @@ class ReviewsCreateTests(APITestCase):
         # fehlendes Feld business_user
         resp = self.client.post(self.url, {'rating': 3}, format='json')
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_review_non_business_target(self):
+        self.client.force_authenticate(self.customer)
+        resp = self.client.post(self.url, {
+            'business_user': self.other.id, 'rating': 4, 'description': 'X'
+        }, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('business_user', resp.data)
+
+    def test_create_review_duplicate_caught_by_constraint(self):
+        # Review existiert bereits (z.B. paralleler Request); kein Vorab-Check, der Constraint greift
+        Review.objects.create(business_user=self.business, reviewer=self.customer, rating=2, description='Alt')
+        self.client.force_authenticate(self.customer)
+        resp = self.client.post(self.url, {
+            'business_user': self.business.id, 'rating': 5, 'description': 'Neu'
+        }, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(resp.data['detail'], "You have already reviewed this business.")
+        self.assertEqual(Review.objects.get(reviewer=self.customer).rating, 2)
+        self.assertEqual(BusinessRatingSummary.objects.get(pk=self.business.pk).review_count, 1)
+
+    def test_create_review_precondition_queries(self):
+        self.client.force_authenticate(self.customer)
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(self.url, {
+                'business_user': self.business.id, 'rating': 4, 'description': 'Gut'
+            }, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        # Vor dem INSERT nur Kunden-Check und Business-User-Lookup (inkl. BusinessProfile)
+        sql = [q['sql'] for q in ctx.captured_queries]
+        first_write = next(i for i, q in enumerate(sql) if q.startswith('SAVEPOINT'))
+        self.assertEqual(first_write, 2)
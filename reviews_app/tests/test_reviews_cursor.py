@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from profile_app.models import BusinessProfile, CustomerProfile
+from reviews_app.models import Review
+
+User = get_user_model()
+
+
+class ReviewListCursorTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = User.objects.create_user(username='biz', password='pw')
+        BusinessProfile.objects.create(user=cls.business, username='biz')
+        cls.other = User.objects.create_user(username='other', password='pw')
+        BusinessProfile.objects.create(user=cls.other, username='other')
+
+        # Fünf Reviews für biz mit doppelten Ratings, eine für other
+        now = timezone.now()
+        specs = [(cls.business, 4, 5), (cls.business, 2, 4), (cls.business, 4, 3),
+                 (cls.business, 5, 2), (cls.business, 2, 1), (cls.other, 1, 0)]
+        cls.reviews = []
+        for i, (business, rating, days_ago) in enumerate(specs):
+            reviewer = User.objects.create_user(username=f'rev{i}', password='pw')
+            CustomerProfile.objects.create(user=reviewer, username=f'rev{i}')
+            review = Review.objects.create(
+                business_user=business, reviewer=reviewer, rating=rating, description='D'
+            )
+            # updated_at ist auto_now, daher nachträglich setzen
+            Review.objects.filter(pk=review.pk).update(updated_at=now - timedelta(days=days_ago))
+            cls.reviews.append(review)
+        cls.url = reverse('review-list-create')
+
+    def setUp(self):
+        self.client.force_authenticate(self.business)
+
+    def ids(self, resp):
+        return [item['id'] for item in resp.data['results']]
+
+    def walk(self, params):
+        seen = []
+        resp = self.client.get(self.url, {'page_size': 2, **params})
+        while True:
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', resp.data)
+            seen += self.ids(resp)
+            if not resp.data['next']:
+                return seen, resp
+            resp = self.client.get(resp.data['next'])
+
+    def test_default_ordering_newest_first(self):
+        seen, last = self.walk({'business_user_id': self.business.id})
+        expected = [self.reviews[i].id for i in (4, 3, 2, 1, 0)]
+        self.assertEqual(seen, expected)
+
+        # Rückwärts über den previous-Link
+        resp = self.client.get(last.data['previous'])
+        self.assertEqual(self.ids(resp), expected[2:4])
+
+    def test_rating_ordering_breaks_ties_by_id(self):
+        seen, _ = self.walk({'business_user_id': self.business.id, 'ordering': 'rating'})
+        self.assertEqual(seen, [self.reviews[i].id for i in (1, 4, 0, 2, 3)])
+
+        seen, _ = self.walk({'business_user_id': self.business.id, 'ordering': '-rating'})
+        self.assertEqual(seen, [self.reviews[i].id for i in (3, 2, 0, 4, 1)])
+
+    def test_unknown_ordering_falls_back_to_default(self):
+        resp = self.client.get(self.url, {'ordering': 'description', 'business_user_id': self.business.id})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.ids(resp)[:2], [self.reviews[4].id, self.reviews[3].id])